@@ -0,0 +1,90 @@
+"""
+Benchmark searching synthetic subject trees for volume files
+
+$ pip3 install --user pytest-benchmark
+$ FREESURFER_VOLUME_READER_BENCHMARK_SUBJECTS=100000 \
+    pytest benchmarks/find_benchmark.py
+"""
+
+import pytest
+
+from freesurfer_volume_reader import (
+    ashs,
+    find_volume_file_records,
+    find_volume_files,
+    freesurfer,
+)
+
+# pylint: disable=wrong-import-order; false positive
+from subjects_generator import BENCHMARK_SUBJECTS_NUMBER, cached_subjects_dir
+
+
+@pytest.mark.benchmark(group="find")
+@pytest.mark.parametrize("jobs", [1, 8])
+@pytest.mark.parametrize(
+    ("max_depth", "subjects_dir_layout"),
+    # subjects_dir_layout only finds subject directories in the root directory
+    [(0, False), (0, True), (3, False)],
+)
+def test_freesurfer_find(
+    benchmark, tmp_path_factory, max_depth, jobs, subjects_dir_layout
+):
+    subjects_dir_path = cached_subjects_dir(
+        str(tmp_path_factory.getbasetemp()), max_depth=max_depth
+    )
+    volume_files = benchmark(
+        lambda: list(
+            freesurfer.HippocampalSubfieldsVolumeFile.find(
+                subjects_dir_path, jobs=jobs, subjects_dir_layout=subjects_dir_layout
+            )
+        )
+    )
+    assert len(volume_files) >= BENCHMARK_SUBJECTS_NUMBER * 2
+
+
+@pytest.mark.benchmark(group="find")
+@pytest.mark.parametrize("max_depth", [0, 3])
+@pytest.mark.parametrize("jobs", [1, 8])
+def test_ashs_find(benchmark, tmp_path_factory, max_depth, jobs):
+    subjects_dir_path = cached_subjects_dir(
+        str(tmp_path_factory.getbasetemp()), max_depth=max_depth
+    )
+    volume_files = benchmark(
+        lambda: list(
+            ashs.HippocampalSubfieldsVolumeFile.find(subjects_dir_path, jobs=jobs)
+        )
+    )
+    assert len(volume_files) == BENCHMARK_SUBJECTS_NUMBER * 6
+
+
+@pytest.mark.benchmark(group="find")
+@pytest.mark.parametrize("records", [False, True])
+def test_find_all_source_types(benchmark, tmp_path_factory, records):
+    subjects_dir_path = cached_subjects_dir(str(tmp_path_factory.getbasetemp()))
+    volume_files = benchmark(
+        lambda: list(
+            (find_volume_file_records if records else find_volume_files)(
+                subjects_dir_path,
+                volume_file_classes=[
+                    ashs.HippocampalSubfieldsVolumeFile,
+                    ashs.IntracranialVolumeFile,
+                    freesurfer.HippocampalSubfieldsVolumeFile,
+                ],
+            )
+        )
+    )
+    assert len(volume_files) >= BENCHMARK_SUBJECTS_NUMBER * 9
+
+
+@pytest.mark.benchmark(group="find_subject")
+@pytest.mark.parametrize(
+    "volume_file_class",
+    [ashs.HippocampalSubfieldsVolumeFile, freesurfer.HippocampalSubfieldsVolumeFile],
+    ids=["ashs", "freesurfer"],
+)
+def test_find_subject(benchmark, tmp_path_factory, volume_file_class):
+    subjects_dir_path = cached_subjects_dir(str(tmp_path_factory.getbasetemp()))
+    volume_files = benchmark(
+        lambda: list(volume_file_class.find_subject(subjects_dir_path, "subject000042"))
+    )
+    assert len(volume_files) >= 2
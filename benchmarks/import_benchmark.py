@@ -0,0 +1,40 @@
+"""
+Benchmark the startup time of the console entry point
+
+$ pip3 install --user pytest-benchmark
+$ pytest benchmarks/import_benchmark.py
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize(
+    "module_names",
+    [
+        ["freesurfer_volume_reader.ashs", "freesurfer_volume_reader.freesurfer"],
+        ["freesurfer_volume_reader.__main__"],
+        # reference: modules imported lazily by freesurfer_volume_reader
+        ["pandas"],
+    ],
+    ids=",".join,
+)
+def test_import(benchmark, module_names):
+    benchmark(
+        subprocess.run,
+        [sys.executable, "-c", "import " + ", ".join(module_names)],
+        check=True,
+    )
+
+
+@pytest.mark.benchmark(group="import")
+def test_version(benchmark):
+    benchmark(
+        subprocess.run,
+        [sys.executable, "-m", "freesurfer_volume_reader", "--version"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
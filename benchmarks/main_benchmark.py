@@ -0,0 +1,43 @@
+"""
+Benchmark the console entry point end to end
+
+$ pip3 install --user pytest-benchmark
+$ pytest benchmarks/main_benchmark.py
+"""
+
+import io
+import os
+import unittest.mock
+
+import pytest
+
+from freesurfer_volume_reader.__main__ import main
+
+# pylint: disable=wrong-import-order; false positive
+from subjects_generator import BENCHMARK_SUBJECTS_NUMBER, cached_subjects_dir
+
+
+def _run_main(argv) -> str:
+    with unittest.mock.patch(
+        "sys.argv", ["freesurfer-volume-reader"] + argv
+    ), unittest.mock.patch("sys.stdout", new_callable=io.StringIO) as stdout_mock:
+        assert main() == os.EX_OK
+        return stdout_mock.getvalue()
+
+
+@pytest.mark.benchmark(group="main")
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--jobs", "8"],
+        ["--subjects-dir-layout"],
+        ["--source-types", "ashs", "freesurfer-hipposf"],
+        ["--source-types", "ashs", "freesurfer-hipposf", "--jobs", "8"],
+    ],
+    ids=" ".join,
+)
+def test_main(benchmark, tmp_path_factory, argv):
+    subjects_dir_path = cached_subjects_dir(str(tmp_path_factory.getbasetemp()))
+    output = benchmark(_run_main, argv + ["--", subjects_dir_path])
+    assert output.count("\n") > BENCHMARK_SUBJECTS_NUMBER
@@ -0,0 +1,56 @@
+"""
+Benchmark reading a file of concatenated ashs volume files
+
+$ pip3 install --user pytest-benchmark
+$ pytest benchmarks/read_aggregated_volumes_benchmark.py
+"""
+
+import os
+
+import pandas
+import pytest
+
+from freesurfer_volume_reader import ashs
+
+# pylint: disable=wrong-import-order; false positive
+from subjects_generator import cached_subjects_dir
+
+
+@pytest.fixture(scope="module", name="aggregated_volumes_path")
+def _aggregated_volumes_path_fixture(tmp_path_factory) -> str:
+    subjects_dir_path = cached_subjects_dir(str(tmp_path_factory.getbasetemp()))
+    path = os.path.join(str(tmp_path_factory.mktemp("aggregated")), "all_volumes.txt")
+    with open(path, "w", encoding="ascii") as aggregated_file:
+        for volume_file in ashs.HippocampalSubfieldsVolumeFile.find(subjects_dir_path):
+            with open(
+                volume_file.absolute_path, encoding="ascii"
+            ) as volume_file_stream:
+                aggregated_file.write(volume_file_stream.read())
+    return path
+
+
+@pytest.mark.benchmark(group="read_aggregated_volumes")
+@pytest.mark.parametrize("chunk_rows", [2**12, 2**20])
+def test_read_aggregated_volumes_dataframe(
+    benchmark, aggregated_volumes_path, chunk_rows
+):
+    volumes_frame = benchmark(
+        ashs.read_aggregated_volumes_dataframe,
+        aggregated_volumes_path,
+        chunk_rows=chunk_rows,
+    )
+    assert not volumes_frame.empty
+
+
+@pytest.mark.benchmark(group="read_aggregated_volumes")
+def test_read_csv(benchmark, aggregated_volumes_path):
+    # reference: without chunks & validation
+    volumes_frame = benchmark(
+        pandas.read_csv,
+        aggregated_volumes_path,
+        sep=" ",
+        header=None,
+        names=["subject", "hemisphere", "subfield", "slices_number", "volume_mm^3"],
+        dtype={"subject": "category", "hemisphere": "category", "subfield": "category"},
+    )
+    assert not volumes_frame.empty
@@ -0,0 +1,143 @@
+"""
+Benchmark reading many volume files into a single dataframe
+
+$ pip3 install --user pytest-benchmark
+$ pytest benchmarks/read_volumes_dataframe_benchmark.py
+"""
+
+import typing
+
+import pandas
+import pytest
+
+import freesurfer_volume_reader
+from freesurfer_volume_reader import SubfieldVolumeFile, ashs, freesurfer
+
+# pylint: disable=wrong-import-order; false positive
+from subjects_generator import BENCHMARK_SUBJECTS_NUMBER, cached_subjects_dir
+
+
+@pytest.fixture(scope="module", name="subjects_dir_path")
+def _subjects_dir_path_fixture(tmp_path_factory) -> str:
+    return cached_subjects_dir(str(tmp_path_factory.getbasetemp()))
+
+
+def _find(
+    volume_file_class: typing.Type[SubfieldVolumeFile], subjects_dir_path: str
+) -> typing.List[SubfieldVolumeFile]:
+    volume_files = []
+    for volume_file in volume_file_class.find(subjects_dir_path):
+        assert isinstance(volume_file, SubfieldVolumeFile)
+        volume_files.append(volume_file)
+    assert len(volume_files) >= BENCHMARK_SUBJECTS_NUMBER
+    return volume_files
+
+
+_VOLUME_FILE_CLASSES = pytest.mark.parametrize(
+    "volume_file_class",
+    [ashs.HippocampalSubfieldsVolumeFile, freesurfer.HippocampalSubfieldsVolumeFile],
+    ids=["ashs", "freesurfer"],
+)
+
+
+@pytest.mark.benchmark(group="read_volumes_dataframe")
+@_VOLUME_FILE_CLASSES
+def test_concat_read_volumes_dataframe(benchmark, subjects_dir_path, volume_file_class):
+    volume_files = _find(volume_file_class, subjects_dir_path)
+    volume_frame = benchmark(
+        lambda: pandas.concat(
+            [f.read_volumes_dataframe() for f in volume_files], ignore_index=True
+        )
+    )
+    assert len(volume_frame) > BENCHMARK_SUBJECTS_NUMBER
+
+
+@pytest.mark.benchmark(group="read_volumes_dataframe")
+@_VOLUME_FILE_CLASSES
+def test_read_volumes_dataframe_batch(benchmark, subjects_dir_path, volume_file_class):
+    volume_files = _find(volume_file_class, subjects_dir_path)
+    volume_frame = benchmark(
+        volume_file_class.read_volumes_dataframe_batch, volume_files
+    )
+    assert len(volume_frame) > BENCHMARK_SUBJECTS_NUMBER
+
+
+@pytest.mark.benchmark(group="read_volumes_dataframes")
+@pytest.mark.parametrize("jobs", [1, 8])
+def test_read_volumes_dataframes(benchmark, subjects_dir_path, jobs):
+    volume_files = _find(freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path)
+    volume_frames = benchmark(
+        lambda: list(
+            freesurfer_volume_reader.read_volumes_dataframes(volume_files, jobs=jobs)
+        )
+    )
+    assert len(volume_frames) == len(volume_files)
+
+
+def _pivot_read_volumes_dataframe_batch(
+    volume_file_class: typing.Type[SubfieldVolumeFile],
+    volume_files: typing.List[SubfieldVolumeFile],
+) -> pandas.DataFrame:
+    long_frame = volume_file_class.read_volumes_dataframe_batch(volume_files)
+    # pivot_table() drops rows with null keys
+    long_frame = long_frame.fillna("")
+    return long_frame.pivot_table(
+        index=[
+            c
+            for c in volume_file_class.VOLUMES_DATAFRAME_COLUMNS
+            if c not in {"subfield", "volume_mm^3"}
+        ],
+        columns="subfield",
+        values="volume_mm^3",
+    ).reset_index()
+
+
+@pytest.mark.benchmark(group="read_volumes_wide_dataframe")
+@_VOLUME_FILE_CLASSES
+def test_pivot_read_volumes_dataframe_batch(
+    benchmark, subjects_dir_path, volume_file_class
+):
+    volume_files = _find(volume_file_class, subjects_dir_path)
+    wide_frame = benchmark(
+        _pivot_read_volumes_dataframe_batch, volume_file_class, volume_files
+    )
+    assert len(wide_frame) >= BENCHMARK_SUBJECTS_NUMBER
+
+
+@pytest.mark.benchmark(group="read_volumes_wide_dataframe")
+@_VOLUME_FILE_CLASSES
+def test_read_volumes_wide_dataframe(benchmark, subjects_dir_path, volume_file_class):
+    volume_files = _find(volume_file_class, subjects_dir_path)
+    wide_frame = benchmark(
+        freesurfer_volume_reader.read_volumes_wide_dataframe, volume_files
+    )
+    assert len(wide_frame) == len(volume_files)
+
+
+@pytest.fixture(scope="module", name="intracranial_volume_files")
+def _intracranial_volume_files_fixture(
+    subjects_dir_path,
+) -> typing.List[ashs.IntracranialVolumeFile]:
+    volume_files = []
+    for volume_file in ashs.IntracranialVolumeFile.find(subjects_dir_path):
+        assert isinstance(volume_file, ashs.IntracranialVolumeFile)
+        volume_files.append(volume_file)
+    assert len(volume_files) >= BENCHMARK_SUBJECTS_NUMBER
+    return volume_files
+
+
+@pytest.mark.benchmark(group="read_volume_series_batch")
+def test_concat_read_volume_series(benchmark, intracranial_volume_files):
+    volume_series = benchmark(
+        lambda: pandas.concat(f.read_volume_series() for f in intracranial_volume_files)
+    )
+    assert len(volume_series) == len(intracranial_volume_files)
+
+
+@pytest.mark.benchmark(group="read_volume_series_batch")
+def test_read_volume_series_batch(benchmark, intracranial_volume_files):
+    volume_series = benchmark(
+        ashs.IntracranialVolumeFile.read_volume_series_batch,
+        intracranial_volume_files,
+    )
+    assert len(volume_series) == len(intracranial_volume_files)
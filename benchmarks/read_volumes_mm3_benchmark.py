@@ -0,0 +1,62 @@
+"""
+Benchmark parsing volume files
+
+$ pip3 install --user pytest-benchmark
+$ pytest benchmarks/read_volumes_mm3_benchmark.py
+"""
+
+import typing
+
+import pytest
+
+from freesurfer_volume_reader import SubfieldVolumeFile, ashs, freesurfer
+
+# pylint: disable=wrong-import-order; false positive
+from subjects_generator import BENCHMARK_SUBJECTS_NUMBER, cached_subjects_dir
+
+
+@pytest.fixture(scope="module", name="volume_files")
+def _volume_files_fixture(tmp_path_factory, request) -> typing.List[SubfieldVolumeFile]:
+    subjects_dir_path = cached_subjects_dir(str(tmp_path_factory.getbasetemp()))
+    volume_files = list(request.param.find(subjects_dir_path))
+    assert len(volume_files) >= BENCHMARK_SUBJECTS_NUMBER
+    return volume_files
+
+
+_VOLUME_FILE_CLASSES = pytest.mark.parametrize(
+    "volume_files",
+    [ashs.HippocampalSubfieldsVolumeFile, freesurfer.HippocampalSubfieldsVolumeFile],
+    ids=["ashs", "freesurfer"],
+    indirect=True,
+)
+
+
+@pytest.mark.benchmark(group="read_volumes_mm3")
+@_VOLUME_FILE_CLASSES
+def test_read_volumes_mm3(benchmark, volume_files):
+    subfield_volumes = benchmark(lambda: [f.read_volumes_mm3() for f in volume_files])
+    assert all(subfield_volumes)
+
+
+@pytest.mark.benchmark(group="read_volumes_mm3")
+@_VOLUME_FILE_CLASSES
+def test_memoized_read_volumes_mm3(benchmark, volume_files):
+    SubfieldVolumeFile.enable_cache(max_entries=len(volume_files))
+    try:
+        for volume_file in volume_files:
+            volume_file.read_volumes_mm3()
+        subfield_volumes = benchmark(
+            lambda: [f.read_volumes_mm3() for f in volume_files]
+        )
+    finally:
+        SubfieldVolumeFile.disable_cache()
+    assert all(subfield_volumes)
+
+
+@pytest.mark.benchmark(group="read_volumes_dataframe")
+@_VOLUME_FILE_CLASSES
+def test_read_volumes_dataframe(benchmark, volume_files):
+    volume_frames = benchmark(
+        lambda: [f.read_volumes_dataframe() for f in volume_files]
+    )
+    assert all(not f.empty for f in volume_frames)
@@ -0,0 +1,194 @@
+"""
+Generate synthetic FreeSurfer & ASHS subject trees for benchmarks
+
+Besides the volume files, each subject directory contains decoy files
+and directories resembling the output of the respective software.
+
+$ python3 benchmarks/subjects_generator.py --subjects 100000 /tmp/subjects
+"""
+
+import argparse
+import os
+import random
+import typing
+
+FREESURFER_SUBFIELDS = [
+    "Hippocampal_tail",
+    "subiculum",
+    "CA1",
+    "hippocampal-fissure",
+    "presubiculum",
+    "parasubiculum",
+    "molecular_layer_HP",
+    "GC-ML-DG",
+    "CA3",
+    "CA4",
+    "fimbria",
+    "HATA",
+    "Whole_hippocampus",
+]
+
+ASHS_SUBFIELDS = ["CA1", "CA2+3", "DG", "ERC", "PHC", "PRC", "SUB"]
+
+_FREESURFER_DECOY_PATHS = [
+    os.path.join("label", "lh.cortex.label"),
+    os.path.join("mri", "aseg.mgz"),
+    os.path.join("mri", "lh.hippoSfLabels-T1.v10.mgz"),
+    os.path.join("mri", "lh.hippoSfVolumes-T1.v9.txt"),
+    os.path.join("mri", "orig", "001.mgz"),
+    os.path.join("scripts", "recon-all.log"),
+    os.path.join("stats", "aseg.stats"),
+    os.path.join("surf", "lh.white"),
+    os.path.join("surf", "rh.white"),
+    os.path.join("tmp", "hippoSF_T1_v10_left", "log.txt"),
+    os.path.join("touch", "recon-all.done"),
+]
+
+_ASHS_DECOY_PATHS = [
+    os.path.join("affine_t1_to_template", "t1_to_template_affine.mat"),
+    os.path.join("dump", "ashs_stage.log"),
+    os.path.join("final", "{subject}_left_lfseg_corr_nogray.nii.gz"),
+    os.path.join("final", "{subject}_right_lfseg_heur.nii.gz"),
+    os.path.join("multiatlas", "fusion", "lfseg_heur_left.nii.gz"),
+    "tse.nii.gz",
+]
+
+
+def _write_file(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="ascii") as file:
+        file.write(content)
+
+
+def _generate_freesurfer_subject(
+    subject_dir_path: str, rand: random.Random, t2_analysis: bool
+) -> None:
+    for hemisphere_prefix in ["l", "r"]:
+        for analysis_suffix in ["-T1", "-T1-T2"] if t2_analysis else ["-T1"]:
+            _write_file(
+                os.path.join(
+                    subject_dir_path,
+                    "mri",
+                    f"{hemisphere_prefix}h.hippoSfVolumes{analysis_suffix}.v10.txt",
+                ),
+                "".join(
+                    f"{s} {rand.uniform(20, 4000):.6f}\n" for s in FREESURFER_SUBFIELDS
+                ),
+            )
+    for decoy_path in _FREESURFER_DECOY_PATHS:
+        _write_file(os.path.join(subject_dir_path, decoy_path), "")
+
+
+def _generate_ashs_subject(
+    subject_dir_path: str, subject: str, rand: random.Random
+) -> None:
+    for hemisphere in ["left", "right"]:
+        for correction in ["heur", "corr_nogray", "corr_usegray"]:
+            _write_file(
+                os.path.join(
+                    subject_dir_path,
+                    "final",
+                    f"{subject}_{hemisphere}_{correction}_volumes.txt",
+                ),
+                "".join(
+                    f"{subject} {hemisphere} {s} {rand.randint(1, 40)}"
+                    f" {rand.uniform(20, 4000):.6f}\n"
+                    for s in ASHS_SUBFIELDS
+                ),
+            )
+    _write_file(
+        os.path.join(subject_dir_path, "final", f"{subject}_icv.txt"),
+        f"{subject} {rand.uniform(1e6, 2e6):.6g}\n",
+    )
+    for decoy_path in _ASHS_DECOY_PATHS:
+        _write_file(
+            os.path.join(subject_dir_path, decoy_path.format(subject=subject)), ""
+        )
+
+
+def generate_subjects_dir(
+    root_dir_path: str,
+    subjects_number: int,
+    source_types: typing.Iterable[str] = ("freesurfer-hipposf", "ashs"),
+    max_depth: int = 0,
+    seed: int = 0,
+) -> typing.List[str]:
+    """
+    Creates `subjects_number` subject directories in `root_dir_path`.
+
+    `max_depth > 0` places each subject directory in a randomly chosen
+    number (up to `max_depth`) of nested "cohort" directories.
+
+    Returns the subjects' names.
+    """
+    rand = random.Random(seed)
+    source_types = set(source_types)
+    subjects = []
+    for subject_index in range(subjects_number):
+        subject = f"subject{subject_index:06d}"
+        subject_dir_path = os.path.join(
+            root_dir_path,
+            *(f"cohort{rand.randrange(4)}" for _ in range(rand.randint(0, max_depth))),
+            subject,
+        )
+        if "freesurfer-hipposf" in source_types:
+            _generate_freesurfer_subject(
+                subject_dir_path, rand=rand, t2_analysis=subject_index % 4 == 0
+            )
+        if "ashs" in source_types:
+            _generate_ashs_subject(subject_dir_path, subject=subject, rand=rand)
+        subjects.append(subject)
+    return subjects
+
+
+BENCHMARK_SUBJECTS_NUMBER = int(
+    os.environ.get("FREESURFER_VOLUME_READER_BENCHMARK_SUBJECTS", "1000")
+)
+
+
+def cached_subjects_dir(
+    base_dir_path: str, subjects_number: int = BENCHMARK_SUBJECTS_NUMBER, **kwargs
+) -> str:
+    """
+    Generates a subjects directory in `base_dir_path`, unless a directory
+    generated with the same arguments already exists.
+    """
+    subjects_dir_path = os.path.join(
+        base_dir_path,
+        "-".join(
+            ["subjects", str(subjects_number)]
+            + [f"{k}={v}" for k, v in sorted(kwargs.items())]
+        ),
+    )
+    if not os.path.isdir(subjects_dir_path):
+        generate_subjects_dir(
+            subjects_dir_path + ".tmp", subjects_number=subjects_number, **kwargs
+        )
+        os.rename(subjects_dir_path + ".tmp", subjects_dir_path)
+    return subjects_dir_path
+
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--subjects", type=int, default=1000)
+    argparser.add_argument(
+        "--source-types",
+        nargs="+",
+        choices=["freesurfer-hipposf", "ashs"],
+        default=["freesurfer-hipposf", "ashs"],
+    )
+    argparser.add_argument("--max-depth", type=int, default=0)
+    argparser.add_argument("--seed", type=int, default=0)
+    argparser.add_argument("root_dir_path")
+    args = argparser.parse_args()
+    generate_subjects_dir(
+        args.root_dir_path,
+        subjects_number=args.subjects,
+        source_types=args.source_types,
+        max_depth=args.max_depth,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
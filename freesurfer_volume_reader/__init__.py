@@ -13,16 +13,36 @@ https://surfer.nmr.mgh.harvard.edu/fswiki/HippocampalSubfields
 >>>     print(volume_file.subject, volume_file.hemisphere)
 >>>     print(volume_file.read_volumes_mm3())
 >>>     print(volume_file.read_volumes_dataframe())
+
+Coroutines `afind()` & `aread_volumes_mm3()` do not block the event loop:
+
+>>> async for volume_file in freesurfer.HippocampalSubfieldsVolumeFile.afind(
+>>>         '/my/freesurfer/subjects'):
+>>>     print(await volume_file.aread_volumes_mm3())
 """
 
 import abc
+import collections
+import concurrent.futures
+import itertools
+import math
+import operator
 import os
 import pathlib
 import re
+import threading
+import time
 import typing
 import warnings
+import zlib
+
+from freesurfer_volume_reader import stats
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    # pandas is only imported when building dataframes (slow to import)
+    import pandas
 
-import pandas
+    import freesurfer_volume_reader.index
 
 try:
     from freesurfer_volume_reader.version import __version__
@@ -43,42 +63,844 @@ def remove_group_names_from_regex(regex_pattern: str) -> str:
     return re.sub(r"\?P<.+?>", "", regex_pattern)
 
 
+def _scan_dir(
+    dir_path: str,
+) -> typing.Optional[
+    typing.Tuple[typing.List[str], typing.List[str], typing.List[str]]
+]:
+    dirnames, filenames, subdir_paths = [], [], []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:  # pragma: no cover
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                    continue
+                dirnames.append(entry.name)
+                # os.walk(followlinks=False) does not descend into symlinked dirs
+                if not entry.is_symlink():
+                    subdir_paths.append(entry.path)
+    except OSError:  # ignored by os.walk() as well
+        return None
+    return dirnames, filenames, subdir_paths
+
+
+_ScanDirFunction = typing.Callable[
+    [str],
+    typing.Optional[typing.Tuple[typing.List[str], typing.List[str], typing.List[str]]],
+]
+
+
+def _walk(
+    root_dir_path: str,
+    jobs: int = 1,
+    scan_dir: typing.Optional[_ScanDirFunction] = None,
+) -> typing.Iterator[typing.Tuple[str, typing.List[str], typing.List[str]]]:
+    """
+    Like `os.walk()`, but lists up to `jobs` directories concurrently
+    to hide the latency of network filesystems.
+
+    Directories are yielded in the same (top-down) order as by `os.walk()`.
+    Only the `2 * jobs` directories on top of the stack of directories
+    to be yielded are listed ahead, so the first directories are yielded early
+    and at most `2 * jobs` listings per level of depth are held in memory.
+    """
+    if jobs < 1:
+        raise ValueError(f"expected positive number of jobs, got {jobs}")
+    if jobs == 1 and scan_dir is None:
+        yield from os.walk(root_dir_path)
+        return
+    if scan_dir is None:
+        scan_dir = _scan_dir
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        # stack of directories to be yielded with scans submitted so far
+        pending: typing.List[
+            typing.Tuple[str, typing.Optional[concurrent.futures.Future]]
+        ] = [(root_dir_path, None)]
+        try:
+            while pending:
+                # only scan the directories on top of the stack ahead
+                # (in contrast to submitting all subdirectories at once,
+                # which makes the executor's queue scan breadth-first)
+                for stack_index in range(max(len(pending) - 2 * jobs, 0), len(pending)):
+                    dir_path, scan_future = pending[stack_index]
+                    if scan_future is None:
+                        pending[stack_index] = (
+                            dir_path,
+                            executor.submit(scan_dir, dir_path),
+                        )
+                dir_path, scan_future = pending.pop()
+                assert scan_future is not None  # submitted above
+                scan = scan_future.result()
+                if scan is None:
+                    continue
+                dirnames, filenames, subdir_paths = scan
+                pending.extend((p, None) for p in reversed(subdir_paths))
+                yield dir_path, dirnames, filenames
+        finally:
+            for _, scan_future in pending:
+                if scan_future is not None:
+                    scan_future.cancel()
+
+
+def subject_shard(subject: str, shards_number: int) -> int:
+    """
+    Shard of a subject (directory name) in `range(shards_number)`,
+    stable across processes & machines.
+    """
+    return zlib.crc32(os.fsencode(subject)) % shards_number
+
+
+def _shard_scan_dir(
+    scan_dir: _ScanDirFunction, root_dir_path: str, shard: typing.Tuple[int, int]
+) -> _ScanDirFunction:
+    """
+    Restricts the listing of `root_dir_path` to subject directories in `shard`
+    (files directly in `root_dir_path` belong to shard 0).
+    """
+    shard_index, shards_number = shard
+    if not 0 <= shard_index < shards_number:
+        raise ValueError(
+            f"expected shard (index, number) with 0 <= index < number, got {shard}"
+        )
+
+    def _scan_shard_dir(
+        dir_path: str,
+    ) -> typing.Optional[
+        typing.Tuple[typing.List[str], typing.List[str], typing.List[str]]
+    ]:
+        scan = scan_dir(dir_path)
+        if scan is None or dir_path != root_dir_path:
+            return scan
+        dirnames, filenames, subdir_paths = scan
+        return (
+            [n for n in dirnames if subject_shard(n, shards_number) == shard_index],
+            filenames if shard_index == 0 else [],
+            [
+                p
+                for p in subdir_paths
+                if subject_shard(os.path.basename(p), shards_number) == shard_index
+            ],
+        )
+
+    return _scan_shard_dir
+
+
+def _walk_subject_subdirs(
+    root_dir_path: str,
+    subdir_name: str,
+    jobs: int = 1,
+    scan_dir: typing.Optional[_ScanDirFunction] = None,
+) -> typing.Iterator[typing.Tuple[str, typing.List[str], typing.List[str]]]:
+    """
+    Only list `root_dir_path/*/subdir_name/` (without recursion).
+
+    Falls back to `_walk()` in case no such directory exists.
+    """
+    root_scan = (scan_dir or _scan_dir)(root_dir_path)
+    if root_scan is None:
+        return
+    found_subdir = False
+    subdir_paths = [os.path.join(p, subdir_name) for p in root_scan[2]]
+    for subdir_path, subdir_scan in zip(
+        subdir_paths,
+        _map_concurrently(scan_dir or _scan_dir, subdir_paths, jobs=jobs),
+    ):
+        if subdir_scan is not None:
+            found_subdir = True
+            yield subdir_path, subdir_scan[0], subdir_scan[1]
+    if not found_subdir:
+        yield from _walk(root_dir_path, jobs=jobs, scan_dir=scan_dir)
+
+
 class VolumeFile(metaclass=abc.ABCMeta):
 
+    # no per-instance __dict__, as searches may yield 100k+ instances
+    __slots__ = ("_absolute_path", "subject")
+
+    # set by subclasses
+    subject: str
+
     FILENAME_REGEX: typing.Pattern[str] = NotImplemented
 
+    # suffix of all filenames matching `FILENAME_REGEX`
+    # (cheap check before matching the regex)
+    FILENAME_SUFFIX = ""
+
+    # name of directory in each subject's directory containing the volume files
+    # (if fixed by the software's layout)
+    SUBJECT_SUBDIR_NAME: typing.Optional[str] = None
+
     @abc.abstractmethod
-    def __init__(self, path: str) -> None:
-        self._absolute_path = pathlib.Path(path).absolute()
+    def __init__(
+        self,
+        path: str,
+        filename_match: typing.Optional[typing.Match[str]] = None,
+    ) -> None:
+        """
+        `filename_match` of `FILENAME_REGEX` on the filename of `path`
+        (if available) saves subclasses from matching again.
+        """
+        # pylint: disable=unused-argument; used by subclasses
+        self._absolute_path = os.path.abspath(path)
+
+    def _match_filename(
+        self, filename_match: typing.Optional[typing.Match[str]] = None
+    ) -> typing.Match[str]:
+        if filename_match is None:
+            # pylint: disable=no-member; NotImplemented in abstract class
+            filename_match = self.FILENAME_REGEX.match(
+                os.path.basename(self._absolute_path)
+            )
+        assert filename_match, self._absolute_path
+        return filename_match
 
     @property
     def absolute_path(self) -> str:
-        return str(self._absolute_path)
+        return self._absolute_path
+
+    def _read_text(self) -> str:
+        with stats.measure("read"):
+            text = pathlib.Path(self._absolute_path).read_text(encoding="ascii")
+        stats.count("files_read")
+        stats.count("bytes_read", len(text))  # ascii
+        return text
+
+    @classmethod
+    def find(  # pylint: disable=too-many-arguments; optional filters
+        cls,
+        root_dir_path: str,
+        filename_regex: typing.Optional[typing.Pattern] = None,
+        jobs: int = 1,
+        subjects_dir_layout: bool = False,
+        index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"] = None,
+        *,
+        shard: typing.Optional[typing.Tuple[int, int]] = None,
+    ) -> typing.Generator["VolumeFile", None, None]:
+        """
+        Recursively search `root_dir_path` for volume files.
+
+        `jobs > 1` lists multiple directories concurrently.
+
+        `subjects_dir_layout` restricts the search to
+        `root_dir_path/*/{SUBJECT_SUBDIR_NAME}/`, if supported by the class
+        and if `root_dir_path` contains at least one such directory.
+
+        `index` skips listing directories which did not change since
+        the previous search.
+
+        `shard=(index, number)` only searches the subject directories
+        `root_dir_path/{subject}/` with `subject_shard(subject, number) == index`
+        (e.g., for array jobs searching disjoint parts of `root_dir_path`).
+        """
+        yield from find_volume_files(
+            root_dir_path,
+            volume_file_classes=[cls],
+            filename_regexs=None if filename_regex is None else {cls: filename_regex},
+            jobs=jobs,
+            subjects_dir_layout=subjects_dir_layout,
+            index=index,
+            shard=shard,
+        )
 
     @classmethod
-    def find(
-        cls, root_dir_path: str, filename_regex: typing.Optional[typing.Pattern] = None
+    def find_subject(
+        cls,
+        root_dir_path: str,
+        subject: str,
+        filename_regex: typing.Optional[typing.Pattern] = None,
+        index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"] = None,
     ) -> typing.Iterator["VolumeFile"]:
-        if filename_regex is None:
-            filename_regex = cls.FILENAME_REGEX
-        for dirpath, _, filenames in os.walk(root_dir_path):
-            for filename in filter(filename_regex.search, filenames):
-                yield cls(path=os.path.join(dirpath, filename))
+        """
+        Search volume files of `subject` in `root_dir_path/{subject}/`
+        (restricted to `{SUBJECT_SUBDIR_NAME}/`, if fixed by the class)
+        instead of the entire `root_dir_path`.
+
+        `index` skips listing directories which did not change since
+        the previous search.
+        """
+        for volume_file in cls.find(
+            os.path.join(root_dir_path, subject, cls.SUBJECT_SUBDIR_NAME or ""),
+            filename_regex=filename_regex,
+            index=index,
+        ):
+            # e.g. filename prefix of ashs volume files
+            if volume_file.subject == subject:
+                yield volume_file
+
+    @classmethod
+    def find_subjects(  # pylint: disable=too-many-arguments; see find()
+        cls,
+        root_dir_path: str,
+        subjects: typing.Iterable[str],
+        filename_regex: typing.Optional[typing.Pattern] = None,
+        jobs: int = 1,
+        index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"] = None,
+    ) -> typing.Iterator["VolumeFile"]:
+        """
+        `find_subject()` for each of `subjects`,
+        searching for up to `jobs` subjects concurrently.
+
+        Volume files are yielded in the order of `subjects`.
+        """
+        for volume_files in _map_concurrently(
+            lambda subject: list(
+                cls.find_subject(
+                    root_dir_path,
+                    subject=subject,
+                    filename_regex=filename_regex,
+                    index=index,
+                )
+            ),
+            subjects,
+            jobs=jobs,
+        ):
+            yield from volume_files
+
+    @classmethod
+    async def afind(
+        cls, root_dir_path: str, **kwargs
+    ) -> typing.AsyncIterator["VolumeFile"]:
+        """
+        Asynchronous version of `find()` (accepting the same arguments).
+
+        Directories are listed in the event loop's default executor.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel; slow import
+
+        loop = asyncio.get_running_loop()
+        volume_files = cls.find(root_dir_path, **kwargs)
+        next_future = None
+        try:
+            while True:
+                next_future = loop.run_in_executor(None, next, volume_files, None)
+                # cancelling the consumer can not interrupt next() in its thread
+                volume_file = await asyncio.shield(next_future)
+                if volume_file is None:
+                    return
+                yield volume_file
+        finally:
+            if next_future is not None and not next_future.done():
+                # generators can not be closed while executing
+                await asyncio.wait([next_future])
+                next_future.exception()  # mark as retrieved
+            await loop.run_in_executor(None, volume_files.close)
+
+
+class VolumeFileRecord(typing.NamedTuple):
+    """
+    Compact alternative to `VolumeFile` instances for large search results,
+    see `find_volume_file_records()`.
+    """
+
+    volume_file_class: typing.Type[VolumeFile]
+    absolute_path: str
+
+    def to_volume_file(self) -> VolumeFile:
+        return self.volume_file_class(path=self.absolute_path)
+
+
+_FilenameMatch = typing.Tuple[
+    typing.Type[VolumeFile], str, typing.Optional[typing.Match[str]]
+]
+
+
+def _measure_walk(
+    walk: typing.Iterator[typing.Tuple[str, typing.List[str], typing.List[str]]],
+) -> typing.Iterator[typing.Tuple[str, typing.List[str], typing.List[str]]]:
+    """
+    Measures stage "walk" without the time spent by the consumer.
+    """
+    while True:
+        with stats.measure("walk"):
+            walk_step = next(walk, None)
+        if walk_step is None:
+            return
+        stats.count("directories")
+        yield walk_step
+
+
+def _walk_volume_dirs(
+    root_dir_path: str,
+    subdir_name: typing.Optional[str],
+    jobs: int,
+    index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"],
+    shard: typing.Optional[typing.Tuple[int, int]],
+) -> typing.Iterator[typing.Tuple[str, typing.List[str], typing.List[str]]]:
+    """
+    `_walk()` or `_walk_subject_subdirs()` (if `subdir_name` is given)
+    """
+    scan_dir: typing.Optional[_ScanDirFunction] = (
+        index.scan_dir if index is not None else None
+    )
+    if shard is not None:
+        scan_dir = _shard_scan_dir(scan_dir or _scan_dir, root_dir_path, shard=shard)
+    if subdir_name is None:
+        return _walk(root_dir_path, jobs=jobs, scan_dir=scan_dir)
+    return _walk_subject_subdirs(
+        root_dir_path, subdir_name=subdir_name, jobs=jobs, scan_dir=scan_dir
+    )
+
+
+def _find_filename_matches(  # pylint: disable=too-many-arguments; see VolumeFile.find()
+    root_dir_path: str,
+    volume_file_classes: typing.Iterable[typing.Type[VolumeFile]],
+    *,
+    filename_regexs: typing.Optional[
+        typing.Mapping[typing.Type[VolumeFile], typing.Pattern]
+    ] = None,
+    jobs: int = 1,
+    subjects_dir_layout: bool = False,
+    index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"] = None,
+    shard: typing.Optional[typing.Tuple[int, int]] = None,
+) -> typing.Iterator[_FilenameMatch]:
+    """
+    Yields `(volume_file_class, absolute_path, match of FILENAME_REGEX or None)`.
+    """
+    volume_file_classes = list(volume_file_classes)
+    if any(c.SUBJECT_SUBDIR_NAME is None for c in volume_file_classes):
+        # classes without fixed subject subdirectory require a recursive search,
+        # listing the subject subdirectories of all other classes as well
+        subjects_dir_layout = False
+    walks: typing.Dict[
+        typing.Optional[str],
+        typing.List[typing.Tuple[typing.Type[VolumeFile], typing.Pattern]],
+    ] = {}
+    for volume_file_class in volume_file_classes:
+        subdir_name = volume_file_class.SUBJECT_SUBDIR_NAME
+        walks.setdefault(subdir_name if subjects_dir_layout else None, []).append(
+            (
+                volume_file_class,
+                (filename_regexs or {}).get(
+                    volume_file_class, volume_file_class.FILENAME_REGEX
+                ),
+            )
+        )
+    # joined paths are then already absolute
+    root_dir_path = os.path.abspath(root_dir_path)
+    for subdir_name, class_regexs in walks.items():
+        # skips most filenames with a single call, unless custom regexs are given
+        filename_suffixes = tuple(
+            c.FILENAME_SUFFIX if r is c.FILENAME_REGEX else "" for c, r in class_regexs
+        )
+        for dirpath, _, filenames in _measure_walk(
+            _walk_volume_dirs(
+                root_dir_path,
+                subdir_name=subdir_name,
+                jobs=jobs,
+                index=index,
+                shard=shard,
+            )
+        ):
+            with stats.measure("match"):
+                matches = [
+                    m
+                    for filename in filter(
+                        operator.methodcaller("endswith", filename_suffixes), filenames
+                    )
+                    for m in _match_filename(dirpath, filename, class_regexs)
+                ]
+            stats.count("files_matched", len(matches))
+            yield from matches
+
+
+def _match_filename(
+    dirpath: str,
+    filename: str,
+    class_regexs: typing.List[typing.Tuple[typing.Type[VolumeFile], typing.Pattern]],
+) -> typing.Iterator[_FilenameMatch]:
+    for volume_file_class, filename_regex in class_regexs:
+        if filename_regex is not volume_file_class.FILENAME_REGEX:
+            if filename_regex.search(filename):
+                yield volume_file_class, os.path.join(dirpath, filename), None
+            continue
+        filename_match = (
+            filename_regex.match(filename)
+            if filename.endswith(volume_file_class.FILENAME_SUFFIX)
+            else None
+        )
+        if filename_match:
+            yield volume_file_class, os.path.join(dirpath, filename), filename_match
+
+
+def find_volume_files(
+    root_dir_path: str,
+    volume_file_classes: typing.Iterable[typing.Type[VolumeFile]],
+    **kwargs,
+) -> typing.Iterator[VolumeFile]:
+    """
+    Like `VolumeFile.find()` (accepting the same keyword arguments,
+    with `filename_regexs` mapping classes to `filename_regex`),
+    but searches for volume files of multiple classes
+    while listing each directory only once.
+
+    Each filename is matched against the `filename_regexs` of all classes
+    (default: `FILENAME_REGEX`) and may thus yield multiple volume files.
+
+    `subjects_dir_layout` is ignored in case any of `volume_file_classes`
+    requires a recursive search (no `SUBJECT_SUBDIR_NAME`).
+    """
+    for volume_file_class, path, filename_match in _find_filename_matches(
+        root_dir_path, volume_file_classes, **kwargs
+    ):
+        # pass match to skip matching again in constructor
+        yield volume_file_class(path=path, filename_match=filename_match)
+
+
+def find_volume_file_records(
+    root_dir_path: str,
+    volume_file_classes: typing.Iterable[typing.Type[VolumeFile]],
+    **kwargs,
+) -> typing.Iterator[VolumeFileRecord]:
+    """
+    Like `find_volume_files()`, but yields compact records
+    instead of parsing the filenames into `VolumeFile` instances.
+    """
+    for volume_file_class, path, _ in _find_filename_matches(
+        root_dir_path, volume_file_classes, **kwargs
+    ):
+        yield VolumeFileRecord(volume_file_class=volume_file_class, absolute_path=path)
+
+
+# modifications within the same timestamp granularity may go unnoticed,
+# so recently modified files are not memoized (cf. index._RACY_INTERVAL_NS)
+_MEMO_RACY_INTERVAL_NS = 2 * 10**9
+
+
+class _VolumesMemo:
+    """
+    Volumes of the `max_entries` most recently read volume files,
+    valid as long as a file's mtime & size do not change.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError(f"expected positive max_entries, got {max_entries}")
+        self.max_entries = max_entries
+        # (class, path) -> ((mtime, size), volumes)
+        self._entries: typing.OrderedDict[
+            typing.Tuple[type, str],
+            typing.Tuple[typing.Tuple[int, int], typing.Dict[str, float]],
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def read_volumes_mm3(
+        self, volume_file: "SubfieldVolumeFile"
+    ) -> typing.Dict[str, float]:
+        stat = os.stat(volume_file.absolute_path)
+        key = (type(volume_file), volume_file.absolute_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return dict(entry[1])  # callers may modify
+        # pylint: disable=protected-access; implemented by subclasses
+        subfield_volumes = volume_file._parse_volumes_mm3(volume_file._read_text())
+        with self._lock:
+            if time.time_ns() - stat.st_mtime_ns < _MEMO_RACY_INTERVAL_NS:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (version, dict(subfield_volumes))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return subfield_volumes
+
+
+_VOLUMES_MEMO: typing.Optional[_VolumesMemo] = None
 
 
 class SubfieldVolumeFile(VolumeFile):
+
+    __slots__ = ()
+
+    # columns of dataframes returned by `read_volumes_dataframe()`
+    VOLUMES_DATAFRAME_COLUMNS: typing.Tuple[str, ...] = NotImplemented
+
     @abc.abstractmethod
     def read_volumes_mm3(self) -> typing.Dict[str, float]:
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def read_volumes_dataframe(self) -> pandas.DataFrame:
+    def read_volumes_dataframe(self) -> "pandas.DataFrame":
+        raise NotImplementedError()
+
+    def _parse_volumes_mm3(self, volumes_text: str) -> typing.Dict[str, float]:
+        """
+        Volumes in the content of this volume file
+        (allows parsing text which was already read).
+        """
         raise NotImplementedError()
 
-    def _read_volume_series(self) -> pandas.Series:
-        subfield_volumes = self.read_volumes_mm3()
+    def _read_parsed_volumes_mm3(self) -> typing.Dict[str, float]:
+        """
+        Memoized, if enabled via `enable_cache()`.
+        """
+        volumes_memo = _VOLUMES_MEMO
+        if volumes_memo is None:
+            return self._parse_volumes_mm3(self._read_text())
+        return volumes_memo.read_volumes_mm3(self)
+
+    @staticmethod
+    def enable_cache(max_entries: int = 2**12) -> None:
+        """
+        Memoize volumes returned by `read_volumes_mm3()`
+        (and `read_volumes_dataframe()`) of all volume files in this process,
+        so repeated calls only `stat` files whose mtime & size did not change.
+        Volumes of the least recently read files beyond `max_entries` are dropped.
+
+        Disabled by default.
+        """
+        global _VOLUMES_MEMO  # pylint: disable=global-statement; read by all instances
+        _VOLUMES_MEMO = _VolumesMemo(max_entries)
+
+    @staticmethod
+    def disable_cache() -> None:
+        global _VOLUMES_MEMO  # pylint: disable=global-statement; read by all instances
+        _VOLUMES_MEMO = None
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drops all volumes memoized since `enable_cache()`.
+        """
+        if _VOLUMES_MEMO is not None:
+            _VOLUMES_MEMO.clear()
+
+    async def aread_volumes_mm3(self) -> typing.Dict[str, float]:
+        """
+        Asynchronous version of `read_volumes_mm3()`.
+
+        Files are read in the event loop's default executor, so the number of
+        concurrent reads is bounded by its number of workers
+        (adjustable via `loop.set_default_executor()`).
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel; slow import
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.read_volumes_mm3
+        )
+
+    async def aread_volumes_dataframe(self) -> "pandas.DataFrame":
+        """
+        Asynchronous version of `read_volumes_dataframe()`.
+        """
+        return self.build_volumes_dataframe(await self.aread_volumes_mm3())
+
+    def build_volumes_dataframe(
+        self, subfield_volumes: typing.Dict[str, float]
+    ) -> "pandas.DataFrame":
+        """
+        Dataframe as returned by `read_volumes_dataframe()`
+        for volumes previously returned by `read_volumes_mm3()`.
+        """
+        with stats.measure("dataframe"):
+            volumes_frame = self._build_volume_series(subfield_volumes).reset_index()
+            for column, value in self._volumes_dataframe_attributes().items():
+                volumes_frame[column] = value
+        return volumes_frame
+
+    def _volumes_dataframe_attributes(self) -> typing.Dict[str, typing.Any]:
+        """
+        Values of all columns in `VOLUMES_DATAFRAME_COLUMNS`
+        other than "subfield" & "volume_mm^3".
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def read_volumes_dataframe_batch(
+        cls, volume_files: typing.Iterable["SubfieldVolumeFile"]
+    ) -> "pandas.DataFrame":
+        """
+        Equivalent to concatenating the dataframes returned by
+        `read_volumes_dataframe()` of all `volume_files` (with a fresh index).
+
+        Subclasses build the dataframe at once instead,
+        which is considerably faster for many files.
+        """
+        import pandas  # pylint: disable=import-outside-toplevel; slow import
+
+        volume_frames = [f.read_volumes_dataframe() for f in volume_files]
+        if not volume_frames:
+            return pandas.DataFrame(columns=list(cls.VOLUMES_DATAFRAME_COLUMNS)).astype(
+                {"volume_mm^3": "float64"}
+            )
+        with stats.measure("concat"):
+            return pandas.concat(volume_frames, ignore_index=True, sort=False)
+
+    @staticmethod
+    def _build_volume_series(
+        subfield_volumes: typing.Dict[str, float],
+    ) -> "pandas.Series":
+        import pandas  # pylint: disable=import-outside-toplevel; slow import
+
         return pandas.Series(
             data=list(subfield_volumes.values()),
             name="volume_mm^3",
             index=pandas.Index(data=subfield_volumes.keys(), name="subfield"),
         )
+
+
+def _map_concurrently(
+    function: typing.Callable,
+    iterable: typing.Iterable,
+    jobs: int = 1,
+    use_processes: bool = False,
+) -> typing.Iterator:
+    """
+    Like the builtin `map()`, but optionally distributes calls over a pool
+    of `jobs` threads (or processes).
+    Results are yielded in the order of `iterable` in any case.
+    """
+    if jobs < 1:
+        raise ValueError(f"expected positive number of jobs, got {jobs}")
+    if jobs == 1:
+        yield from map(function, iterable)
+        return
+    executor: concurrent.futures.Executor = (
+        concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+        if use_processes
+        else concurrent.futures.ThreadPoolExecutor(max_workers=jobs)
+    )
+    with executor:
+        # in contrast to executor.map(), consume `iterable` lazily
+        # to yield first results early & keep memory usage constant
+        pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+        try:
+            for item in iterable:
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(function, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _select_volumes_reader(
+    method_name: str,
+    use_processes: bool,
+    index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"],
+) -> typing.Callable[[SubfieldVolumeFile], typing.Any]:
+    if index is not None:
+        if use_processes:
+            raise ValueError("index can not be shared with other processes")
+        return getattr(index, method_name)
+    return operator.methodcaller(method_name)
+
+
+def read_volumes_dataframes(
+    volume_files: typing.Iterable[SubfieldVolumeFile],
+    jobs: int = 1,
+    use_processes: bool = False,
+    index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"] = None,
+) -> typing.Iterator["pandas.DataFrame"]:
+    """
+    Call `read_volumes_dataframe()` on each of `volume_files`,
+    concurrently in case `jobs > 1`.
+
+    Reading is mostly waiting for I/O, so threads are usually sufficient.
+    Dataframes are yielded in the order of `volume_files`.
+
+    `index` skips parsing files which did not change since they were last read.
+    """
+    return _map_concurrently(
+        _select_volumes_reader(
+            "read_volumes_dataframe",
+            use_processes=use_processes,
+            index=index,
+        ),
+        volume_files,
+        jobs=jobs,
+        use_processes=use_processes,
+    )
+
+
+def _append_wide_row(
+    columns: typing.Dict[str, typing.List[typing.Any]],
+    values: typing.Mapping[str, typing.Any],
+    rows_number: int,
+    missing_value: typing.Any,
+) -> None:
+    """
+    Appends a row to `columns` (all of length `rows_number`).
+    """
+    for column, value in values.items():
+        column_values = columns.get(column)
+        if column_values is None:
+            column_values = columns[column] = [missing_value] * rows_number
+        column_values.append(value)
+    for column_values in columns.values():
+        if len(column_values) == rows_number:
+            column_values.append(missing_value)
+
+
+def read_volumes_wide_dataframe(
+    volume_files: typing.Iterable[SubfieldVolumeFile],
+    jobs: int = 1,
+    use_processes: bool = False,
+    index: typing.Optional["freesurfer_volume_reader.index.VolumeIndex"] = None,
+) -> "pandas.DataFrame":
+    """
+    One row per volume file (in the order of `volume_files`)
+    with a column per subfield (missing volumes are NaN)
+    and the columns in `VOLUMES_DATAFRAME_COLUMNS` identifying the volume file.
+
+    Equivalent to pivoting the concatenated dataframes
+    returned by `read_volumes_dataframes()`, but built directly from
+    the volumes returned by `read_volumes_mm3()`.
+    """
+    volumes_reader = _select_volumes_reader(
+        "read_volumes_mm3",
+        use_processes=use_processes,
+        index=index,
+    )
+    volume_files, volume_files_copy = itertools.tee(volume_files)
+    attribute_columns: typing.Dict[str, typing.List[typing.Any]] = {}
+    subfield_columns: typing.Dict[str, typing.List[float]] = {}
+    rows_number = 0
+    for volume_file, subfield_volumes in zip(
+        volume_files,
+        _map_concurrently(
+            volumes_reader,
+            volume_files_copy,
+            jobs=jobs,
+            use_processes=use_processes,
+        ),
+    ):
+        with stats.measure("dataframe"):
+            _append_wide_row(
+                attribute_columns,
+                # pylint: disable=protected-access; implemented by subclasses
+                volume_file._volumes_dataframe_attributes(),
+                rows_number=rows_number,
+                missing_value=None,
+            )
+            _append_wide_row(
+                subfield_columns,
+                subfield_volumes,
+                rows_number=rows_number,
+                missing_value=math.nan,
+            )
+        rows_number += 1
+    import pandas  # pylint: disable=import-outside-toplevel; slow import
+
+    with stats.measure("dataframe"):
+        return pandas.DataFrame(
+            {
+                **{c: pandas.Series(v) for c, v in attribute_columns.items()},
+                **{
+                    s: pandas.Series(v, dtype="float64")
+                    for s, v in subfield_columns.items()
+                },
+            }
+        )
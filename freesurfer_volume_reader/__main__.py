@@ -4,29 +4,567 @@ and export collected data as CSV.
 """
 
 import argparse
+import contextlib
+import importlib.util
+import itertools
 import os
 import re
+import shutil
+import stat
 import sys
-
-import pandas
+import tempfile
+import time
+import typing
 
 from freesurfer_volume_reader import (
     __version__,
     ashs,
     freesurfer,
+    stats,
+    SubfieldVolumeFile,
+    VolumeFile,
+    find_volume_files,
+    read_volumes_dataframes,
+    read_volumes_wide_dataframe,
     remove_group_names_from_regex,
 )
+from freesurfer_volume_reader.index import VolumeIndex
+from freesurfer_volume_reader.watch import watch_volume_files
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas
 
-VOLUME_FILE_FINDERS = {
+VOLUME_FILE_FINDERS: typing.Dict[str, typing.Type[SubfieldVolumeFile]] = {
     "ashs": ashs.HippocampalSubfieldsVolumeFile,
     # https://github.com/freesurfer/freesurfer/tree/release_6_0_0/HippoSF
     "freesurfer-hipposf": freesurfer.HippocampalSubfieldsVolumeFile,
 }
 
 
+_OUTPUT_FORMATS = ["csv", "parquet", "feather", "arrow-ipc"]
+
+
+def _find_volume_files(
+    args: argparse.Namespace,
+    filename_regexs: typing.Dict[str, typing.Pattern[str]],
+    index: typing.Optional[VolumeIndex],
+    icv_cache: typing.Optional[ashs.IntracranialVolumeCache] = None,
+) -> typing.Iterator[typing.Tuple[str, SubfieldVolumeFile]]:
+    source_types = {VOLUME_FILE_FINDERS[t]: t for t in args.source_types}
+    volume_file_classes: typing.List[typing.Type[VolumeFile]] = list(source_types)
+    if icv_cache is not None:
+        volume_file_classes.append(ashs.IntracranialVolumeFile)
+    for root_dir_path in args.root_dir_paths:
+        # list each directory once for all source types
+        volume_files = find_volume_files(
+            root_dir_path,
+            volume_file_classes=volume_file_classes,
+            filename_regexs={c: filename_regexs[t] for c, t in source_types.items()},
+            jobs=args.jobs,
+            subjects_dir_layout=args.subjects_dir_layout,
+            index=index,
+            shard=args.shard,
+        )
+        if icv_cache is not None:
+            volume_files = icv_cache.join(volume_files)
+        for volume_file in volume_files:
+            assert isinstance(volume_file, SubfieldVolumeFile)
+            yield source_types[type(volume_file)], volume_file
+
+
+def _watch_volume_files(
+    args: argparse.Namespace, filename_regexs: typing.Dict[str, typing.Pattern[str]]
+) -> typing.Iterator[typing.List[typing.Tuple[str, SubfieldVolumeFile]]]:
+    source_types = {VOLUME_FILE_FINDERS[t]: t for t in args.source_types}
+    for volume_files in watch_volume_files(
+        args.root_dir_paths,
+        volume_file_classes=source_types.keys(),
+        filename_regexs={c: filename_regexs[t] for c, t in source_types.items()},
+        jobs=args.jobs,
+        debounce_seconds=args.watch_debounce,
+        interval_seconds=args.watch_interval,
+    ):
+        source_type_volume_files = []
+        for volume_file in volume_files:
+            assert isinstance(volume_file, SubfieldVolumeFile)
+            source_type_volume_files.append(
+                (source_types[type(volume_file)], volume_file)
+            )
+        yield source_type_volume_files
+
+
+def _write_watched_volume_frames(
+    args: argparse.Namespace,
+    filename_regexs: typing.Dict[str, typing.Pattern[str]],
+    index: typing.Optional[VolumeIndex],
+) -> None:
+    """
+    Writes rows to stdout until interrupted.
+    """
+    try:
+        _write_csv(
+            (
+                volume_frame
+                for volume_files in _watch_volume_files(
+                    args, filename_regexs=filename_regexs
+                )
+                for volume_frame in _read_volume_frames(
+                    volume_files, args=args, index=index
+                )
+            ),
+            columns=_volumes_frame_columns(args.source_types),
+            stream=sys.stdout,
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def _select_outdated_volume_files(
+    volume_files: typing.List[typing.Tuple[str, SubfieldVolumeFile]],
+    previous_frame: "pandas.DataFrame",
+    previous_start_time_ns: int,
+) -> typing.Tuple[
+    typing.List[typing.Tuple[str, SubfieldVolumeFile]], "pandas.DataFrame"
+]:
+    """
+    Returns volume files missing in or modified since `previous_frame`
+    and all rows of `previous_frame` which are still up to date.
+    """
+    source_paths = set(f.absolute_path for _, f in volume_files)
+    up_to_date_paths = set()
+    for source_path in previous_frame["source_path"].unique():
+        if source_path not in source_paths:
+            continue  # removed
+        # unlike mtime, ctime is not preserved when files are replaced
+        # (e.g., by `rsync -a`, `cp -p` or `tar -x`)
+        if os.stat(source_path).st_ctime_ns < previous_start_time_ns:
+            up_to_date_paths.add(source_path)
+    return (
+        [(t, f) for t, f in volume_files if f.absolute_path not in up_to_date_paths],
+        previous_frame[previous_frame["source_path"].isin(up_to_date_paths)],
+    )
+
+
+def _read_volume_frames(
+    volume_files: typing.Iterable[typing.Tuple[str, SubfieldVolumeFile]],
+    args: argparse.Namespace,
+    index: typing.Optional[VolumeIndex],
+    icv_cache: typing.Optional[ashs.IntracranialVolumeCache] = None,
+) -> typing.Iterator["pandas.DataFrame"]:
+    volume_files, volume_files_copy = itertools.tee(volume_files)
+    for (source_type, volume_file), volume_frame in zip(
+        volume_files,
+        read_volumes_dataframes(
+            (volume_file for _, volume_file in volume_files_copy),
+            jobs=args.jobs,
+            use_processes=args.use_processes,
+            index=index,
+        ),
+    ):
+        if icv_cache is not None and isinstance(
+            volume_file, ashs.HippocampalSubfieldsVolumeFile
+        ):
+            icv_cache.add_volume_columns(volume_frame, volume_file)
+        volume_frame["source_type"] = source_type
+        volume_frame["source_path"] = volume_file.absolute_path
+        yield volume_frame
+
+
+def _volumes_frame_columns(
+    source_types: typing.Iterable[str], ashs_icv: bool = False
+) -> typing.List[str]:
+    columns: typing.List[str] = []
+    for source_type in source_types:
+        for column in VOLUME_FILE_FINDERS[source_type].VOLUMES_DATAFRAME_COLUMNS:
+            if column not in columns:
+                columns.append(column)
+    if ashs_icv:
+        columns.extend(["intercranial_volume_mm^3", "volume_icv_ratio"])
+    return columns + ["source_type", "source_path"]
+
+
+def _write_csv(
+    volume_frames: typing.Iterable["pandas.DataFrame"],
+    columns: typing.List[str],
+    stream: typing.IO[str],
+) -> bool:
+    """
+    Writes each frame as soon as it is available.
+    The header is only written if there is at least one row.
+    """
+    header = True
+    for volume_frame in volume_frames:
+        if volume_frame.empty:
+            continue
+        with stats.measure("write"):
+            volume_frame.reindex(columns=columns).to_csv(
+                stream, header=header, index=False
+            )
+        stream.flush()
+        header = False
+    return not header
+
+
+def _convert_columnar_dtypes(volume_frame: "pandas.DataFrame") -> "pandas.DataFrame":
+    volume_frame = volume_frame.astype(
+        {
+            c: "category"
+            for c in ["subfield", "subject", "hemisphere", "source_type"]
+            if c in volume_frame
+        }
+    )
+    if "volume_mm^3" in volume_frame:
+        volume_frame["volume_mm^3"] = volume_frame["volume_mm^3"].astype("float64")
+    # rows read from ashs volume files have no value (converted to null by pyarrow)
+    if "T1_input" in volume_frame and volume_frame["T1_input"].notnull().all():
+        volume_frame["T1_input"] = volume_frame["T1_input"].astype(bool)
+    return volume_frame
+
+
+def _write_columnar(
+    volume_frames: typing.Iterable["pandas.DataFrame"],
+    columns: typing.List[str],
+    output_format: str,
+    stream: typing.IO[bytes],
+) -> bool:
+    volume_frames = [f for f in volume_frames if not f.empty]
+    if not volume_frames:
+        return False
+    import pandas  # pylint: disable=import-outside-toplevel; slow import
+
+    with stats.measure("concat"):
+        volume_frame = pandas.concat(
+            volume_frames, ignore_index=True, sort=False
+        ).reindex(columns=columns)
+    _write_columnar_frame(volume_frame, output_format=output_format, stream=stream)
+    return True
+
+
+def _write_columnar_frame(
+    volume_frame: "pandas.DataFrame", output_format: str, stream: typing.IO[bytes]
+) -> None:
+    volume_frame = _convert_columnar_dtypes(volume_frame)
+    with stats.measure("write"):
+        if output_format == "parquet":
+            volume_frame.to_parquet(stream)
+        elif output_format == "feather":
+            volume_frame.to_feather(stream)
+        else:
+            import pyarrow  # pylint: disable=import-outside-toplevel; optional
+
+            table = pyarrow.Table.from_pandas(volume_frame, preserve_index=False)
+            with pyarrow.ipc.new_stream(stream, table.schema) as writer:
+                writer.write_table(table)
+
+
+def _write_volume_frames(
+    volume_frames: typing.Iterable["pandas.DataFrame"],
+    columns: typing.List[str],
+    output_format: str,
+    stream: typing.IO,
+) -> bool:
+    """
+    Returns `False` if no rows were written.
+    """
+    if output_format == "csv":
+        return _write_csv(volume_frames, columns=columns, stream=stream)
+    return _write_columnar(
+        volume_frames, columns=columns, output_format=output_format, stream=stream
+    )
+
+
+def _write_wide_volumes_frame(
+    volume_files: typing.Iterable[typing.Tuple[str, SubfieldVolumeFile]],
+    args: argparse.Namespace,
+    index: typing.Optional[VolumeIndex],
+    stream: typing.IO,
+) -> bool:
+    """
+    Returns `False` if no rows were written.
+    """
+    volume_files = list(volume_files)
+    if not volume_files:
+        return False
+    volumes_frame = read_volumes_wide_dataframe(
+        (f for _, f in volume_files),
+        jobs=args.jobs,
+        use_processes=args.use_processes,
+        index=index,
+    )
+    volumes_frame["source_type"] = [t for t, _ in volume_files]
+    volumes_frame["source_path"] = [f.absolute_path for _, f in volume_files]
+    if args.output_format == "csv":
+        with stats.measure("write"):
+            volumes_frame.to_csv(stream, index=False)
+    else:
+        _write_columnar_frame(
+            volumes_frame, output_format=args.output_format, stream=stream
+        )
+    return True
+
+
+# not inferred from csv (e.g., subject "007" or "NA")
+_OUTPUT_STRING_COLUMNS = (
+    "subfield",
+    "subject",
+    "hemisphere",
+    "analysis_id",
+    "correction",
+    "source_type",
+    "source_path",
+)
+
+
+def _read_output(path: str, output_format: str) -> "pandas.DataFrame":
+    import pandas  # pylint: disable=import-outside-toplevel; slow import
+
+    if output_format == "csv":
+        return pandas.read_csv(
+            path,
+            dtype={c: str for c in _OUTPUT_STRING_COLUMNS},
+            # only empty cells (written for null values)
+            keep_default_na=False,
+            na_values=[""],
+            float_precision="round_trip",
+        )
+    if output_format == "parquet":
+        return pandas.read_parquet(path)
+    if output_format == "feather":
+        return pandas.read_feather(path)
+    import pyarrow  # pylint: disable=import-outside-toplevel; optional
+
+    with pyarrow.OSFile(path) as stream:
+        return pyarrow.ipc.open_stream(stream).read_pandas()
+
+
+@contextlib.contextmanager
+def _replace_atomically(
+    path: str, mtime_ns: int, binary: bool = False
+) -> typing.Iterator[typing.IO]:
+    """
+    Yields a temporary file replacing `path` on success.
+    `path` is removed if the temporary file is left empty (no rows).
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="wb" if binary else "w",
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=f".{os.path.basename(path)}.",
+        delete=False,
+    ) as temp_file:
+        try:
+            yield temp_file
+        except BaseException:
+            os.remove(temp_file.name)
+            raise
+    if not os.path.getsize(temp_file.name):
+        os.remove(temp_file.name)
+        # all volume files of previous output were removed
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        return
+    # volume files modified after starting this run will be read on next update
+    os.utime(temp_file.name, ns=(mtime_ns, mtime_ns))
+    # temporary files are only accessible by their owner
+    os.chmod(temp_file.name, _output_mode(path))
+    os.replace(temp_file.name, path)
+
+
+def _output_mode(path: str) -> int:
+    """
+    Mode of the file at `path` or the default mode of new files (umask).
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _extract(
+    args: argparse.Namespace, filename_regexs: typing.Dict[str, typing.Pattern[str]]
+) -> int:
+    start_time_ns = time.time_ns()
+    with contextlib.ExitStack() as exit_stack:
+        index = (
+            exit_stack.enter_context(VolumeIndex(args.index)) if args.index else None
+        )
+        if args.watch:
+            _write_watched_volume_frames(
+                args,
+                filename_regexs=filename_regexs,
+                index=index,
+            )
+            return os.EX_OK
+        # single search for volume & intracranial volume files
+        icv_cache = ashs.IntracranialVolumeCache() if args.ashs_icv else None
+        volume_files: typing.Iterable[typing.Tuple[str, SubfieldVolumeFile]] = (
+            _find_volume_files(
+                args, filename_regexs=filename_regexs, index=index, icv_cache=icv_cache
+            )
+        )
+        up_to_date_frames: typing.List["pandas.DataFrame"] = []
+        if args.update and os.path.exists(args.update):
+            volume_files, up_to_date_frame = _select_outdated_volume_files(
+                volume_files=list(volume_files),
+                previous_frame=_read_output(args.update, args.output_format),
+                previous_start_time_ns=os.stat(args.update).st_mtime_ns,
+            )
+            up_to_date_frames.append(up_to_date_frame)
+        csv_output = args.output_format == "csv"
+        output_stream = (
+            exit_stack.enter_context(
+                _replace_atomically(
+                    args.update, mtime_ns=start_time_ns, binary=not csv_output
+                )
+            )
+            if args.update
+            else (sys.stdout if csv_output else sys.stdout.buffer)
+        )
+        rows_written = (
+            _write_wide_volumes_frame(
+                volume_files,
+                args=args,
+                index=index,
+                stream=output_stream,
+            )
+            if args.layout == "wide"
+            else _write_volume_frames(
+                itertools.chain(
+                    up_to_date_frames,
+                    _read_volume_frames(
+                        volume_files,
+                        args=args,
+                        index=index,
+                        icv_cache=icv_cache,
+                    ),
+                ),
+                columns=_volumes_frame_columns(
+                    args.source_types, ashs_icv=args.ashs_icv
+                ),
+                output_format=args.output_format,
+                stream=output_stream,
+            )
+        )
+    if not rows_written:
+        print(
+            "Did not find any volume files matching the specified criteria.",
+            file=sys.stderr,
+        )
+        return os.EX_NOINPUT
+    return os.EX_OK
+
+
+def _merge_csv(shard_paths: typing.List[str], stream: typing.IO[str]) -> None:
+    headers = []
+    for shard_path in shard_paths:
+        with open(shard_path, encoding="utf-8") as shard_file:
+            headers.append(shard_file.readline())
+    if len(set(headers)) > 1:  # e.g., wide layouts with different subfields
+        volume_frame = _merge_frames([_read_output(p, "csv") for p in shard_paths])
+        _write_csv([volume_frame], columns=list(volume_frame.columns), stream=stream)
+        return
+    # copy rows without parsing them
+    stream.flush()
+    for shard_index, shard_path in enumerate(shard_paths):
+        with open(shard_path, "rb") as shard_file:
+            if shard_index > 0:
+                shard_file.readline()
+            with stats.measure("write"):
+                shutil.copyfileobj(shard_file, stream.buffer)  # type: ignore
+    stream.buffer.flush()  # type: ignore
+
+
+def _merge_frames(volume_frames: typing.List["pandas.DataFrame"]) -> "pandas.DataFrame":
+    import pandas  # pylint: disable=import-outside-toplevel; slow import
+
+    with stats.measure("concat"):
+        volume_frame = pandas.concat(volume_frames, ignore_index=True, sort=False)
+    source_columns = ["source_type", "source_path"]
+    return volume_frame[
+        [c for c in volume_frame.columns if c not in source_columns] + source_columns
+    ]
+
+
+def _merge(argv: typing.List[str]) -> int:
+    argparser = argparse.ArgumentParser(
+        prog="freesurfer-volume-reader merge",
+        description="Combine outputs of runs with --shard K/N"
+        " (in the order of SHARD_PATH) and write them to stdout.",
+    )
+    argparser.add_argument(
+        "--output-format",
+        choices=_OUTPUT_FORMATS,
+        default="csv",
+        help="format of shard outputs & merged output (default: %(default)s)",
+    )
+    argparser.add_argument("shard_paths", metavar="SHARD_PATH", nargs="+")
+    args = argparser.parse_args(argv)
+    if args.output_format != "csv" and not importlib.util.find_spec("pyarrow"):
+        argparser.error(
+            f"--output-format {args.output_format} requires the python package pyarrow"
+        )
+    # runs without volume files in their shard leave their output empty
+    shard_paths = [p for p in args.shard_paths if os.path.getsize(p)]
+    if not shard_paths:
+        print("Did not find any rows in the shard outputs.", file=sys.stderr)
+        return os.EX_NOINPUT
+    if args.output_format == "csv":
+        _merge_csv(shard_paths, stream=sys.stdout)
+    else:
+        _write_columnar_frame(
+            _merge_frames([_read_output(p, args.output_format) for p in shard_paths]),
+            output_format=args.output_format,
+            stream=sys.stdout.buffer,
+        )
+    return os.EX_OK
+
+
+def _check_option_combinations(
+    argparser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    if args.watch and (
+        args.output_format != "csv"
+        or args.update
+        or args.subjects_dir_layout
+        or args.layout != "long"
+    ):
+        argparser.error(
+            "--watch can not be combined with --output-format other than csv,"
+            " --update, --subjects-dir-layout or --layout wide"
+        )
+    if args.watch and args.shard:
+        argparser.error("--watch can not be combined with --shard")
+    if args.update and args.layout != "long":
+        argparser.error("--update can not be combined with --layout wide")
+    if args.ashs_icv and (
+        "ashs" not in args.source_types
+        or args.update
+        or args.watch
+        or args.layout != "long"
+    ):
+        argparser.error(
+            "--ashs-icv requires --source-types ashs"
+            " and can not be combined with --update, --watch or --layout wide"
+        )
+
+
+def _parse_shard(value: str) -> typing.Tuple[int, int]:
+    shard_match = re.match(r"^(\d+)/(\d+)$", value)
+    if not shard_match or int(shard_match.group(1)) >= int(shard_match.group(2)):
+        raise argparse.ArgumentTypeError(f"expected K/N with 0 <= K < N, got {value}")
+    return int(shard_match.group(1)), int(shard_match.group(2))
+
+
 def main():
+    if sys.argv[1:2] == ["merge"]:
+        return _merge(sys.argv[2:])
     argparser = argparse.ArgumentParser(
-        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="freesurfer-volume-reader merge --help:"
+        " combine outputs of runs with --shard K/N"
+        " (pass a ROOT_DIR named merge as ./merge)",
     )
     argparser.add_argument(
         "--source-types",
@@ -41,11 +579,109 @@ def main():
             dest=f"filename_regex.{source_type}",
             metavar="REGULAR_EXPRESSION",
             type=re.compile,
-            default=remove_group_names_from_regex(file_class.FILENAME_PATTERN),
-            help="default: %(default)s",
+            # passing the class's regex allows reusing its matches
+            default=file_class.FILENAME_REGEX,
+            help="default: "
+            + remove_group_names_from_regex(file_class.FILENAME_PATTERN),
         )
     argparser.add_argument(
-        "--output-format", choices=["csv"], default="csv", help="default: %(default)s"
+        "--output-format",
+        choices=_OUTPUT_FORMATS,
+        default="csv",
+        help="default: %(default)s."
+        " columnar formats (other than csv) require the python package pyarrow"
+        " and are written after reading all volume files.",
+    )
+    argparser.add_argument(
+        "--layout",
+        choices=["long", "wide"],
+        default="long",
+        help="long: one row per subfield & volume file (default)."
+        " wide: one row per volume file with a column per subfield"
+        " (written after reading all volume files).",
+    )
+    argparser.add_argument(
+        "--ashs-icv",
+        action="store_true",
+        help="find intracranial volume files of ashs ({subject}_icv.txt)"
+        " in the same search as the volume files"
+        " and add columns intercranial_volume_mm^3 & volume_icv_ratio"
+        " to rows of ashs volume files (empty if no such file was found)",
+    )
+    argparser.add_argument(
+        "--subjects-dir-layout",
+        action="store_true",
+        help="only search ROOT_DIR/*/mri/ for freesurfer-hipposf volume files"
+        " (falls back to a recursive search if no such directory exists"
+        " or ashs volume files are searched as well)",
+    )
+    argparser.add_argument(
+        "--shard",
+        metavar="K/N",
+        type=_parse_shard,
+        help="only search subject directories ROOT_DIR/{subject}/ in shard K"
+        " (0 <= K < N) of N, partitioned by a stable hash of the subject's name"
+        " (e.g., --shard $SLURM_ARRAY_TASK_ID/$SLURM_ARRAY_TASK_COUNT"
+        " with --array 0-(N-1)). files directly in ROOT_DIR belong to shard 0.",
+    )
+    argparser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="N",
+        type=int,
+        default=1,
+        help="number of directories to list & volume files to read concurrently"
+        " (default: %(default)s)",
+    )
+    argparser.add_argument(
+        "--use-processes",
+        action="store_true",
+        help="read volume files in a pool of processes instead of threads"
+        " (only effective with --jobs > 1)",
+    )
+    argparser.add_argument(
+        "--index",
+        metavar="INDEX_PATH",
+        help="persistent index (sqlite database, created if missing)"
+        " of directory listings & parsed volumes."
+        " unchanged directories & volume files will not be read again.",
+    )
+    argparser.add_argument(
+        "--update",
+        metavar="OUTPUT_PATH",
+        help="update file (in --output-format) previously written by this option:"
+        " only read new volume files & volume files changed since previous update"
+        " (ctime, so replacing files with older mtimes is detected)."
+        " rows of volume files no longer found are removed"
+        " (OUTPUT_PATH itself if no volume files are found).",
+    )
+    argparser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and append rows of new & modified volume files (csv only)."
+        " changes are detected via inotify on linux,"
+        " otherwise by searching ROOT_DIR every --watch-interval seconds.",
+    )
+    argparser.add_argument(
+        "--watch-interval",
+        metavar="SECONDS",
+        type=float,
+        default=5.0,
+        help="default: %(default)s",
+    )
+    argparser.add_argument(
+        "--watch-debounce",
+        metavar="SECONDS",
+        type=float,
+        default=2.0,
+        help="only read volume files not modified for this duration,"
+        " skipping partially written files (default: %(default)s)",
+    )
+    argparser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print counters & wall time per stage to stderr"
+        " (stages run in processes of --use-processes are not measured)",
     )
     subjects_dir_path = os.environ.get("SUBJECTS_DIR", None)
     argparser.add_argument(
@@ -62,26 +698,28 @@ def main():
         for k, v in vars(args).items()
         if k.startswith("filename_regex.")
     }
-    volume_frames = []
-    for source_type in args.source_types:
-        finder = VOLUME_FILE_FINDERS[source_type]
-        for root_dir_path in args.root_dir_paths:
-            for volume_file in finder.find(
-                root_dir_path=root_dir_path, filename_regex=filename_regexs[source_type]
-            ):
-                volume_frame = volume_file.read_volumes_dataframe()
-                volume_frame["source_type"] = source_type
-                volume_frame["source_path"] = volume_file.absolute_path
-                volume_frames.append(volume_frame)
-    if not volume_frames:
-        print(
-            "Did not find any volume files matching the specified criteria.",
-            file=sys.stderr,
+    if args.jobs < 1:
+        argparser.error("--jobs: expected positive number")
+    if args.index and args.use_processes:
+        argparser.error("--index can not be combined with --use-processes")
+    if args.output_format != "csv" and not importlib.util.find_spec("pyarrow"):
+        argparser.error(
+            f"--output-format {args.output_format} requires the python package pyarrow"
         )
-        return os.EX_NOINPUT
-    united_volume_frame = pandas.concat(volume_frames, ignore_index=True, sort=False)
-    print(united_volume_frame.to_csv(index=False))
-    return os.EX_OK
+    _check_option_combinations(argparser, args)
+    if not args.stats:
+        return _extract(args, filename_regexs=filename_regexs)
+    # measuring the import within the stage building the first dataframe
+    # would let it dominate that stage
+    # pylint: disable=import-outside-toplevel,unused-import; slow import
+    import pandas
+
+    run_stats = stats.Stats()
+    try:
+        with stats.collect(run_stats):
+            return _extract(args, filename_regexs=filename_regexs)
+    finally:
+        print(run_stats.format(), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -16,83 +16,338 @@ https://sites.google.com/site/hipposubfields/home
 >>>     print(volume_file.subject)
 >>>     print(volume_file.read_volume_mm3())
 >>>     print(volume_file.read_volume_series())
+
+>>> from freesurfer_volume_reader.ashs import read_aggregated_volumes_dataframe
+>>>
+>>> print(read_aggregated_volumes_dataframe('/my/ashs/all_volumes.txt'))
 """
 
+import csv
+import math
+import os
 import re
 import typing
 
-import pandas
-
 import freesurfer_volume_reader
+from freesurfer_volume_reader import stats
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas
 
 
 class IntracranialVolumeFile(freesurfer_volume_reader.VolumeFile):
 
-    FILENAME_REGEX = re.compile(r"^(?P<s>\w+)_icv.txt$")
+    __slots__ = ()
+
+    FILENAME_REGEX = re.compile(r"^(?P<s>\w+)_icv\.txt$")
+    FILENAME_SUFFIX = "_icv.txt"
 
-    def __init__(self, path: str):
+    def __init__(
+        self, path: str, filename_match: typing.Optional[typing.Match[str]] = None
+    ):
         super().__init__(path=path)
-        filename_match = self.FILENAME_REGEX.match(self._absolute_path.name)
-        assert filename_match, self._absolute_path
-        self.subject = filename_match.groupdict()["s"]
+        self.subject = self._match_filename(filename_match).groupdict()["s"]
 
     def read_volume_mm3(self) -> float:
-        subject, icv = (
-            self._absolute_path.read_text(encoding="ascii").rstrip().split(" ")
-        )
+        subject, icv = self._read_text().rstrip().split(" ")
         assert subject == self.subject, (subject, self.subject)
         return float(icv)
 
-    def read_volume_series(self) -> pandas.Series:
+    def read_volume_series(self) -> "pandas.Series":
+        import pandas  # pylint: disable=import-outside-toplevel; slow import
+
         return pandas.Series(
             data=[self.read_volume_mm3()],
             name="intercranial_volume_mm^3",
             index=pandas.Index(data=[self.subject], name="subject"),
         )
 
+    @classmethod
+    def read_volume_series_batch(
+        cls,
+        volume_files: typing.Iterable["IntracranialVolumeFile"],
+        jobs: int = 1,
+    ) -> "pandas.Series":
+        """
+        Equivalent to concatenating the series returned by
+        `read_volume_series()` of all `volume_files`,
+        but fills a single preallocated array.
+
+        `jobs > 1` reads multiple files concurrently.
+
+        >>> IntracranialVolumeFile.read_volume_series_batch(
+        >>>     IntracranialVolumeFile.find('/my/ashs/subjects', jobs=8), jobs=8)
+        """
+        # pylint: disable=import-outside-toplevel; slow imports
+        import numpy
+        import pandas
+
+        volume_files = list(volume_files)
+        volumes_mm3 = numpy.empty(len(volume_files), dtype=numpy.float64)
+        # pylint: disable=protected-access; shared with find_volume_files()
+        volume_mm3_iter = freesurfer_volume_reader._map_concurrently(
+            cls.read_volume_mm3, volume_files, jobs=jobs
+        )
+        for volume_file_index, volume_mm3 in enumerate(volume_mm3_iter):
+            volumes_mm3[volume_file_index] = volume_mm3
+        with stats.measure("dataframe"):
+            return pandas.Series(
+                data=volumes_mm3,
+                name="intercranial_volume_mm^3",
+                index=pandas.Index(
+                    data=[f.subject for f in volume_files], dtype=object, name="subject"
+                ),
+            )
+
 
 class HippocampalSubfieldsVolumeFile(freesurfer_volume_reader.SubfieldVolumeFile):
 
+    __slots__ = ("hemisphere", "correction")
+
     # https://sites.google.com/site/hipposubfields/tutorial#TOC-Viewing-ASHS-Segmentation-Results
     FILENAME_PATTERN = (
         r"^(?P<s>\w+)_(?P<h>left|right)"
-        r"_(heur|corr_(?P<c>nogray|usegray))_volumes.txt$"
+        r"_(heur|corr_(?P<c>nogray|usegray))_volumes\.txt$"
     )
     FILENAME_REGEX = re.compile(FILENAME_PATTERN)
+    FILENAME_SUFFIX = "_volumes.txt"
+
+    # pylint: disable=duplicate-code; software-specific
+    VOLUMES_DATAFRAME_COLUMNS = (
+        "subfield",
+        "volume_mm^3",
+        "subject",
+        "hemisphere",
+        "correction",
+    )
 
-    def __init__(self, path: str):
+    def __init__(
+        self, path: str, filename_match: typing.Optional[typing.Match[str]] = None
+    ):
         super().__init__(path=path)
-        filename_match = self.FILENAME_REGEX.match(self._absolute_path.name)
-        assert filename_match, self._absolute_path
-        filename_groups = filename_match.groupdict()
+        filename_groups = self._match_filename(filename_match).groupdict()
         self.subject = filename_groups["s"]
         self.hemisphere = filename_groups["h"]
         self.correction = filename_groups["c"]
 
     def read_volumes_mm3(self) -> typing.Dict[str, float]:
+        return self._read_parsed_volumes_mm3()
+
+    def _parse_volumes_mm3(self, volumes_text: str) -> typing.Dict[str, float]:
         subfield_volumes = {}
-        for line in (
-            self._absolute_path.read_text(encoding="ascii").rstrip().split("\n")
-        ):
-            # > echo $ASHS_SUBJID $side $SUB $NBODY $VSUB >> $FNBODYVOL
-            # https://github.com/pyushkevich/ashs/blob/515ff7c2f50928adabc4e64bded9a7e76fc750b1/bin/ashs_extractstats_qsub.sh#L94
-            (
-                subject,
-                hemisphere,
-                subfield_name,
-                slices_number_str,
-                volume_mm3_str,
-            ) = line.split(" ")
-            assert self.subject == subject
-            assert self.hemisphere == hemisphere
-            assert int(slices_number_str) >= 0
-            subfield_volumes[subfield_name] = float(volume_mm3_str)
+        with stats.measure("parse"):
+            for line in volumes_text.rstrip().split("\n"):
+                # > echo $ASHS_SUBJID $side $SUB $NBODY $VSUB >> $FNBODYVOL
+                # https://github.com/pyushkevich/ashs/blob/515ff7c2f50928adabc4e64bded9a7e76fc750b1/bin/ashs_extractstats_qsub.sh#L94
+                (
+                    subject,
+                    hemisphere,
+                    subfield_name,
+                    slices_number_str,
+                    volume_mm3_str,
+                ) = line.split(" ")
+                assert self.subject == subject
+                assert self.hemisphere == hemisphere
+                assert int(slices_number_str) >= 0
+                subfield_volumes[subfield_name] = float(volume_mm3_str)
         return subfield_volumes
 
-    def read_volumes_dataframe(self) -> pandas.DataFrame:
-        volumes_frame = self._read_volume_series().reset_index()
-        # pylint: disable=duplicate-code; software-specific
-        volumes_frame["subject"] = self.subject
-        volumes_frame["hemisphere"] = self.hemisphere
-        volumes_frame["correction"] = self.correction
-        return volumes_frame
+    def read_volumes_dataframe(self) -> "pandas.DataFrame":
+        return self.build_volumes_dataframe(self.read_volumes_mm3())
+
+    def _volumes_dataframe_attributes(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "subject": self.subject,
+            "hemisphere": self.hemisphere,
+            "correction": self.correction,
+        }
+
+    @classmethod
+    def read_volumes_dataframe_batch(
+        cls, volume_files: typing.Iterable[freesurfer_volume_reader.SubfieldVolumeFile]
+    ) -> "pandas.DataFrame":
+        """
+        Equivalent to concatenating the dataframes returned by
+        `read_volumes_dataframe()` of all `volume_files` (with a fresh index),
+        but builds the dataframe at once from flat lists.
+        """
+        import pandas  # pylint: disable=import-outside-toplevel; slow import
+
+        columns: typing.Dict[str, list] = {c: [] for c in cls.VOLUMES_DATAFRAME_COLUMNS}
+        for volume_file in volume_files:
+            assert isinstance(volume_file, cls)
+            subfield_volumes = volume_file.read_volumes_mm3()
+            columns["subfield"].extend(subfield_volumes.keys())
+            columns["volume_mm^3"].extend(subfield_volumes.values())
+            for column, value in [
+                ("subject", volume_file.subject),
+                ("hemisphere", volume_file.hemisphere),
+                ("correction", volume_file.correction),
+            ]:
+                columns[column].extend([value] * len(subfield_volumes))
+        with stats.measure("dataframe"):
+            return pandas.DataFrame(
+                {
+                    c: pandas.Series(
+                        v, dtype="float64" if c == "volume_mm^3" else object
+                    )
+                    for c, v in columns.items()
+                }
+            )
+
+
+class IntracranialVolumeCache:
+    """
+    Intracranial volume per subject directory, read once from the subject's
+    `IntracranialVolumeFile` (registered via `add()` or `join()`).
+
+    Volume files are matched with the intracranial volume file
+    of their subject in the same directory (`{subject}/final/`),
+    so subjects with equal names in other root directories are kept apart.
+    """
+
+    def __init__(self) -> None:
+        self._volume_files: typing.Dict[
+            typing.Tuple[str, str], IntracranialVolumeFile
+        ] = {}
+        self._volumes_mm3: typing.Dict[typing.Tuple[str, str], float] = {}
+
+    @staticmethod
+    def _key(
+        volume_file: freesurfer_volume_reader.VolumeFile,
+    ) -> typing.Tuple[str, str]:
+        return os.path.dirname(volume_file.absolute_path), volume_file.subject
+
+    def add(self, volume_file: IntracranialVolumeFile) -> None:
+        self._volume_files[self._key(volume_file)] = volume_file
+
+    def __contains__(self, volume_file: HippocampalSubfieldsVolumeFile) -> bool:
+        return self._key(volume_file) in self._volume_files
+
+    def join(
+        self, volume_files: typing.Iterable[freesurfer_volume_reader.VolumeFile]
+    ) -> typing.Iterator[freesurfer_volume_reader.VolumeFile]:
+        """
+        Adds all `IntracranialVolumeFile` in `volume_files` (e.g., found by
+        a single search for multiple classes via `find_volume_files()`)
+        and yields all others.
+
+        `HippocampalSubfieldsVolumeFile` are held back until the subject's
+        intracranial volume file was found (or `volume_files` is exhausted).
+        """
+        held_volume_files: typing.Dict[
+            typing.Tuple[str, str], typing.List[HippocampalSubfieldsVolumeFile]
+        ] = {}
+        for volume_file in volume_files:
+            if isinstance(volume_file, IntracranialVolumeFile):
+                self.add(volume_file)
+                yield from held_volume_files.pop(self._key(volume_file), [])
+            elif (
+                isinstance(volume_file, HippocampalSubfieldsVolumeFile)
+                and volume_file not in self
+            ):
+                held_volume_files.setdefault(self._key(volume_file), []).append(
+                    volume_file
+                )
+            else:
+                yield volume_file
+        for subject_volume_files in held_volume_files.values():
+            yield from subject_volume_files
+
+    def read_volume_mm3(self, volume_file: HippocampalSubfieldsVolumeFile) -> float:
+        """
+        Intracranial volume of the subject of `volume_file`.
+
+        Returns NaN if no intracranial volume file was added for the subject
+        in the directory of `volume_file`.
+        """
+        key = self._key(volume_file)
+        volume_mm3 = self._volumes_mm3.get(key)
+        if volume_mm3 is None:
+            icv_file = self._volume_files.get(key)
+            volume_mm3 = math.nan if icv_file is None else icv_file.read_volume_mm3()
+            self._volumes_mm3[key] = volume_mm3
+        return volume_mm3
+
+    def add_volume_columns(
+        self,
+        volumes_frame: "pandas.DataFrame",
+        volume_file: HippocampalSubfieldsVolumeFile,
+    ) -> None:
+        """
+        Adds columns "intercranial_volume_mm^3" & "volume_icv_ratio"
+        (`volume_mm^3 / intercranial_volume_mm^3`) to the dataframe
+        returned by `volume_file.read_volumes_dataframe()`.
+        """
+        volumes_frame["intercranial_volume_mm^3"] = self.read_volume_mm3(volume_file)
+        volumes_frame["intercranial_volume_mm^3"] = volumes_frame[
+            "intercranial_volume_mm^3"
+        ].astype("float64")
+        volumes_frame["volume_icv_ratio"] = (
+            volumes_frame["volume_mm^3"] / volumes_frame["intercranial_volume_mm^3"]
+        )
+
+
+def read_aggregated_volumes_dataframe(
+    path: str, chunk_rows: int = 2**20
+) -> "pandas.DataFrame":
+    """
+    Read a file of concatenated ashs volume files
+    (lines of "{subject} {hemisphere} {subfield} {slices number} {volume}").
+
+    The file is memory-mapped and parsed in chunks of `chunk_rows` lines,
+    so its text is never held in memory at once.
+    Columns "subject", "hemisphere" & "subfield" are categorical.
+    """
+    # pylint: disable=import-outside-toplevel; slow imports
+    import pandas
+    from pandas.api.types import union_categoricals
+
+    columns = ["subfield", "volume_mm^3", "subject", "hemisphere", "slices_number"]
+    dtypes = {
+        "subfield": "category",
+        "volume_mm^3": "float64",
+        "subject": "category",
+        "hemisphere": "category",
+        "slices_number": "int64",
+    }
+    if not os.path.getsize(path):  # rejected by pandas.read_csv()
+        return pandas.DataFrame(columns=columns).astype(dtypes)
+    try:
+        chunks = list(
+            pandas.read_csv(
+                path,
+                sep=" ",
+                header=None,
+                names=[
+                    "subject",
+                    "hemisphere",
+                    "subfield",
+                    "slices_number",
+                    "volume_mm^3",
+                ],
+                index_col=False,
+                dtype=dtypes,
+                quoting=csv.QUOTE_NONE,
+                na_filter=False,
+                float_precision="round_trip",
+                memory_map=True,
+                chunksize=chunk_rows,
+            )
+        )
+    except ValueError as exc:
+        raise ValueError(f"unexpected format of {path}") from exc
+    if any((c["slices_number"] < 0).any() for c in chunks):
+        raise ValueError(f"negative number of slices in {path}")
+    return pandas.DataFrame(
+        {
+            # categories of chunks differ
+            c: (
+                union_categoricals([chunk[c] for chunk in chunks])
+                if dtypes[c] == "category"
+                else pandas.concat([chunk[c] for chunk in chunks], ignore_index=True)
+            )
+            for c in columns
+        },
+        columns=columns,
+    )
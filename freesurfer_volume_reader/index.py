@@ -0,0 +1,170 @@
+"""
+Persistent index of directory listings & parsed volumes
+
+Subsequent searches only list directories whose mtime changed
+and only parse volume files whose size or mtime changed.
+
+>>> from freesurfer_volume_reader import freesurfer
+>>> from freesurfer_volume_reader.index import VolumeIndex
+>>>
+>>> with VolumeIndex('/my/cache/volume-index.sqlite3') as index:
+>>>     for volume_file in freesurfer.HippocampalSubfieldsVolumeFile.find(
+>>>             '/my/freesurfer/subjects', index=index):
+>>>         print(index.read_volumes_mm3(volume_file))
+>>>         print(index.read_volumes_dataframe(volume_file))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+import freesurfer_volume_reader
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas
+
+# modifications within the same timestamp granularity may go unnoticed,
+# so recently modified directories & files are not considered up to date
+_RACY_INTERVAL_NS = 2 * 10**9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    listing TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS volume_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER,
+    volumes TEXT NOT NULL
+);
+"""
+
+
+def _reliable_mtime_ns(mtime_ns: int) -> typing.Optional[int]:
+    return mtime_ns if time.time_ns() - mtime_ns >= _RACY_INTERVAL_NS else None
+
+
+class VolumeIndex:
+    """
+    SQLite database at `path` (created if missing).
+
+    Safe to be used by multiple threads of one process.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "VolumeIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _forget(self, path: str) -> None:
+        # sqlite's LIKE would interpret "%" & "_" in paths
+        prefix = os.path.join(path, "")
+        for table in ["directories", "volume_files"]:
+            self._connection.execute(
+                f"DELETE FROM {table} WHERE path = ? OR substr(path, 1, ?) = ?",
+                (path, len(prefix), prefix),
+            )
+
+    def scan_dir(
+        self, dir_path: str
+    ) -> typing.Optional[
+        typing.Tuple[typing.List[str], typing.List[str], typing.List[str]]
+    ]:
+        """
+        Returns `(dirnames, filenames, paths of subdirectories to descend into)`
+        or `None` if `dir_path` is not a readable directory.
+        """
+        # pylint: disable=protected-access; shared with VolumeFile.find()
+        key = os.path.abspath(dir_path)
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT mtime_ns, listing FROM directories WHERE path = ?", (key,)
+            ).fetchone()
+        if row is not None and mtime_ns is not None and row[0] == mtime_ns:
+            dirnames, filenames, subdir_names = json.loads(row[1])
+            return (
+                dirnames,
+                filenames,
+                [os.path.join(dir_path, n) for n in subdir_names],
+            )
+        scan = (
+            freesurfer_volume_reader._scan_dir(dir_path)
+            if mtime_ns is not None
+            else None
+        )
+        with self._lock, self._connection:
+            if row is not None:
+                previous_dirnames, previous_filenames, _ = json.loads(row[1])
+                current_names = set(scan[0] + scan[1]) if scan else set()
+                for name in set(previous_dirnames + previous_filenames):
+                    if name not in current_names:
+                        self._forget(os.path.join(key, name))
+            if scan is None:
+                self._connection.execute(
+                    "DELETE FROM directories WHERE path = ?", (key,)
+                )
+                return None
+            assert mtime_ns is not None
+            self._connection.execute(
+                "INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+                (
+                    key,
+                    _reliable_mtime_ns(mtime_ns),
+                    json.dumps(
+                        [scan[0], scan[1], [os.path.basename(p) for p in scan[2]]]
+                    ),
+                ),
+            )
+        return scan
+
+    def read_volumes_mm3(
+        self, volume_file: freesurfer_volume_reader.SubfieldVolumeFile
+    ) -> typing.Dict[str, float]:
+        """
+        `volume_file.read_volumes_mm3()`, skipped if the file's size & mtime
+        did not change since the last call.
+        """
+        stat = os.stat(volume_file.absolute_path)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, volumes FROM volume_files WHERE path = ?",
+                (volume_file.absolute_path,),
+            ).fetchone()
+        if row is not None and row[:2] == (stat.st_size, stat.st_mtime_ns):
+            return json.loads(row[2])
+        subfield_volumes = volume_file.read_volumes_mm3()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO volume_files VALUES (?, ?, ?, ?)",
+                (
+                    volume_file.absolute_path,
+                    stat.st_size,
+                    _reliable_mtime_ns(stat.st_mtime_ns),
+                    json.dumps(subfield_volumes),
+                ),
+            )
+        return subfield_volumes
+
+    def read_volumes_dataframe(
+        self, volume_file: freesurfer_volume_reader.SubfieldVolumeFile
+    ) -> "pandas.DataFrame":
+        return volume_file.build_volumes_dataframe(self.read_volumes_mm3(volume_file))
@@ -0,0 +1,113 @@
+"""
+Count processed directories, files & bytes and measure wall time per stage
+(walk, match, read, parse, dataframe, concat & write)
+
+>>> from freesurfer_volume_reader import freesurfer, stats
+>>>
+>>> with stats.collect() as run_stats:
+>>>     for volume_file in freesurfer.HippocampalSubfieldsVolumeFile.find(
+>>>             '/my/freesurfer/subjects'):
+>>>         volume_file.read_volumes_dataframe()
+>>> print(run_stats.counters['directories'], run_stats.stage_seconds['read'])
+>>> print(run_stats.format())
+"""
+
+import collections
+import contextlib
+import threading
+import time
+import typing
+
+STAGES = ("walk", "match", "read", "parse", "dataframe", "concat", "write")
+COUNTERS = ("directories", "files_matched", "files_read", "bytes_read")
+
+
+class Stats:
+    """
+    Stages are measured exclusively:
+    time spent in a nested stage (e.g. "read" within "parse")
+    only counts towards the nested one.
+
+    Times of concurrent threads add up,
+    stages run in other processes are not measured.
+    """
+
+    def __init__(self) -> None:
+        self.counters: typing.Counter[str] = collections.Counter()
+        self.stage_seconds: typing.DefaultDict[str, float] = collections.defaultdict(
+            float
+        )
+        self.wall_seconds: typing.Optional[float] = None
+        self._lock = threading.Lock()
+        # per thread: stack of [stage, start of not yet added time]
+        self._local = threading.local()
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def _add_seconds(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] += seconds
+
+    @contextlib.contextmanager
+    def measure(self, stage: str) -> typing.Iterator[None]:
+        stack = self._local.__dict__.setdefault("stack", [])
+        start_time = time.perf_counter()
+        if stack:
+            self._add_seconds(stack[-1][0], start_time - stack[-1][1])
+        stack.append([stage, start_time])
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter()
+            self._add_seconds(stage, end_time - stack.pop()[1])
+            if stack:
+                stack[-1][1] = end_time
+
+    def format(self) -> str:
+        lines = [
+            f"{stage} seconds: {self.stage_seconds.get(stage, 0):.6f}"
+            for stage in STAGES
+        ]
+        if self.wall_seconds is not None:
+            lines.append(f"wall seconds: {self.wall_seconds:.6f}")
+        lines.extend(f"{name}: {self.counters[name]}" for name in COUNTERS)
+        return "\n".join(lines)
+
+
+_ACTIVE_STATS: typing.Optional[Stats] = None
+
+
+@contextlib.contextmanager
+def collect(stats: typing.Optional[Stats] = None) -> typing.Iterator[Stats]:
+    """
+    Collects stats of all threads of this process until exit.
+    """
+    global _ACTIVE_STATS  # pylint: disable=global-statement; read by count() & measure()
+    if stats is None:
+        stats = Stats()
+    previous_stats, _ACTIVE_STATS = _ACTIVE_STATS, stats
+    start_time = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.wall_seconds = time.perf_counter() - start_time
+        _ACTIVE_STATS = previous_stats
+
+
+def count(name: str, value: int = 1) -> None:
+    """
+    No-op unless within `collect()`.
+    """
+    if _ACTIVE_STATS is not None:
+        _ACTIVE_STATS.count(name, value)
+
+
+def measure(stage: str) -> typing.ContextManager[None]:
+    """
+    No-op unless within `collect()`.
+    """
+    if _ACTIVE_STATS is None:
+        return contextlib.nullcontext()
+    return _ACTIVE_STATS.measure(stage)
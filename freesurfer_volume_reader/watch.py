@@ -0,0 +1,345 @@
+"""
+Watch directories for new & modified volume files
+
+Changes are detected via inotify on linux
+(otherwise or if inotify is not available by repeated searches).
+
+>>> from freesurfer_volume_reader import freesurfer
+>>> from freesurfer_volume_reader.watch import watch_volume_files
+>>>
+>>> for volume_files in watch_volume_files(
+>>>         ['/my/freesurfer/subjects'],
+>>>         volume_file_classes=[freesurfer.HippocampalSubfieldsVolumeFile]):
+>>>     for volume_file in volume_files:
+>>>         print(volume_file.read_volumes_dataframe())
+"""
+
+import ctypes
+import errno
+import os
+import select
+import struct
+import sys
+import time
+import typing
+
+import freesurfer_volume_reader
+
+# pylint: disable=protected-access; shares matching logic with find_volume_files()
+_FilenameMatch = freesurfer_volume_reader._FilenameMatch
+_ClassRegexs = typing.List[
+    typing.Tuple[typing.Type[freesurfer_volume_reader.VolumeFile], typing.Pattern[str]]
+]
+
+# linux/inotify.h
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004  # e.g. mtime set by rsync
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+# struct inotify_event {int wd; uint32_t mask, cookie, len; char name[];}
+_INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _PollingWatcher:
+    def __init__(
+        self,
+        root_dir_paths: typing.List[str],
+        volume_file_classes: typing.List[
+            typing.Type[freesurfer_volume_reader.VolumeFile]
+        ],
+        filename_regexs: typing.Optional[
+            typing.Mapping[
+                typing.Type[freesurfer_volume_reader.VolumeFile], typing.Pattern
+            ]
+        ],
+        jobs: int,
+        interval_seconds: float,
+    ) -> None:
+        # pylint: disable=too-many-arguments; see watch_volume_files()
+        self._root_dir_paths = root_dir_paths
+        self._volume_file_classes = volume_file_classes
+        self._filename_regexs = filename_regexs
+        self._jobs = jobs
+        self._interval_seconds = interval_seconds
+        self._next_search_time = 0.0
+
+    def close(self) -> None:
+        pass
+
+    def wait(self, timeout_seconds: float) -> typing.List[_FilenameMatch]:
+        """
+        Returns all volume files, if a search is due within `timeout_seconds`.
+        """
+        time.sleep(
+            max(0, min(timeout_seconds, self._next_search_time - time.monotonic()))
+        )
+        if time.monotonic() < self._next_search_time:
+            return []
+        self._next_search_time = time.monotonic() + self._interval_seconds
+        return [
+            m
+            for root_dir_path in self._root_dir_paths
+            for m in freesurfer_volume_reader._find_filename_matches(
+                root_dir_path,
+                self._volume_file_classes,
+                filename_regexs=self._filename_regexs,
+                jobs=self._jobs,
+            )
+        ]
+
+
+class _InotifyWatcher:
+    def __init__(
+        self, root_dir_paths: typing.List[str], class_regexs: _ClassRegexs
+    ) -> None:
+        self._root_dir_paths = root_dir_paths
+        self._class_regexs = class_regexs
+        # raises AttributeError if libc does not provide inotify
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._inotify_add_watch = self._libc.inotify_add_watch
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        self._dir_paths: typing.Dict[int, str] = {}
+        self._initial_matches: typing.List[_FilenameMatch] = []
+        try:
+            for root_dir_path in root_dir_paths:
+                self._initial_matches.extend(
+                    self._watch_tree(os.path.abspath(root_dir_path))
+                )
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def _watch_tree(self, dir_path: str) -> typing.Iterator[_FilenameMatch]:
+        # watch before listing, so files created in the meantime are not missed
+        watch_descriptor = self._inotify_add_watch(
+            self._fd, os.fsencode(dir_path), _IN_WATCH_MASK
+        )
+        if watch_descriptor < 0:
+            error_number = ctypes.get_errno()
+            if error_number in {errno.ENOENT, errno.ENOTDIR}:  # pragma: no cover
+                return  # removed in the meantime
+            # e.g. ENOSPC: exceeded fs.inotify.max_user_watches
+            raise OSError(error_number, os.strerror(error_number), dir_path)
+        self._dir_paths[watch_descriptor] = dir_path
+        scan = freesurfer_volume_reader._scan_dir(dir_path)
+        if scan is None:  # pragma: no cover
+            return
+        _, filenames, subdir_paths = scan
+        for filename in filenames:
+            yield from freesurfer_volume_reader._match_filename(
+                dir_path, filename, self._class_regexs
+            )
+        for subdir_path in subdir_paths:
+            yield from self._watch_tree(subdir_path)
+
+    def _read_events(
+        self, timeout_seconds: float
+    ) -> typing.Iterator[typing.Tuple[int, int, bytes]]:
+        if not select.select([self._fd], [], [], timeout_seconds)[0]:
+            return
+        while True:
+            try:
+                buffer = os.read(self._fd, 2**16)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(buffer):
+                watch_descriptor, mask, _, name_length = (
+                    _INOTIFY_EVENT_HEADER.unpack_from(buffer, offset)
+                )
+                offset += _INOTIFY_EVENT_HEADER.size
+                yield (
+                    watch_descriptor,
+                    mask,
+                    buffer[offset : offset + name_length].rstrip(b"\0"),
+                )
+                offset += name_length
+
+    def wait(self, timeout_seconds: float) -> typing.List[_FilenameMatch]:
+        """
+        Returns volume files created, modified or removed within `timeout_seconds`
+        (and all volume files found on the first call).
+        """
+        matches, self._initial_matches = self._initial_matches, []
+        for watch_descriptor, mask, name in self._read_events(
+            0 if matches else timeout_seconds
+        ):
+            if mask & _IN_Q_OVERFLOW:  # pragma: no cover
+                for root_dir_path in self._root_dir_paths:
+                    matches.extend(self._watch_tree(os.path.abspath(root_dir_path)))
+                continue
+            if mask & _IN_IGNORED:
+                self._dir_paths.pop(watch_descriptor, None)
+                continue
+            dir_path = self._dir_paths.get(watch_descriptor)
+            if dir_path is None:  # pragma: no cover
+                continue
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    matches.extend(
+                        self._watch_tree(os.path.join(dir_path, os.fsdecode(name)))
+                    )
+                continue
+            matches.extend(
+                freesurfer_volume_reader._match_filename(
+                    dir_path, os.fsdecode(name), self._class_regexs
+                )
+            )
+        return matches
+
+
+class _Debouncer:
+    """
+    Tracks volume files until their mtime is at least `debounce_seconds` ago.
+    """
+
+    def __init__(self, debounce_seconds: float) -> None:
+        self._debounce_ns = int(debounce_seconds * 10**9)
+        self._pending: typing.Dict[str, freesurfer_volume_reader.VolumeFile] = {}
+        # (size, mtime) of previously settled files
+        self._settled: typing.Dict[str, typing.Tuple[int, int]] = {}
+        self._next_settle_time_ns: typing.Optional[int] = None
+
+    def add(self, matches: typing.Iterable[_FilenameMatch]) -> None:
+        for volume_file_class, path, filename_match in matches:
+            if path not in self._pending:
+                self._pending[path] = volume_file_class(
+                    path=path, filename_match=filename_match
+                )
+
+    def pop_settled(self) -> typing.List[freesurfer_volume_reader.VolumeFile]:
+        settled_volume_files = []
+        now_ns = time.time_ns()
+        self._next_settle_time_ns = None
+        for path, volume_file in list(self._pending.items()):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                del self._pending[path]
+                self._settled.pop(path, None)
+                continue
+            if self._settled.get(path) == (stat.st_size, stat.st_mtime_ns):
+                del self._pending[path]
+            elif now_ns - stat.st_mtime_ns >= self._debounce_ns:
+                del self._pending[path]
+                self._settled[path] = (stat.st_size, stat.st_mtime_ns)
+                settled_volume_files.append(volume_file)
+            else:
+                settle_time_ns = stat.st_mtime_ns + self._debounce_ns
+                self._next_settle_time_ns = min(
+                    self._next_settle_time_ns or settle_time_ns, settle_time_ns
+                )
+        return settled_volume_files
+
+    def timeout_seconds(self, default: float) -> float:
+        if self._next_settle_time_ns is None:
+            return default
+        return max(
+            0, min(default, (self._next_settle_time_ns - time.time_ns()) / 10**9)
+        )
+
+
+def _start_watcher(  # pylint: disable=too-many-arguments; see watch_volume_files()
+    root_dir_paths: typing.List[str],
+    volume_file_classes: typing.List[typing.Type[freesurfer_volume_reader.VolumeFile]],
+    *,
+    filename_regexs: typing.Optional[
+        typing.Mapping[typing.Type[freesurfer_volume_reader.VolumeFile], typing.Pattern]
+    ],
+    jobs: int,
+    interval_seconds: float,
+    use_inotify: typing.Optional[bool],
+) -> typing.Union[_InotifyWatcher, _PollingWatcher]:
+    if use_inotify is not False and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(
+                root_dir_paths,
+                class_regexs=[
+                    (c, (filename_regexs or {}).get(c, c.FILENAME_REGEX))
+                    for c in volume_file_classes
+                ],
+            )
+        except (AttributeError, OSError):
+            if use_inotify:
+                raise
+    elif use_inotify:
+        # like failures to initialize inotify on linux
+        raise OSError("inotify is only available on linux")
+    return _PollingWatcher(
+        root_dir_paths,
+        volume_file_classes,
+        filename_regexs=filename_regexs,
+        jobs=jobs,
+        interval_seconds=interval_seconds,
+    )
+
+
+def watch_volume_files(  # pylint: disable=too-many-arguments; see find_volume_files()
+    root_dir_paths: typing.Iterable[str],
+    volume_file_classes: typing.Iterable[
+        typing.Type[freesurfer_volume_reader.VolumeFile]
+    ],
+    *,
+    filename_regexs: typing.Optional[
+        typing.Mapping[typing.Type[freesurfer_volume_reader.VolumeFile], typing.Pattern]
+    ] = None,
+    jobs: int = 1,
+    debounce_seconds: float = 2.0,
+    interval_seconds: float = 5.0,
+    use_inotify: typing.Optional[bool] = None,
+) -> typing.Iterator[typing.List[freesurfer_volume_reader.VolumeFile]]:
+    """
+    Yields lists of volume files in `root_dir_paths` (never ending):
+    first all existing ones, then new & modified ones as they appear.
+
+    Volume files are only yielded once their mtime is at least
+    `debounce_seconds` ago, skipping files which are still being written.
+
+    `use_inotify=None` falls back to searching all `root_dir_paths`
+    (with `jobs`, see `find_volume_files()`) every `interval_seconds`,
+    if inotify is not available.
+    `use_inotify=True` raises `OSError` instead.
+    """
+    root_dir_paths = list(root_dir_paths)
+    volume_file_classes = list(volume_file_classes)
+    watcher = _start_watcher(
+        root_dir_paths,
+        volume_file_classes,
+        filename_regexs=filename_regexs,
+        jobs=jobs,
+        interval_seconds=interval_seconds,
+        use_inotify=use_inotify,
+    )
+    debouncer = _Debouncer(debounce_seconds=debounce_seconds)
+    try:
+        while True:
+            debouncer.add(
+                watcher.wait(
+                    timeout_seconds=debouncer.timeout_seconds(interval_seconds)
+                )
+            )
+            settled_volume_files = debouncer.pop_settled()
+            if settled_volume_files:
+                yield settled_volume_files
+    finally:
+        watcher.close()
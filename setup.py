@@ -53,8 +53,13 @@ setuptools.setup(
     install_requires=[
         # >=0.21.0 pandas.DataFrame.drop(columns=[...], ...)
         # <0.23 untested
-        "pandas>=0.23.0,<2"
+        "numpy",
+        "pandas>=0.23.0,<2",
     ],
+    extras_require={
+        # --output-format parquet / feather / arrow-ipc
+        "arrow": ["pyarrow"]
+    },
     setup_requires=["setuptools_scm"],
     tests_require=["pytest<5", "pytest-timeout<2"],
 )
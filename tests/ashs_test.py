@@ -1,14 +1,19 @@
 # pylint: disable=missing-module-docstring
 
+import math
 import os
 import re
+import unittest.mock
 
 import pandas
 import pytest
 
+from freesurfer_volume_reader import find_volume_files
 from freesurfer_volume_reader.ashs import (
+    IntracranialVolumeCache,
     IntracranialVolumeFile,
     HippocampalSubfieldsVolumeFile,
+    read_aggregated_volumes_dataframe,
 )
 
 # pylint: disable=wrong-import-order; false positive
@@ -128,6 +133,36 @@ def test_intracranial_volume_file_read_volume_series_concat(
     )
 
 
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_intracranial_volume_file_read_volume_series_batch(jobs):
+    volume_files = list(IntracranialVolumeFile.find(SUBJECTS_DIR)) * 4
+    volume_series = IntracranialVolumeFile.read_volume_series_batch(
+        volume_files, jobs=jobs
+    )
+    pandas.testing.assert_series_equal(
+        left=pandas.concat(f.read_volume_series() for f in volume_files),
+        right=volume_series,
+        check_dtype=True,
+        check_names=True,
+    )
+
+
+def test_intracranial_volume_file_read_volume_series_batch_empty():
+    volume_series = IntracranialVolumeFile.read_volume_series_batch([])
+    assert volume_series.empty
+    assert volume_series.dtype == "float64"
+    assert volume_series.name == "intercranial_volume_mm^3"
+    assert volume_series.index.name == "subject"
+
+
+def test_intracranial_volume_file_read_volume_series_batch_not_found():
+    volume_file = IntracranialVolumeFile(
+        path=os.path.join(SUBJECTS_DIR, "bert", "final", "BERT_icv.txt")
+    )
+    with pytest.raises(FileNotFoundError):
+        IntracranialVolumeFile.read_volume_series_batch([volume_file], jobs=2)
+
+
 @pytest.mark.parametrize(
     "volume_file_path", [os.path.join(SUBJECTS_DIR, "bert", "final", "BERT_icv.txt")]
 )
@@ -325,9 +360,39 @@ def test_hippocampal_subfields_volume_file_read_volumes_dataframe(
     volume_file_path: str, expected_dataframe: pandas.DataFrame
 ):
     volume_file = HippocampalSubfieldsVolumeFile(path=volume_file_path)
-    assert_volume_frames_equal(
-        left=expected_dataframe, right=volume_file.read_volumes_dataframe()
+    volumes_frame = volume_file.read_volumes_dataframe()
+    assert HippocampalSubfieldsVolumeFile.VOLUMES_DATAFRAME_COLUMNS == tuple(
+        volumes_frame.columns
+    )
+    assert_volume_frames_equal(left=expected_dataframe, right=volumes_frame)
+
+
+@pytest.mark.parametrize(
+    "root_dir_path", [SUBJECTS_DIR, os.path.join(SUBJECTS_DIR, "alice")]
+)
+def test_hippocampal_subfields_volume_file_read_volumes_dataframe_batch(
+    root_dir_path,
+):
+    volume_files = list(HippocampalSubfieldsVolumeFile.find(root_dir_path)) * 2
+    expected_frame = pandas.concat(
+        [f.read_volumes_dataframe() for f in volume_files], ignore_index=True
     )
+    pandas.testing.assert_frame_equal(
+        expected_frame,
+        HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch(iter(volume_files)),
+    )
+
+
+def test_hippocampal_subfields_volume_file_read_volumes_dataframe_batch_empty():
+    batch_frame = HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch([])
+    assert batch_frame.empty
+    assert batch_frame.dtypes.to_dict() == {
+        "subfield": "object",
+        "volume_mm^3": "float64",
+        "subject": "object",
+        "hemisphere": "object",
+        "correction": "object",
+    }
 
 
 def test_hippocampal_subfields_volume_file_read_volumes_dataframe_not_found():
@@ -396,9 +461,12 @@ def test_hippocampal_subfields_volume_file_read_volumes_dataframe_not_found():
         ),
     ],
 )
-def test_hippocampal_subfields_volume_file_find(root_dir_path, expected_file_paths):
+@pytest.mark.parametrize("subjects_dir_layout", [False, True])
+def test_hippocampal_subfields_volume_file_find(
+    root_dir_path, expected_file_paths, subjects_dir_layout
+):
     volume_files_iterator = HippocampalSubfieldsVolumeFile.find(
-        root_dir_path=root_dir_path
+        root_dir_path=root_dir_path, subjects_dir_layout=subjects_dir_layout
     )
     assert expected_file_paths == set(f.absolute_path for f in volume_files_iterator)
 
@@ -439,3 +507,241 @@ def test_hippocampal_subfields_volume_file_find_pattern(
         root_dir_path=root_dir_path, filename_regex=re.compile(filename_pattern)
     )
     assert expected_file_paths == set(f.absolute_path for f in volume_files_iterator)
+
+
+@pytest.mark.parametrize(
+    ("subject", "expected_filenames"),
+    [
+        (
+            "alice",
+            {"alice_left_corr_nogray_volumes.txt", "alice_left_heur_volumes.txt"},
+        ),
+        (
+            "bert",
+            {
+                "bert_left_corr_nogray_volumes.txt",
+                "bert_left_corr_usegray_volumes.txt",
+                "bert_left_heur_volumes.txt",
+                "bert_right_corr_nogray_volumes.txt",
+            },
+        ),
+        ("carol", set()),
+    ],
+)
+def test_hippocampal_subfields_volume_file_find_subject(subject, expected_filenames):
+    assert {
+        os.path.join(SUBJECTS_DIR, subject, "final", n) for n in expected_filenames
+    } == {
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find_subject(SUBJECTS_DIR, subject)
+    }
+
+
+def test_hippocampal_subfields_volume_file_find_subject_prefix(tmp_path):
+    for file_path in [
+        "bert/final/bert_left_heur_volumes.txt",
+        "bert/final/bert2_left_heur_volumes.txt",
+        "bert/final/alice_left_heur_volumes.txt",
+        "bert/bert_right_heur_volumes.txt",
+        "bert2/final/bert_right_corr_usegray_volumes.txt",
+        "bert2/final/bert2_right_corr_nogray_volumes.txt",
+    ]:
+        tmp_path.joinpath(file_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file_path).write_text("")
+    assert {
+        "bert/final/bert_left_heur_volumes.txt",
+        "bert/bert_right_heur_volumes.txt",
+    } == {
+        os.path.relpath(f.absolute_path, tmp_path).replace(os.sep, "/")
+        for f in HippocampalSubfieldsVolumeFile.find_subject(str(tmp_path), "bert")
+    }
+    assert [
+        ("bert", "left", None),
+        ("bert", "right", None),
+        ("bert2", "right", "nogray"),
+    ] == sorted(
+        (f.subject, f.hemisphere, f.correction)
+        for f in HippocampalSubfieldsVolumeFile.find_subjects(
+            str(tmp_path), subjects=["bert2", "bert"]
+        )
+    )
+
+
+@pytest.fixture(name="aggregated_volumes_path")
+def _aggregated_volumes_path_fixture(tmp_path) -> str:
+    path = tmp_path.joinpath("volumes.txt")
+    with path.open("w", encoding="ascii") as aggregated_file:
+        for volume_file in HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR):
+            with open(
+                volume_file.absolute_path, encoding="ascii"
+            ) as volume_file_stream:
+                aggregated_file.write(volume_file_stream.read().rstrip() + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 3, 1000])
+def test_read_aggregated_volumes_dataframe(aggregated_volumes_path, chunk_rows):
+    volumes_frame = read_aggregated_volumes_dataframe(
+        aggregated_volumes_path, chunk_rows=chunk_rows
+    )
+    assert [
+        "subfield",
+        "volume_mm^3",
+        "subject",
+        "hemisphere",
+        "slices_number",
+    ] == list(volumes_frame.columns)
+    assert all(
+        volumes_frame[c].dtype == "category"
+        for c in ["subfield", "subject", "hemisphere"]
+    )
+    assert volumes_frame["slices_number"].dtype == "int64"
+    expected_frame = HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch(
+        HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR)
+    )
+    pandas.testing.assert_frame_equal(
+        expected_frame.drop(columns=["correction"]),
+        volumes_frame.drop(columns=["slices_number"]).astype(object),
+        check_dtype=False,
+    )
+    assert (volumes_frame["slices_number"] > 0).all()
+
+
+def test_read_aggregated_volumes_dataframe_empty(tmp_path):
+    tmp_path.joinpath("volumes.txt").write_text("")
+    volumes_frame = read_aggregated_volumes_dataframe(
+        str(tmp_path.joinpath("volumes.txt"))
+    )
+    assert volumes_frame.empty
+    assert volumes_frame["volume_mm^3"].dtype == "float64"
+    assert volumes_frame["subject"].dtype == "category"
+
+
+@pytest.mark.parametrize(
+    ("text", "error_pattern"),
+    [
+        ("bert left CA1 22 123.4\nbert left CA2\n", r"^unexpected format of "),
+        ("bert left CA1 22 123.4\nbert left CA2 1 2.0 3\n", r"^unexpected format of "),
+        ("bert left CA1 22 123.4\nbert left CA2 1.5 2.0\n", r"^unexpected format of "),
+        ("bert left CA1 -22 123.4\n", r"^negative number of slices in "),
+    ],
+)
+def test_read_aggregated_volumes_dataframe_invalid(tmp_path, text, error_pattern):
+    tmp_path.joinpath("volumes.txt").write_text(text)
+    with pytest.raises(ValueError, match=error_pattern):
+        read_aggregated_volumes_dataframe(str(tmp_path.joinpath("volumes.txt")))
+
+
+def test_intracranial_volume_cache_join():
+    icv_cache = IntracranialVolumeCache()
+    volume_files = list(
+        icv_cache.join(
+            find_volume_files(
+                SUBJECTS_DIR,
+                volume_file_classes=[
+                    HippocampalSubfieldsVolumeFile,
+                    IntracranialVolumeFile,
+                ],
+            )
+        )
+    )
+    assert set(f.absolute_path for f in volume_files) == set(
+        f.absolute_path for f in HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR)
+    )
+    for volume_file in volume_files:
+        assert volume_file in icv_cache
+    assert (
+        HippocampalSubfieldsVolumeFile(
+            os.path.join(SUBJECTS_DIR, "alice", "alice_left_heur_volumes.txt")
+        )
+        not in icv_cache
+    )
+
+
+def test_intracranial_volume_cache_join_order():
+    bert_icv, alice_icv = [
+        IntracranialVolumeFile(os.path.join(SUBJECTS_DIR, s, "final", f"{s}_icv.txt"))
+        for s in ["bert", "alice"]
+    ]
+    bert_left, bert_right, alice_left, carol_left = [
+        HippocampalSubfieldsVolumeFile(
+            os.path.join(SUBJECTS_DIR, s, "final", f"{s}_{h}_heur_volumes.txt")
+        )
+        for s, h in [
+            ("bert", "left"),
+            ("bert", "right"),
+            ("alice", "left"),
+            ("carol", "left"),
+        ]
+    ]
+    icv_cache = IntracranialVolumeCache()
+    assert list(
+        icv_cache.join(
+            [bert_left, alice_icv, carol_left, alice_left, bert_right, bert_icv]
+        )
+    ) == [alice_left, bert_left, bert_right, carol_left]
+
+
+def test_intracranial_volume_cache_read_volume_mm3(tmp_path):
+    icv_cache = IntracranialVolumeCache()
+    icv_cache.add(
+        IntracranialVolumeFile(
+            os.path.join(SUBJECTS_DIR, "bert", "final", "bert_icv.txt")
+        )
+    )
+    bert_left, alice_left, other_bert_left = [
+        HippocampalSubfieldsVolumeFile(
+            os.path.join(root, s, "final", f"{s}_left_heur_volumes.txt")
+        )
+        for root, s in [
+            (SUBJECTS_DIR, "bert"),
+            (SUBJECTS_DIR, "alice"),
+            (str(tmp_path), "bert"),
+        ]
+    ]
+    with unittest.mock.patch.object(
+        IntracranialVolumeFile, "read_volume_mm3", return_value=1234.5
+    ) as read_mock:
+        assert icv_cache.read_volume_mm3(bert_left) == 1234.5
+        assert icv_cache.read_volume_mm3(bert_left) == 1234.5
+    read_mock.assert_called_once_with()
+    assert math.isnan(icv_cache.read_volume_mm3(alice_left))
+    # subject of equal name in another root directory
+    assert math.isnan(icv_cache.read_volume_mm3(other_bert_left))
+
+
+def test_intracranial_volume_cache_add_volume_columns():
+    icv_cache = IntracranialVolumeCache()
+    volume_files = list(
+        icv_cache.join(
+            find_volume_files(
+                SUBJECTS_DIR,
+                volume_file_classes=[
+                    HippocampalSubfieldsVolumeFile,
+                    IntracranialVolumeFile,
+                ],
+            )
+        )
+    )
+    volume_frames = [f.read_volumes_dataframe() for f in volume_files]
+    for volume_file, volume_frame in zip(volume_files, volume_frames):
+        icv_cache.add_volume_columns(volume_frame, volume_file)
+    volumes_frame = pandas.concat(volume_frames, ignore_index=True)
+    expected_frame = volumes_frame.join(
+        pandas.concat(
+            [f.read_volume_series() for f in IntracranialVolumeFile.find(SUBJECTS_DIR)]
+        ),
+        on="subject",
+        rsuffix="_expected",
+    )
+    pandas.testing.assert_series_equal(
+        volumes_frame["intercranial_volume_mm^3"],
+        expected_frame["intercranial_volume_mm^3_expected"],
+        check_names=False,
+    )
+    pandas.testing.assert_series_equal(
+        volumes_frame["volume_icv_ratio"],
+        volumes_frame["volume_mm^3"]
+        / expected_frame["intercranial_volume_mm^3_expected"],
+        check_names=False,
+    )
@@ -1,12 +1,16 @@
 # pylint: disable=missing-module-docstring
 
+import asyncio
 import os
 import re
+import threading
+import unittest.mock
 
 import pandas
 import pytest
 
 from freesurfer_volume_reader.freesurfer import HippocampalSubfieldsVolumeFile
+from freesurfer_volume_reader.index import VolumeIndex
 
 # pylint: disable=wrong-import-order; false positive
 from conftest import SUBJECTS_DIR, assert_volume_frames_equal
@@ -219,12 +223,13 @@ def test_hippocampal_subfields_volume_file_read_volumes_mm3_not_found():
 def test_hippocampal_subfields_volume_file_read_volumes_dataframe(
     volume_file_path: str, expected_dataframe: pandas.DataFrame
 ):
-    assert_volume_frames_equal(
-        left=expected_dataframe,
-        right=HippocampalSubfieldsVolumeFile(
-            path=volume_file_path
-        ).read_volumes_dataframe(),
+    volumes_frame = HippocampalSubfieldsVolumeFile(
+        path=volume_file_path
+    ).read_volumes_dataframe()
+    assert HippocampalSubfieldsVolumeFile.VOLUMES_DATAFRAME_COLUMNS == tuple(
+        volumes_frame.columns
     )
+    assert_volume_frames_equal(left=expected_dataframe, right=volumes_frame)
 
 
 def test_hippocampal_subfields_volume_file_read_volumes_dataframe_not_found():
@@ -235,6 +240,86 @@ def test_hippocampal_subfields_volume_file_read_volumes_dataframe_not_found():
         volume_file.read_volumes_dataframe()
 
 
+@pytest.mark.parametrize(
+    "root_dir_path",
+    [SUBJECTS_DIR, os.path.join(SUBJECTS_DIR, "bert"), os.path.join(os.sep, "missing")],
+)
+def test_hippocampal_subfields_volume_file_read_volumes_dataframe_batch(
+    root_dir_path,
+):
+    volume_files = list(HippocampalSubfieldsVolumeFile.find(root_dir_path)) * 2
+    batch_frame = HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch(
+        iter(volume_files)
+    )
+    assert tuple(batch_frame.columns) == (
+        HippocampalSubfieldsVolumeFile.VOLUMES_DATAFRAME_COLUMNS
+    )
+    if volume_files:
+        pandas.testing.assert_frame_equal(
+            pandas.concat(
+                [f.read_volumes_dataframe() for f in volume_files], ignore_index=True
+            ),
+            batch_frame,
+        )
+    else:
+        assert batch_frame.empty
+
+
+@pytest.mark.parametrize(
+    ("volumes_text", "expected_volumes"),
+    [
+        ("CA1 1.5\nCA3 2\n", {"CA1": 1.5, "CA3": 2.0}),
+        ("CA1 1.5\r\nCA3 2\r\n", {"CA1": 1.5, "CA3": 2.0}),
+        ("CA1 1.5\nCA3 2\nCA1 4.25", {"CA1": 4.25, "CA3": 2.0}),
+    ],
+)
+def test_hippocampal_subfields_volume_file_read_volumes_dataframe_batch_text(
+    tmp_path, volumes_text, expected_volumes
+):
+    volume_file_path = tmp_path.joinpath("bert", "mri", "rh.hippoSfVolumes-T1.v10.txt")
+    volume_file_path.parent.mkdir(parents=True)
+    volume_file_path.write_bytes(volumes_text.encode())
+    volume_file = HippocampalSubfieldsVolumeFile(path=str(volume_file_path))
+    assert volume_file.read_volumes_mm3() == expected_volumes
+    pandas.testing.assert_frame_equal(
+        volume_file.read_volumes_dataframe(),
+        HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch([volume_file]),
+    )
+
+
+@pytest.mark.parametrize(
+    "volumes_text",
+    [
+        "",
+        "CA1\n",
+        "CA1 1.5 2.5\nCA3 2\n",
+        "CA1 1.0 2.0\n3.0\n",
+        "CA1  1.0\n",
+        "CA1\t1.0\n",
+    ],
+)
+def test_hippocampal_subfields_volume_file_read_volumes_dataframe_batch_invalid(
+    tmp_path, volumes_text
+):
+    volume_file_path = tmp_path.joinpath("lh.hippoSfVolumes-T1.v10.txt")
+    volume_file_path.write_text(volumes_text)
+    # rejected by per-file parser as well
+    with pytest.raises(ValueError):
+        HippocampalSubfieldsVolumeFile(path=str(volume_file_path)).read_volumes_mm3()
+    with pytest.raises(ValueError, match=r"^unexpected format of "):
+        HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch(
+            [HippocampalSubfieldsVolumeFile(path=str(volume_file_path))]
+        )
+
+
+def test_hippocampal_subfields_volume_file_read_volumes_dataframe_batch_not_found():
+    volume_file = HippocampalSubfieldsVolumeFile(
+        path=os.path.join(SUBJECTS_DIR, "non-existing", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with pytest.raises(FileNotFoundError):
+        HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch([volume_file])
+
+
 @pytest.mark.parametrize(
     ("root_dir_path", "expected_file_paths"),
     [
@@ -276,9 +361,12 @@ def test_hippocampal_subfields_volume_file_read_volumes_dataframe_not_found():
         ),
     ],
 )
-def test_hippocampal_subfields_volume_file_find(root_dir_path, expected_file_paths):
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_hippocampal_subfields_volume_file_find(
+    root_dir_path, expected_file_paths, jobs
+):
     volume_files = list(
-        HippocampalSubfieldsVolumeFile.find(root_dir_path=root_dir_path)
+        HippocampalSubfieldsVolumeFile.find(root_dir_path=root_dir_path, jobs=jobs)
     )
     assert all(
         "hippoSfVolumes" in os.path.basename(f.absolute_path) for f in volume_files
@@ -286,6 +374,195 @@ def test_hippocampal_subfields_volume_file_find(root_dir_path, expected_file_pat
     assert expected_file_paths == set(f.absolute_path for f in volume_files)
 
 
+@pytest.mark.parametrize(
+    "root_dir_path",
+    [
+        SUBJECTS_DIR,
+        os.path.join(SUBJECTS_DIR, "bert"),
+        os.path.join(SUBJECTS_DIR, "bert", "mri"),
+    ],
+)
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_hippocampal_subfields_volume_file_find_subjects_dir_layout(
+    root_dir_path, jobs
+):
+    assert set(
+        f.absolute_path for f in HippocampalSubfieldsVolumeFile.find(root_dir_path)
+    ) == set(
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find(
+            root_dir_path, jobs=jobs, subjects_dir_layout=True
+        )
+    )
+
+
+def test_hippocampal_subfields_volume_file_find_subjects_dir_layout_pruned(tmp_path):
+    for file_path in [
+        "alice/mri/lh.hippoSfVolumes-T1.v10.txt",
+        "alice/mri/rh.hippoSfVolumes-T1.v10.txt",
+        "alice/mri/nested/rh.hippoSfVolumes-T1.v10.txt",
+        "alice/surf/lh.hippoSfVolumes-T1.v10.txt",
+        "bert/tmp/lh.hippoSfVolumes-T1.v10.txt",
+        "carol/scripts/recon-all.log",
+        "lh.hippoSfVolumes-T1.v10.txt",
+    ]:
+        tmp_path.joinpath(file_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file_path).write_text("")
+    assert {
+        str(tmp_path.joinpath("alice", "mri", "lh.hippoSfVolumes-T1.v10.txt")),
+        str(tmp_path.joinpath("alice", "mri", "rh.hippoSfVolumes-T1.v10.txt")),
+    } == set(
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find(
+            str(tmp_path), subjects_dir_layout=True
+        )
+    )
+    recursively_found = list(HippocampalSubfieldsVolumeFile.find(str(tmp_path)))
+    assert len(recursively_found) == 6
+
+
+def test_hippocampal_subfields_volume_file_find_subjects_dir_layout_not_found(
+    tmp_path,
+):
+    assert not list(
+        HippocampalSubfieldsVolumeFile.find(
+            str(tmp_path.joinpath("missing")), subjects_dir_layout=True
+        )
+    )
+
+
+@pytest.mark.parametrize("subject", ["alice", "bert", "carol"])
+def test_hippocampal_subfields_volume_file_find_subject(subject):
+    assert {
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR)
+        if f.subject == subject
+    } == {
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find_subject(SUBJECTS_DIR, subject)
+    }
+
+
+def test_hippocampal_subfields_volume_file_find_subject_pruned(tmp_path):
+    for file_path in [
+        "alice/mri/lh.hippoSfVolumes-T1.v10.txt",
+        "alice/mri/nested/lh.hippoSfVolumes-T1.v10.txt",
+        "alice/surf/lh.hippoSfVolumes-T1.v10.txt",
+        "bert/mri/lh.hippoSfVolumes-T1.v10.txt",
+    ]:
+        tmp_path.joinpath(file_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file_path).write_text("")
+    assert [str(tmp_path.joinpath("alice", "mri", "lh.hippoSfVolumes-T1.v10.txt"))] == [
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find_subject(str(tmp_path), "alice")
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_hippocampal_subfields_volume_file_find_subjects(jobs):
+    volume_files = list(
+        HippocampalSubfieldsVolumeFile.find_subjects(
+            SUBJECTS_DIR, subjects=["bert", "carol", "alice"], jobs=jobs
+        )
+    )
+    assert ["bert", "bert", "alice"] == [f.subject for f in volume_files]
+    assert all(f.hemisphere == "left" for f in volume_files)
+
+
+def test_hippocampal_subfields_volume_file_find_subjects_index(tmp_path):
+    with VolumeIndex(str(tmp_path.joinpath("index.sqlite3"))) as index:
+        for _ in range(2):
+            volume_files = HippocampalSubfieldsVolumeFile.find_subjects(
+                SUBJECTS_DIR,
+                subjects=["alice"],
+                filename_regex=re.compile(r"-T1\."),
+                index=index,
+            )
+            assert ["alice"] == [f.subject for f in volume_files]
+
+
+@pytest.mark.parametrize(
+    "find_kwargs", [{}, {"jobs": 2}, {"subjects_dir_layout": True, "jobs": 3}]
+)
+def test_hippocampal_subfields_volume_file_afind(find_kwargs):
+    async def afind_paths():
+        return [
+            f.absolute_path
+            async for f in HippocampalSubfieldsVolumeFile.afind(
+                SUBJECTS_DIR, **find_kwargs
+            )
+        ]
+
+    assert asyncio.run(afind_paths()) == [
+        f.absolute_path
+        for f in HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR, **find_kwargs)
+    ]
+
+
+def test_hippocampal_subfields_volume_file_afind_cancel():
+    walk_started, walk_released = threading.Event(), threading.Event()
+    os_walk = os.walk
+
+    def _blocking_walk(*args, **kwargs):
+        walk_started.set()
+        assert walk_released.wait(timeout=8)
+        yield from os_walk(*args, **kwargs)
+
+    async def cancel_afind():
+        async def consume():
+            async for _ in HippocampalSubfieldsVolumeFile.afind(SUBJECTS_DIR):
+                pass  # pragma: no cover
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(consume())
+        assert await loop.run_in_executor(None, walk_started.wait, 8)
+        # next() is still running in the executor
+        task.cancel()
+        loop.call_later(0.1, walk_released.set)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with unittest.mock.patch("os.walk", _blocking_walk):
+        asyncio.run(cancel_afind())
+
+
+def test_hippocampal_subfields_volume_file_afind_break():
+    async def afind_first():
+        async for volume_file in HippocampalSubfieldsVolumeFile.afind(
+            SUBJECTS_DIR, jobs=2
+        ):
+            return volume_file
+        return None  # pragma: no cover
+
+    assert isinstance(asyncio.run(afind_first()), HippocampalSubfieldsVolumeFile)
+
+
+def test_hippocampal_subfields_volume_file_aread():
+    volume_files = list(HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    assert len(volume_files) > 1
+
+    async def aread_all():
+        return await asyncio.gather(
+            *(f.aread_volumes_mm3() for f in volume_files),
+            *(f.aread_volumes_dataframe() for f in volume_files),
+        )
+
+    results = asyncio.run(aread_all())
+    assert results[: len(volume_files)] == [f.read_volumes_mm3() for f in volume_files]
+    for volume_file, volume_frame in zip(volume_files, results[len(volume_files) :]):
+        pandas.testing.assert_frame_equal(
+            volume_file.read_volumes_dataframe(), volume_frame
+        )
+
+
+def test_hippocampal_subfields_volume_file_aread_not_found():
+    volume_file = HippocampalSubfieldsVolumeFile(
+        path=os.path.join(SUBJECTS_DIR, "non-existing", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(volume_file.aread_volumes_mm3())
+
+
 @pytest.mark.parametrize(
     ("root_dir_path", "filename_pattern", "expected_file_paths"),
     [
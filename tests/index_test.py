@@ -0,0 +1,254 @@
+# pylint: disable=missing-module-docstring
+
+import os
+import shutil
+import unittest.mock
+
+import pandas
+import pytest
+
+import freesurfer_volume_reader
+from freesurfer_volume_reader import ashs, freesurfer, read_volumes_dataframes
+from freesurfer_volume_reader.index import VolumeIndex
+
+# pylint: disable=wrong-import-order; false positive
+from conftest import SUBJECTS_DIR
+
+
+@pytest.fixture(name="subjects_dir_path")
+def _subjects_dir_path_fixture(tmp_path):
+    subjects_dir_path = tmp_path.joinpath("subjects")
+    shutil.copytree(SUBJECTS_DIR, subjects_dir_path)
+    return str(subjects_dir_path)
+
+
+@pytest.fixture(name="index")
+def _index_fixture(tmp_path):
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.index._RACY_INTERVAL_NS", -(10**12)
+    ), VolumeIndex(str(tmp_path.joinpath("index.sqlite3"))) as index:
+        yield index
+
+
+def _find_paths(volume_file_class, root_dir_path, **kwargs):
+    return [f.absolute_path for f in volume_file_class.find(root_dir_path, **kwargs)]
+
+
+@pytest.mark.parametrize(
+    "volume_file_class",
+    [
+        ashs.HippocampalSubfieldsVolumeFile,
+        ashs.IntracranialVolumeFile,
+        freesurfer.HippocampalSubfieldsVolumeFile,
+    ],
+)
+@pytest.mark.parametrize("jobs", [1, 3])
+@pytest.mark.parametrize("subjects_dir_layout", [False, True])
+def test_find(index, volume_file_class, jobs, subjects_dir_layout):
+    expected_paths = _find_paths(
+        volume_file_class, SUBJECTS_DIR, subjects_dir_layout=subjects_dir_layout
+    )
+    assert expected_paths
+    for _ in range(2):
+        assert expected_paths == _find_paths(
+            volume_file_class,
+            SUBJECTS_DIR,
+            jobs=jobs,
+            subjects_dir_layout=subjects_dir_layout,
+            index=index,
+        )
+
+
+def test_find_unchanged(index, subjects_dir_path):
+    expected_paths = _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, SUBJECTS_DIR
+    )
+    _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+    )
+    with unittest.mock.patch(
+        "freesurfer_volume_reader._scan_dir"
+    ) as scan_dir_mock, unittest.mock.patch("os.walk") as walk_mock:
+        paths = _find_paths(
+            freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+        )
+    scan_dir_mock.assert_not_called()
+    walk_mock.assert_not_called()
+    assert [os.path.relpath(p, SUBJECTS_DIR) for p in expected_paths] == [
+        os.path.relpath(p, subjects_dir_path) for p in paths
+    ]
+
+
+def test_find_changed(index, subjects_dir_path):
+    _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+    )
+    carol_mri_path = os.path.join(subjects_dir_path, "carol", "mri")
+    os.makedirs(carol_mri_path)
+    shutil.copy(
+        os.path.join(subjects_dir_path, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt"),
+        carol_mri_path,
+    )
+    os.remove(
+        os.path.join(
+            subjects_dir_path, "bert", "mri", "lh.hippoSfVolumes-T1-T2.v10.txt"
+        )
+    )
+    with unittest.mock.patch(
+        "freesurfer_volume_reader._scan_dir",
+        side_effect=freesurfer_volume_reader._scan_dir,  # pylint: disable=protected-access
+    ) as scan_dir_mock:
+        paths = _find_paths(
+            freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+        )
+    assert sorted(
+        os.path.relpath(c.args[0], subjects_dir_path)
+        for c in scan_dir_mock.call_args_list
+    ) == [".", "bert/mri", "carol", "carol/mri"]
+    assert sorted(os.path.relpath(p, subjects_dir_path) for p in paths) == [
+        "alice/mri/lh.hippoSfVolumes-T1.v10.txt",
+        "bert/mri/lh.hippoSfVolumes-T1.v10.txt",
+        "carol/mri/lh.hippoSfVolumes-T1.v10.txt",
+    ]
+
+
+def test_find_removed(index, subjects_dir_path):
+    _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+    )
+    for volume_file in freesurfer.HippocampalSubfieldsVolumeFile.find(
+        subjects_dir_path
+    ):
+        index.read_volumes_mm3(volume_file)
+    shutil.rmtree(os.path.join(subjects_dir_path, "bert"))
+    assert [
+        os.path.join(subjects_dir_path, "alice", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+    ] == _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+    )
+    # pylint: disable=protected-access
+    for table in ["directories", "volume_files"]:
+        assert not [
+            p
+            for (p,) in index._connection.execute(f"SELECT path FROM {table}")
+            if "bert" in p
+        ]
+
+
+def test_find_root_removed(index, subjects_dir_path):
+    _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+    )
+    shutil.rmtree(subjects_dir_path)
+    assert not _find_paths(
+        freesurfer.HippocampalSubfieldsVolumeFile, subjects_dir_path, index=index
+    )
+    # pylint: disable=protected-access
+    assert not index._connection.execute("SELECT * FROM directories").fetchall()
+
+
+def test_find_racy(tmp_path):
+    mri_dir_path = tmp_path.joinpath("subjects", "bert", "mri")
+    mri_dir_path.mkdir(parents=True)
+    mri_dir_path.joinpath("lh.hippoSfVolumes-T1.v10.txt").write_text("")
+    dir_paths = [str(p) for p in [mri_dir_path, *mri_dir_path.parents][:3]]
+    with VolumeIndex(str(tmp_path.joinpath("index.sqlite3"))) as index:
+        scanned_dir_paths = []
+        for _ in range(3):
+            with unittest.mock.patch(
+                "freesurfer_volume_reader._scan_dir",
+                # pylint: disable=protected-access
+                side_effect=freesurfer_volume_reader._scan_dir,
+            ) as scan_dir_mock:
+                assert len(
+                    _find_paths(
+                        freesurfer.HippocampalSubfieldsVolumeFile,
+                        dir_paths[-1],
+                        index=index,
+                    )
+                )
+            scanned_dir_paths.append(
+                sorted(c.args[0] for c in scan_dir_mock.call_args_list)
+            )
+            for dir_path in dir_paths:
+                os.utime(dir_path, ns=(0, 0))
+    # modified recently, so listings were not trusted
+    assert scanned_dir_paths[0] == scanned_dir_paths[1] == sorted(dir_paths)
+    assert not scanned_dir_paths[2]
+
+
+@pytest.mark.parametrize(
+    "volume_file",
+    [
+        freesurfer.HippocampalSubfieldsVolumeFile(
+            os.path.join(SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+        ),
+        ashs.HippocampalSubfieldsVolumeFile(
+            os.path.join(SUBJECTS_DIR, "bert", "final", "bert_left_heur_volumes.txt")
+        ),
+    ],
+)
+def test_read_volumes_mm3(index, volume_file):
+    expected_volumes = volume_file.read_volumes_mm3()
+    assert expected_volumes == index.read_volumes_mm3(volume_file)
+    with unittest.mock.patch.object(type(volume_file), "read_volumes_mm3") as read_mock:
+        assert expected_volumes == index.read_volumes_mm3(volume_file)
+        assert list(expected_volumes.keys()) == list(
+            index.read_volumes_mm3(volume_file).keys()
+        )
+    read_mock.assert_not_called()
+    pandas.testing.assert_frame_equal(
+        volume_file.read_volumes_dataframe(), index.read_volumes_dataframe(volume_file)
+    )
+
+
+def test_read_volumes_mm3_changed(index, subjects_dir_path):
+    volume_file_path = os.path.join(
+        subjects_dir_path, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt"
+    )
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(volume_file_path)
+    assert index.read_volumes_mm3(volume_file)["CA1"] == pytest.approx(34.567891)
+    with open(volume_file_path, "a", encoding="ascii") as volume_file_stream:
+        volume_file_stream.write("CA1 42.0\n")
+    assert index.read_volumes_mm3(volume_file)["CA1"] == pytest.approx(42.0)
+
+
+def test_read_volumes_mm3_not_found(index):
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(
+        path=os.path.join(SUBJECTS_DIR, "non-existing", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with pytest.raises(FileNotFoundError):
+        index.read_volumes_mm3(volume_file)
+
+
+def test_read_volumes_dataframes(index):
+    volume_files = list(freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    for _ in range(2):
+        for volume_file, volume_frame in zip(
+            volume_files, read_volumes_dataframes(volume_files, jobs=2, index=index)
+        ):
+            pandas.testing.assert_frame_equal(
+                volume_file.read_volumes_dataframe(), volume_frame
+            )
+
+
+def test_read_volumes_dataframes_processes(index):
+    with pytest.raises(ValueError, match=r"^index can not be shared"):
+        read_volumes_dataframes([], use_processes=True, index=index)
+
+
+def test_persistence(tmp_path):
+    index_path = str(tmp_path.joinpath("index.sqlite3"))
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(
+        os.path.join(SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.index._RACY_INTERVAL_NS", -(10**12)
+    ):
+        with VolumeIndex(index_path) as index:
+            expected_volumes = index.read_volumes_mm3(volume_file)
+        with VolumeIndex(index_path) as index, unittest.mock.patch.object(
+            freesurfer.HippocampalSubfieldsVolumeFile, "read_volumes_mm3"
+        ) as read_mock:
+            assert expected_volumes == index.read_volumes_mm3(volume_file)
+    read_mock.assert_not_called()
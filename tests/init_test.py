@@ -1,20 +1,57 @@
 # pylint: disable=missing-module-docstring
 
+import os
+import pathlib
+import re
+import subprocess
+import sys
+import unittest.mock
+
+import pandas
 import pytest
 
-from freesurfer_volume_reader import (
+import freesurfer_volume_reader
+from freesurfer_volume_reader import (  # pylint: disable=import-private-name
+    _walk,
     SubfieldVolumeFile,
     VolumeFile,
+    VolumeFileRecord,
     __version__,
+    ashs,
+    find_volume_file_records,
+    find_volume_files,
+    freesurfer,
     parse_version_string,
+    read_volumes_dataframes,
+    read_volumes_wide_dataframe,
     remove_group_names_from_regex,
+    subject_shard,
 )
+from freesurfer_volume_reader.index import VolumeIndex
+
+# pylint: disable=wrong-import-order; false positive
+from conftest import SUBJECTS_DIR
 
 
 def test_module_version():
     assert len(__version__) >= len("0.1.0")
 
 
+def test_import_lazy():
+    # only imported when building dataframes or by coroutines (slow to import)
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, freesurfer_volume_reader.__main__, freesurfer_volume_reader.ashs"
+            ", freesurfer_volume_reader.freesurfer, freesurfer_volume_reader.index;"
+            " imported = {'asyncio', 'numpy', 'pandas'}.intersection(sys.modules);"
+            " assert not imported, imported",
+        ],
+        check=True,
+    )
+
+
 @pytest.mark.filterwarnings("ignore:function `parse_version_string` is deprecated")
 @pytest.mark.parametrize(
     ("version_string", "expected_tuple"),
@@ -54,6 +91,265 @@ def test_remove_group_names_from_regex(source_pattern, expected_pattern):
     )
 
 
+@pytest.fixture(name="walk_tree_path")
+def _walk_tree_path_fixture(tmp_path):
+    for dir_path in ["a/b/c", "a/d", "e/f/g/h", "i"]:
+        tmp_path.joinpath(dir_path).mkdir(parents=True)
+    for file_path in ["a/b/1", "a/b/c/2", "e/3", "e/f/g/h/4", "5"]:
+        tmp_path.joinpath(file_path).write_text("")
+    tmp_path.joinpath("a", "link").symlink_to(tmp_path.joinpath("e"))
+    tmp_path.joinpath("i", "dangling").symlink_to(tmp_path.joinpath("missing"))
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 8])
+def test__walk(walk_tree_path, jobs):
+    assert list(os.walk(walk_tree_path)) == list(_walk(str(walk_tree_path), jobs=jobs))
+    assert list(os.walk(SUBJECTS_DIR)) == list(_walk(SUBJECTS_DIR, jobs=jobs))
+
+
+@pytest.mark.parametrize("jobs", [2, 8])
+def test__walk_depth_first(tmp_path, jobs):
+    for subject_index in range(256):
+        tmp_path.joinpath(f"subject{subject_index:03d}", "mri").mkdir(parents=True)
+    scan_dir_mock = unittest.mock.Mock(
+        wraps=freesurfer_volume_reader._scan_dir  # pylint: disable=protected-access
+    )
+    walk = _walk(str(tmp_path), jobs=jobs, scan_dir=scan_dir_mock)
+    expected_walk = os.walk(tmp_path)
+    for _ in range(3):
+        assert next(expected_walk) == next(walk)
+    # root, first subject & its mri directory plus scans listed ahead
+    assert scan_dir_mock.call_count <= 3 + 2 * jobs
+    assert list(expected_walk) == list(walk)
+    assert scan_dir_mock.call_count == 1 + 256 * 2
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test__walk_not_found(tmp_path, jobs):
+    assert not list(_walk(str(tmp_path.joinpath("missing")), jobs=jobs))
+
+
+def test__walk_close(walk_tree_path):
+    walk = _walk(str(walk_tree_path), jobs=4)
+    assert next(walk)[0] == str(walk_tree_path)
+    walk.close()
+
+
+@pytest.mark.parametrize("jobs", [0, -2])
+def test__walk_invalid_jobs(jobs):
+    with pytest.raises(ValueError, match=r"^expected positive number of jobs"):
+        next(_walk(SUBJECTS_DIR, jobs=jobs))
+
+
+_VOLUME_FILE_CLASSES = [
+    ashs.HippocampalSubfieldsVolumeFile,
+    ashs.IntracranialVolumeFile,
+    freesurfer.HippocampalSubfieldsVolumeFile,
+]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("subjects_dir_layout", [False, True])
+def test_find_volume_files(jobs, subjects_dir_layout):
+    scan_dir_mock = unittest.mock.Mock(
+        wraps=freesurfer_volume_reader._scan_dir  # pylint: disable=protected-access
+    )
+    with unittest.mock.patch("freesurfer_volume_reader._scan_dir", scan_dir_mock):
+        volume_files = list(
+            find_volume_files(
+                SUBJECTS_DIR,
+                volume_file_classes=_VOLUME_FILE_CLASSES,
+                jobs=jobs,
+                subjects_dir_layout=subjects_dir_layout,
+            )
+        )
+    expected_paths = {
+        (c, f.absolute_path)
+        for c in _VOLUME_FILE_CLASSES
+        for f in c.find(SUBJECTS_DIR, subjects_dir_layout=subjects_dir_layout)
+    }
+    assert expected_paths == {(type(f), f.absolute_path) for f in volume_files}
+    assert len(expected_paths) == len(volume_files)
+    if jobs > 1:  # single recursive walk, also with subjects_dir_layout
+        scanned_paths = [c.args[0] for c in scan_dir_mock.call_args_list]
+        assert len(scanned_paths) == len(set(scanned_paths))
+        assert len(scanned_paths) == len(list(os.walk(SUBJECTS_DIR)))
+
+
+def test_find_volume_files_filename_regexs():
+    volume_files = list(
+        find_volume_files(
+            SUBJECTS_DIR,
+            volume_file_classes=_VOLUME_FILE_CLASSES,
+            filename_regexs={
+                ashs.HippocampalSubfieldsVolumeFile: re.compile(r"_left_"),
+                freesurfer.HippocampalSubfieldsVolumeFile: re.compile(r"-T1-T2\."),
+            },
+        )
+    )
+    assert {
+        os.path.join("alice", "final", "alice_left_corr_nogray_volumes.txt"),
+        os.path.join("bert", "final", "bert_left_corr_nogray_volumes.txt"),
+        os.path.join("bert", "mri", "lh.hippoSfVolumes-T1-T2.v10.txt"),
+    } <= {
+        os.path.relpath(f.absolute_path, SUBJECTS_DIR)
+        for f in volume_files
+        if not isinstance(f, ashs.IntracranialVolumeFile)
+    }
+    assert all(
+        "_right_" not in f.absolute_path and "-T1." not in f.absolute_path
+        for f in volume_files
+    )
+    assert any(isinstance(f, ashs.IntracranialVolumeFile) for f in volume_files)
+
+
+@pytest.mark.parametrize("subjects_dir_layout", [False, True])
+def test_find_volume_file_records(subjects_dir_layout):
+    records = list(
+        find_volume_file_records(
+            os.path.relpath(SUBJECTS_DIR),
+            volume_file_classes=_VOLUME_FILE_CLASSES,
+            subjects_dir_layout=subjects_dir_layout,
+        )
+    )
+    assert all(isinstance(r, VolumeFileRecord) for r in records)
+    volume_files = list(
+        find_volume_files(
+            SUBJECTS_DIR,
+            volume_file_classes=_VOLUME_FILE_CLASSES,
+            subjects_dir_layout=subjects_dir_layout,
+        )
+    )
+    assert [(type(f), f.absolute_path) for f in volume_files] == records
+    for record, volume_file in zip(records, volume_files):
+        loaded_volume_file = record.to_volume_file()
+        assert isinstance(loaded_volume_file, record.volume_file_class)
+        assert volume_file.absolute_path == loaded_volume_file.absolute_path
+        assert volume_file.subject == loaded_volume_file.subject
+
+
+def _create_subjects(root_dir_path: pathlib.Path, subjects_number: int) -> None:
+    for subject_index in range(subjects_number):
+        mri_dir_path = root_dir_path.joinpath(f"subject{subject_index}", "mri")
+        mri_dir_path.mkdir(parents=True)
+        mri_dir_path.joinpath("lh.hippoSfVolumes-T1.v10.txt").write_text("CA1 1.0\n")
+
+
+def test_subject_shard():
+    assert subject_shard("bert", 1) == 0
+    assert {subject_shard(f"subject{i}", 4) for i in range(64)} == {0, 1, 2, 3}
+    # stable across processes (unlike hash())
+    assert subject_shard("bert", 7) == 4
+
+
+@pytest.mark.parametrize("shards_number", [1, 2, 3])
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("subjects_dir_layout", [False, True])
+@pytest.mark.parametrize("use_index", [False, True])
+def test_find_volume_files_shard(
+    tmp_path, shards_number, jobs, subjects_dir_layout, use_index
+):
+    root_dir_path = tmp_path.joinpath("subjects")
+    _create_subjects(root_dir_path, subjects_number=16)
+    expected_paths = {
+        f.absolute_path
+        for f in freesurfer.HippocampalSubfieldsVolumeFile.find(str(root_dir_path))
+    }
+    assert len(expected_paths) == 16
+    shard_paths = []
+    with VolumeIndex(str(tmp_path.joinpath("index.sqlite3"))) as index:
+        for shard_index in range(shards_number):
+            volume_files = list(
+                freesurfer.HippocampalSubfieldsVolumeFile.find(
+                    str(root_dir_path),
+                    jobs=jobs,
+                    subjects_dir_layout=subjects_dir_layout,
+                    index=index if use_index else None,
+                    shard=(shard_index, shards_number),
+                )
+            )
+            assert all(
+                subject_shard(f.subject, shards_number) == shard_index
+                for f in volume_files
+            )
+            shard_paths.append({f.absolute_path for f in volume_files})
+    assert set().union(*shard_paths) == expected_paths
+    assert sum(map(len, shard_paths)) == len(expected_paths)
+
+
+@pytest.mark.parametrize("shard", [(0, 0), (2, 2), (-1, 2)])
+def test_find_volume_files_shard_invalid(shard):
+    with pytest.raises(ValueError, match=r"^expected shard \(index, number\) with "):
+        list(find_volume_files(SUBJECTS_DIR, _VOLUME_FILE_CLASSES, shard=shard))
+
+
+def test_find_volume_files_shard_root_files(tmp_path):
+    tmp_path.joinpath("alice_icv.txt").write_text("alice 1234.0\n")
+    for shard_index in range(3):
+        assert [
+            f.subject
+            for f in ashs.IntracranialVolumeFile.find(
+                str(tmp_path), shard=(shard_index, 3)
+            )
+        ] == (["alice"] if shard_index == 0 else [])
+
+
+@pytest.mark.parametrize("volume_file_class", _VOLUME_FILE_CLASSES)
+def test_volume_file_slots(volume_file_class):
+    volume_file = next(volume_file_class.find(SUBJECTS_DIR))
+    assert not hasattr(volume_file, "__dict__")
+    with pytest.raises(AttributeError):
+        volume_file.unknown_attr = 42
+
+
+def test_volume_file_absolute_path_normalized():
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(
+        os.path.join(os.path.relpath(SUBJECTS_DIR), "alice", "..", "bert", "mri", ".")
+        + "/lh.hippoSfVolumes-T1.v10.txt"
+    )
+    assert volume_file.absolute_path == os.path.join(
+        SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt"
+    )
+    assert volume_file.subject == "bert"
+
+
+def test_find_volume_files_suffix(tmp_path):
+    for file_path in [
+        "bert/final/bert_icv.txt",
+        "bert/final/bert_icv.txt.bak",
+        "bert/final/bert_left_heur_volumes.txt",
+        "bert/final/bert_left_heur_volumes_txt",
+        "bert/final/bert_left_lfseg_volumes.txt",
+        "bert/mri/lh.hippoSfVolumes-T1.v10.txt",
+        "bert/mri/lh.hippoSfVolumes-T1.v10_txt",
+        "bert/mri/lh.hippoSfVolumes-T1.v9.txt",
+        "bert/mri/aseg.v10.txt",
+    ]:
+        tmp_path.joinpath(file_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file_path).write_text("")
+    with unittest.mock.patch.object(
+        VolumeFile,
+        "_match_filename",
+        autospec=True,
+        side_effect=VolumeFile._match_filename,  # pylint: disable=protected-access
+    ) as match_filename_mock:
+        volume_files = list(
+            find_volume_files(str(tmp_path), volume_file_classes=_VOLUME_FILE_CLASSES)
+        )
+    assert {
+        "bert/final/bert_icv.txt",
+        "bert/final/bert_left_heur_volumes.txt",
+        "bert/mri/lh.hippoSfVolumes-T1.v10.txt",
+    } == {
+        pathlib.Path(f.absolute_path).relative_to(tmp_path).as_posix()
+        for f in volume_files
+    }
+    # filenames are matched once, during the search
+    assert match_filename_mock.call_count == 3
+    assert all(c.args[1] is not None for c in match_filename_mock.call_args_list)
+
+
 def test_volume_file_abstract():
     with pytest.raises(
         TypeError,
@@ -83,6 +379,15 @@ class DummySubfieldVolumeFile(SubfieldVolumeFile):
     def read_volumes_dataframe(self):
         return super().read_volumes_dataframe()
 
+    def build_volumes_dataframe(self, subfield_volumes):
+        return super().build_volumes_dataframe(subfield_volumes)
+
+    def _volumes_dataframe_attributes(self):
+        return super()._volumes_dataframe_attributes()
+
+    def _parse_volumes_mm3(self, volumes_text):
+        return super()._parse_volumes_mm3(volumes_text)
+
 
 def test_subfield_volume_file_abstractmethod():
     volume_file = DummySubfieldVolumeFile(path="subfield-dummy")
@@ -90,3 +395,336 @@ def test_subfield_volume_file_abstractmethod():
         volume_file.read_volumes_mm3()
     with pytest.raises(NotImplementedError):
         volume_file.read_volumes_dataframe()
+    with pytest.raises(NotImplementedError):
+        volume_file.build_volumes_dataframe({"CA1": 1.0})
+    with pytest.raises(NotImplementedError):
+        # pylint: disable=protected-access; implemented by subclasses
+        volume_file._parse_volumes_mm3("CA1 1.0\n")
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 4])
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_read_volumes_dataframes(jobs, use_processes):
+    volume_files = (
+        sorted(
+            freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR),
+            key=lambda f: f.absolute_path,
+        )
+        * 3
+    )
+    volume_frames = list(
+        read_volumes_dataframes(volume_files, jobs=jobs, use_processes=use_processes)
+    )
+    assert len(volume_frames) == len(volume_files)
+    for volume_file, volume_frame in zip(volume_files, volume_frames):
+        pandas.testing.assert_frame_equal(
+            volume_frame, volume_file.read_volumes_dataframe()
+        )
+
+
+def _pivot_volumes_dataframes(volume_files) -> pandas.DataFrame:
+    volume_frames = []
+    for file_index, volume_frame in enumerate(read_volumes_dataframes(volume_files)):
+        volume_frame["file_index"] = file_index
+        volume_frames.append(volume_frame)
+    long_frame = pandas.concat(volume_frames, ignore_index=True)
+    wide_frame = long_frame.pivot(
+        index="file_index", columns="subfield", values="volume_mm^3"
+    )
+    attribute_columns = [
+        c for c in long_frame.columns if c not in {"subfield", "volume_mm^3"}
+    ]
+    return (
+        long_frame[attribute_columns]
+        .groupby("file_index")
+        .first()
+        .join(wide_frame)
+        .reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize(
+    ("jobs", "use_processes", "use_index"),
+    [(1, False, False), (2, False, False), (2, True, False), (2, False, True)],
+)
+def test_read_volumes_wide_dataframe(tmp_path, jobs, use_processes, use_index):
+    volume_files = list(ashs.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    volume_files.extend(freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    with VolumeIndex(str(tmp_path.joinpath("index.sqlite3"))) as index:
+        wide_frame = read_volumes_wide_dataframe(
+            iter(volume_files),
+            jobs=jobs,
+            use_processes=use_processes,
+            index=index if use_index else None,
+        )
+    # "CA1" in both ashs & freesurfer volume files
+    assert wide_frame.shape == (len(volume_files), 5 + 7 + 13 - 1)
+    assert wide_frame["CA2+3"].isnull().sum() == 3
+    expected_frame = _pivot_volumes_dataframes(volume_files)
+    pandas.testing.assert_frame_equal(
+        wide_frame.fillna(-1).astype({"T1_input": object}),
+        expected_frame[wide_frame.columns].fillna(-1).astype({"T1_input": object}),
+    )
+
+
+def test_read_volumes_wide_dataframe_freesurfer():
+    volume_files = list(freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    wide_frame = read_volumes_wide_dataframe(volume_files)
+    assert list(wide_frame.columns[:5]) == [
+        "subject",
+        "hemisphere",
+        "T1_input",
+        "analysis_id",
+        "Hippocampal_tail",
+    ]
+    assert wide_frame["T1_input"].dtype == bool
+    pandas.testing.assert_frame_equal(
+        wide_frame, _pivot_volumes_dataframes(volume_files)[wide_frame.columns]
+    )
+
+
+def test_read_volumes_wide_dataframe_missing_subfield(tmp_path):
+    volume_file_paths = []
+    for subject, volumes_text in [("a", "CA1 1.5\n"), ("b", "CA3 3.5\nCA1 2.5\n")]:
+        mri_dir_path = tmp_path.joinpath(subject, "mri")
+        mri_dir_path.mkdir(parents=True)
+        volume_file_path = mri_dir_path.joinpath("lh.hippoSfVolumes-T1.v10.txt")
+        volume_file_path.write_text(volumes_text)
+        volume_file_paths.append(str(volume_file_path))
+    wide_frame = read_volumes_wide_dataframe(
+        freesurfer.HippocampalSubfieldsVolumeFile(p) for p in volume_file_paths
+    )
+    assert wide_frame["subject"].tolist() == ["a", "b"]
+    assert wide_frame["CA1"].tolist() == [1.5, 2.5]
+    assert wide_frame["CA3"].isnull().tolist() == [True, False]
+
+
+def test_read_volumes_wide_dataframe_empty():
+    assert read_volumes_wide_dataframe([]).empty
+
+
+def test_read_volumes_wide_dataframe_index_processes(tmp_path):
+    with VolumeIndex(str(tmp_path.joinpath("index.sqlite3"))) as index:
+        with pytest.raises(ValueError, match=r"index can not be shared"):
+            read_volumes_wide_dataframe([], jobs=2, use_processes=True, index=index)
+
+
+class ConcatBatchVolumeFile(freesurfer.HippocampalSubfieldsVolumeFile):
+
+    read_volumes_dataframe_batch = vars(SubfieldVolumeFile)[
+        "read_volumes_dataframe_batch"
+    ]
+
+
+def test_subfield_volume_file_read_volumes_dataframe_batch():
+    volume_files = [
+        ConcatBatchVolumeFile(path=f.absolute_path)
+        for f in freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR)
+    ]
+    pandas.testing.assert_frame_equal(
+        freesurfer.HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch(
+            volume_files
+        ),
+        ConcatBatchVolumeFile.read_volumes_dataframe_batch(iter(volume_files)),
+    )
+
+
+def test_subfield_volume_file_read_volumes_dataframe_batch_empty():
+    volume_frame = ConcatBatchVolumeFile.read_volumes_dataframe_batch([])
+    assert volume_frame.empty
+    assert (
+        tuple(volume_frame.columns)
+        == freesurfer.HippocampalSubfieldsVolumeFile.VOLUMES_DATAFRAME_COLUMNS
+    )
+    assert volume_frame["volume_mm^3"].dtype == "float64"
+
+
+def test_read_volumes_dataframes_lazy():
+    volume_file = next(freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    consumed = []
+
+    def _generate_volume_files():
+        for volume_file_index in range(100):
+            consumed.append(volume_file_index)
+            yield volume_file
+
+    volume_frames = read_volumes_dataframes(_generate_volume_files(), jobs=2)
+    next(volume_frames)
+    assert len(consumed) <= 2 * 2 + 1
+    volume_frames.close()
+    assert len(consumed) <= 2 * 2 + 1
+
+
+def test_read_volumes_dataframes_not_found():
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(
+        path=os.path.join(SUBJECTS_DIR, "non-existing", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with pytest.raises(FileNotFoundError):
+        list(read_volumes_dataframes([volume_file], jobs=2))
+
+
+@pytest.mark.parametrize("jobs", [0, -1])
+def test_read_volumes_dataframes_invalid_jobs(jobs):
+    with pytest.raises(ValueError, match=r"^expected positive number of jobs"):
+        list(read_volumes_dataframes([], jobs=jobs))
+
+
+@pytest.fixture(name="volumes_cache")
+def _volumes_cache_fixture():
+    with unittest.mock.patch(
+        "freesurfer_volume_reader._MEMO_RACY_INTERVAL_NS", -(10**12)
+    ):
+        SubfieldVolumeFile.enable_cache(max_entries=2)
+        try:
+            yield
+        finally:
+            SubfieldVolumeFile.disable_cache()
+
+
+def _copy_volume_file(tmp_path, subject):
+    volume_file_path = tmp_path.joinpath(subject, "mri", "lh.hippoSfVolumes-T1.v10.txt")
+    volume_file_path.parent.mkdir(parents=True)
+    volume_file_path.write_bytes(
+        pathlib.Path(SUBJECTS_DIR)
+        .joinpath("bert", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+        .read_bytes()
+    )
+    return freesurfer.HippocampalSubfieldsVolumeFile(str(volume_file_path))
+
+
+def _count_reads(volume_file_class):
+    return unittest.mock.patch.object(
+        volume_file_class,
+        "_read_text",
+        autospec=True,
+        side_effect=vars(VolumeFile)["_read_text"],
+    )
+
+
+@pytest.mark.usefixtures("volumes_cache")
+@pytest.mark.parametrize(
+    "volume_file",
+    [
+        freesurfer.HippocampalSubfieldsVolumeFile(
+            os.path.join(SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+        ),
+        ashs.HippocampalSubfieldsVolumeFile(
+            os.path.join(SUBJECTS_DIR, "bert", "final", "bert_left_heur_volumes.txt")
+        ),
+    ],
+)
+def test_subfield_volume_file_cache(volume_file):
+    with _count_reads(type(volume_file)) as read_mock:
+        expected_volumes = volume_file.read_volumes_mm3()
+        expected_volumes["CA1"] = 0  # returned volumes are copies
+        assert volume_file.read_volumes_mm3()["CA1"] != 0
+        pandas.testing.assert_frame_equal(
+            volume_file.build_volumes_dataframe(volume_file.read_volumes_mm3()),
+            volume_file.read_volumes_dataframe(),
+        )
+        # equal paths, other instance
+        type(volume_file)(volume_file.absolute_path).read_volumes_mm3()
+    assert read_mock.call_count == 1
+
+
+@pytest.mark.usefixtures("volumes_cache")
+@pytest.mark.parametrize(
+    "volume_file_class",
+    [freesurfer.HippocampalSubfieldsVolumeFile, ashs.HippocampalSubfieldsVolumeFile],
+)
+def test_subfield_volume_file_cache_batch(volume_file_class):
+    # memo fixture keeps 2 entries
+    volume_files = sorted(
+        volume_file_class.find(os.path.join(SUBJECTS_DIR, "bert")),
+        key=lambda f: f.absolute_path,
+    )[:2]
+    with _count_reads(volume_file_class) as read_mock:
+        volume_frame = volume_file_class.read_volumes_dataframe_batch(volume_files)
+        pandas.testing.assert_frame_equal(
+            volume_frame, volume_file_class.read_volumes_dataframe_batch(volume_files)
+        )
+    assert read_mock.call_count == 2
+    SubfieldVolumeFile.disable_cache()
+    pandas.testing.assert_frame_equal(
+        volume_frame, volume_file_class.read_volumes_dataframe_batch(volume_files)
+    )
+
+
+@pytest.mark.usefixtures("volumes_cache")
+def test_subfield_volume_file_cache_modified(tmp_path):
+    volume_file = _copy_volume_file(tmp_path, "bert")
+    volume_file_path = pathlib.Path(volume_file.absolute_path)
+    assert volume_file.read_volumes_mm3()["CA1"] == pytest.approx(34.567891)
+    stat = volume_file_path.stat()
+    # same size, other mtime
+    volume_file_path.write_text(
+        volume_file_path.read_text(encoding="ascii").replace("34.567891", "34.567892"),
+        encoding="ascii",
+    )
+    os.utime(volume_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert volume_file.read_volumes_mm3()["CA1"] == pytest.approx(34.567892)
+    # same mtime, other size
+    volume_file_path.write_text(
+        volume_file_path.read_text(encoding="ascii").replace("34.567892", "34.56789"),
+        encoding="ascii",
+    )
+    os.utime(volume_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert volume_file.read_volumes_mm3()["CA1"] == pytest.approx(34.56789)
+
+
+@pytest.mark.usefixtures("volumes_cache")
+def test_subfield_volume_file_cache_least_recently_used(tmp_path):
+    alice, bert, carol = [
+        _copy_volume_file(tmp_path, s) for s in ["alice", "bert", "carol"]
+    ]
+    with _count_reads(freesurfer.HippocampalSubfieldsVolumeFile) as read_mock:
+        for volume_file in [alice, bert, alice, carol]:
+            volume_file.read_volumes_mm3()
+        assert read_mock.call_count == 3
+        alice.read_volumes_mm3()
+        carol.read_volumes_mm3()
+        assert read_mock.call_count == 3
+        bert.read_volumes_mm3()
+        assert read_mock.call_count == 4
+
+
+@pytest.mark.usefixtures("volumes_cache")
+def test_subfield_volume_file_clear_cache():
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(
+        os.path.join(SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with _count_reads(freesurfer.HippocampalSubfieldsVolumeFile) as read_mock:
+        volume_file.read_volumes_mm3()
+        SubfieldVolumeFile.clear_cache()
+        volume_file.read_volumes_mm3()
+        volume_file.read_volumes_mm3()
+    assert read_mock.call_count == 2
+
+
+def test_subfield_volume_file_cache_racy(tmp_path):
+    volume_file = _copy_volume_file(tmp_path, "bert")
+    SubfieldVolumeFile.enable_cache()
+    try:
+        with _count_reads(freesurfer.HippocampalSubfieldsVolumeFile) as read_mock:
+            volume_file.read_volumes_mm3()
+            volume_file.read_volumes_mm3()
+    finally:
+        SubfieldVolumeFile.disable_cache()
+    # modified recently, modifications might not change mtime
+    assert read_mock.call_count == 2
+
+
+def test_subfield_volume_file_cache_disabled():
+    SubfieldVolumeFile.clear_cache()  # no-op
+    volume_file = freesurfer.HippocampalSubfieldsVolumeFile(
+        os.path.join(SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt")
+    )
+    with _count_reads(freesurfer.HippocampalSubfieldsVolumeFile) as read_mock:
+        volume_file.read_volumes_mm3()
+        volume_file.read_volumes_mm3()
+    assert read_mock.call_count == 2
+
+
+def test_subfield_volume_file_enable_cache_invalid():
+    with pytest.raises(ValueError, match=r"^expected positive max_entries, got 0$"):
+        SubfieldVolumeFile.enable_cache(max_entries=0)
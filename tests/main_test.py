@@ -1,8 +1,11 @@
-# pylint: disable=missing-module-docstring
+# pylint: disable=missing-module-docstring,too-many-lines; one test per option
 
 import io
 import os
+import shutil
+import stat
 import subprocess
+import sys
 import typing
 import unittest.mock
 
@@ -12,6 +15,7 @@ import pytest
 
 import freesurfer_volume_reader
 import freesurfer_volume_reader.__main__
+import freesurfer_volume_reader.watch
 
 # pylint: disable=wrong-import-order; false positive
 from conftest import SUBJECTS_DIR, assert_volume_frames_equal
@@ -298,6 +302,743 @@ def test_main_root_dir_filename_regex_combined(capsys):
     )
 
 
+@pytest.mark.parametrize("jobs_args", [["--jobs", "3"], ["-j", "2", "--use-processes"]])
+def test_main_jobs(capsys, jobs_args):
+    assert_main_volume_frame_equals(
+        argv=jobs_args
+        + ["--source-types", "ashs", "freesurfer-hipposf", "--", SUBJECTS_DIR],
+        expected_frame=pandas.read_csv(
+            os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv")
+        ),
+        capsys=capsys,
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "root_dir_path", "expected_csv_path"),
+    [
+        (
+            ["--source-types", "ashs", "freesurfer-hipposf"],
+            SUBJECTS_DIR,
+            os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv"),
+        ),
+        (
+            [],
+            os.path.join(SUBJECTS_DIR, "bert"),
+            os.path.join(SUBJECTS_DIR, "bert", "freesurfer-hippocampal-volumes.csv"),
+        ),
+    ],
+)
+def test_main_subjects_dir_layout(capsys, args, root_dir_path, expected_csv_path):
+    assert_main_volume_frame_equals(
+        argv=["--subjects-dir-layout"] + args + ["--", root_dir_path],
+        expected_frame=pandas.read_csv(expected_csv_path),
+        capsys=capsys,
+    )
+
+
+def test_main_index(capsys, tmp_path):
+    index_path = str(tmp_path.joinpath("index.sqlite3"))
+    for _ in range(2):
+        assert_main_volume_frame_equals(
+            argv=["--index", index_path, "--jobs", "2", "--source-types", "ashs"]
+            + ["freesurfer-hipposf", "--", SUBJECTS_DIR],
+            expected_frame=pandas.read_csv(
+                os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv")
+            ),
+            capsys=capsys,
+        )
+    assert os.path.isfile(index_path)
+
+
+def test_main_index_processes(capsys, tmp_path):
+    with unittest.mock.patch(
+        "sys.argv",
+        ["", "--index", str(tmp_path.joinpath("index.sqlite3")), "--use-processes"]
+        + ["-j", "2", "--", SUBJECTS_DIR],
+    ):
+        with pytest.raises(SystemExit):
+            freesurfer_volume_reader.__main__.main()
+    _, err = capsys.readouterr()
+    assert "--index can not be combined with --use-processes" in err
+
+
+def _run_main(argv: list) -> int:
+    with unittest.mock.patch("sys.argv", [""] + argv):
+        return freesurfer_volume_reader.__main__.main()
+
+
+def _read_sorted_csv(path: str) -> pandas.DataFrame:
+    return (
+        pandas.read_csv(path)
+        .sort_values(["source_path", "subfield"])
+        .reset_index(drop=True)
+    )
+
+
+def test_main_update(capsys, tmp_path):
+    subjects_dir_path = tmp_path.joinpath("subjects")
+    shutil.copytree(SUBJECTS_DIR, subjects_dir_path)
+    output_path = tmp_path.joinpath("volumes.csv")
+    argv = ["--source-types", "ashs", "freesurfer-hipposf", "--update"]
+    argv += [str(output_path), "--", str(subjects_dir_path)]
+    assert _run_main(argv) == os.EX_OK
+    assert not capsys.readouterr().out
+    expected_frame = pandas.read_csv(
+        os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv")
+    )
+    assert_volume_frames_equal(
+        left=expected_frame.copy(),
+        right=pandas.read_csv(output_path).drop(columns=["source_path"]),
+    )
+    previous_mtime_ns = output_path.stat().st_mtime_ns
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3"
+    ) as freesurfer_read_mock, unittest.mock.patch(
+        "freesurfer_volume_reader.ashs.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3"
+    ) as ashs_read_mock:
+        assert _run_main(argv) == os.EX_OK
+    freesurfer_read_mock.assert_not_called()
+    ashs_read_mock.assert_not_called()
+    assert output_path.stat().st_mtime_ns > previous_mtime_ns
+    assert_volume_frames_equal(
+        left=expected_frame.copy(),
+        right=pandas.read_csv(output_path).drop(columns=["source_path"]),
+    )
+    # changed, new & removed volume files
+    bert_mri_path = subjects_dir_path.joinpath("bert", "mri")
+    with bert_mri_path.joinpath("lh.hippoSfVolumes-T1.v10.txt").open(
+        "a", encoding="ascii"
+    ) as volume_file:
+        volume_file.write("CA1 42.0\n")
+    os.utime(
+        bert_mri_path.joinpath("lh.hippoSfVolumes-T1.v10.txt"),
+        ns=(output_path.stat().st_mtime_ns,) * 2,
+    )
+    shutil.copytree(bert_mri_path, subjects_dir_path.joinpath("carol", "mri"))
+    subjects_dir_path.joinpath("alice", "final", "alice_left_heur_volumes.txt").unlink()
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.ashs.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3"
+    ) as ashs_read_mock:
+        assert _run_main(argv) == os.EX_OK
+    ashs_read_mock.assert_not_called()
+    updated_frame = _read_sorted_csv(output_path)
+    assert _run_main(argv[:-4] + ["--", str(subjects_dir_path)]) == os.EX_OK
+    pandas.testing.assert_frame_equal(
+        _read_sorted_csv(io.StringIO(capsys.readouterr().out)), updated_frame
+    )
+    assert set(updated_frame["subject"]) == {"alice", "bert", "carol"}
+    assert updated_frame[
+        (updated_frame["subfield"] == "CA1")
+        & (
+            updated_frame["source_path"]
+            == str(bert_mri_path.joinpath("lh.hippoSfVolumes-T1.v10.txt"))
+        )
+    ]["volume_mm^3"].tolist() == [42.0]
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_main_update_string_columns(capsys, tmp_path):
+    mri_dir_path = tmp_path.joinpath("subjects", "007", "mri")
+    mri_dir_path.mkdir(parents=True)
+    shutil.copyfile(
+        os.path.join(SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1-T2.v10.txt"),
+        mri_dir_path.joinpath("lh.hippoSfVolumes-T1-01.v10.txt"),
+    )
+    output_path = tmp_path.joinpath("volumes.csv")
+    argv = ["--update", str(output_path), "--", str(tmp_path.joinpath("subjects"))]
+    assert _run_main(argv) == os.EX_OK
+    expected_csv = output_path.read_text()
+    assert ",007,left,True,01," in expected_csv
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3"
+    ) as read_mock:
+        assert _run_main(argv) == os.EX_OK
+    read_mock.assert_not_called()
+    assert output_path.read_text() == expected_csv
+    assert not capsys.readouterr().out
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_main_update_all_removed(capsys, tmp_path, output_format):
+    if output_format != "csv":
+        pytest.importorskip("pyarrow")
+    subjects_dir_path = tmp_path.joinpath("subjects")
+    shutil.copytree(os.path.join(SUBJECTS_DIR, "bert"), subjects_dir_path)
+    output_path = tmp_path.joinpath("volumes")
+    argv = ["--output-format", output_format, "--update", str(output_path)]
+    argv += ["--", str(subjects_dir_path)]
+    assert _run_main(argv) == os.EX_OK
+    assert output_path.stat().st_size > 0
+    shutil.rmtree(subjects_dir_path.joinpath("mri"))
+    assert _run_main(argv) == os.EX_NOINPUT
+    assert "Did not find any volume files" in capsys.readouterr().err
+    assert not list(tmp_path.glob("*volumes*"))
+    assert _run_main(argv) == os.EX_NOINPUT
+
+
+def test_main_update_backdated(tmp_path):
+    subjects_dir_path = tmp_path.joinpath("subjects")
+    shutil.copytree(os.path.join(SUBJECTS_DIR, "bert"), subjects_dir_path)
+    output_path = tmp_path.joinpath("volumes.csv")
+    argv = ["--update", str(output_path), "--", str(subjects_dir_path)]
+    assert _run_main(argv) == os.EX_OK
+    assert 34.567891 in _read_sorted_csv(output_path)["volume_mm^3"].tolist()
+    volume_file_path = subjects_dir_path.joinpath("mri", "lh.hippoSfVolumes-T1.v10.txt")
+    volume_file_path.write_text(
+        volume_file_path.read_text().replace("34.567891", "99.0")
+    )
+    # e.g., replaced by `rsync -a`
+    os.utime(volume_file_path, ns=(1577836800 * 10**9,) * 2)
+    assert _run_main(argv) == os.EX_OK
+    volumes = _read_sorted_csv(output_path)["volume_mm^3"].tolist()
+    assert 99.0 in volumes
+    assert 34.567891 not in volumes
+
+
+def test_main_update_mode(tmp_path):
+    output_path = tmp_path.joinpath("volumes.csv")
+    argv = ["--update", str(output_path), "--", os.path.join(SUBJECTS_DIR, "bert")]
+    umask = os.umask(0o027)
+    try:
+        assert _run_main(argv) == os.EX_OK
+        assert stat.S_IMODE(output_path.stat().st_mode) == 0o640
+        output_path.chmod(0o604)
+        os.utime(output_path, ns=(0, 0))
+        assert _run_main(argv) == os.EX_OK
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(output_path.stat().st_mode) == 0o604
+
+
+def test_main_update_outdated(tmp_path):
+    output_path = tmp_path.joinpath("volumes.csv")
+    argv = ["--update", str(output_path), "--", os.path.join(SUBJECTS_DIR, "bert")]
+    assert _run_main(argv) == os.EX_OK
+    expected_frame = _read_sorted_csv(output_path)
+    os.utime(output_path, ns=(0, 0))
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3",
+        return_value={"CA1": 21.0},
+    ):
+        assert _run_main(argv) == os.EX_OK
+    updated_frame = _read_sorted_csv(output_path)
+    assert len(updated_frame) == 2
+    assert (updated_frame["volume_mm^3"] == 21.0).all()
+    assert set(updated_frame["source_path"]) == set(expected_frame["source_path"])
+
+
+def test_main_update_no_files_found(tmp_path):
+    output_path = tmp_path.joinpath("volumes.csv")
+    assert (
+        _run_main(["--update", str(output_path), "--", str(tmp_path)]) == os.EX_NOINPUT
+    )
+    assert not output_path.exists()
+
+
+def test_main_csv_columns(capsys):
+    assert (
+        _run_main(
+            ["--source-types", "freesurfer-hipposf", "ashs", "--"]
+            + [os.path.join(SUBJECTS_DIR, "bert", "mri")]
+        )
+        == os.EX_OK
+    )
+    out = capsys.readouterr().out
+    assert out.splitlines()[0] == (
+        "subfield,volume_mm^3,subject,hemisphere,T1_input,analysis_id,correction"
+        ",source_type,source_path"
+    )
+    assert out.count("subfield,") == 1
+    assert len(out.splitlines()) == 1 + 2 * 13
+
+
+def test_main_streaming(capsys):
+    written_rows = []
+    original_read_volumes_mm3 = (
+        freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile.read_volumes_mm3
+    )
+
+    def _read_volumes_mm3(volume_file):
+        written_rows.append(len(capsys.readouterr().out.splitlines()))
+        return original_read_volumes_mm3(volume_file)
+
+    with unittest.mock.patch.object(
+        freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile,
+        "read_volumes_mm3",
+        _read_volumes_mm3,
+    ):
+        assert _run_main(["--", SUBJECTS_DIR]) == os.EX_OK
+    # rows of previous file were written before reading the next one
+    assert written_rows == [0, 14, 13]
+
+
+def test_main_update_failed(tmp_path):
+    output_path = tmp_path.joinpath("volumes.csv")
+    assert _run_main(["--update", str(output_path), "--", SUBJECTS_DIR]) == os.EX_OK
+    previous_csv = output_path.read_text()
+    os.utime(output_path, ns=(0, 0))
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3",
+        side_effect=PermissionError,
+    ):
+        with pytest.raises(PermissionError):
+            _run_main(["--update", str(output_path), "--", SUBJECTS_DIR])
+    assert output_path.read_text() == previous_csv
+    assert [output_path] == list(tmp_path.iterdir())
+
+
+def _read_columnar(path, output_format: str) -> pandas.DataFrame:
+    if output_format == "parquet":
+        return pandas.read_parquet(path)
+    if output_format == "feather":
+        return pandas.read_feather(path)
+    pyarrow = pytest.importorskip("pyarrow")
+    with pyarrow.OSFile(str(path)) as stream:
+        return pyarrow.ipc.open_stream(stream).read_pandas()
+
+
+def _read_volumes(path, output_format: str) -> pandas.DataFrame:
+    if output_format == "csv":
+        return pandas.read_csv(path)
+    return _read_columnar(path, output_format)
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather", "arrow-ipc"])
+@pytest.mark.parametrize(
+    ("source_types", "expected_csv_path"),
+    [
+        (
+            ["ashs", "freesurfer-hipposf"],
+            os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv"),
+        ),
+        (
+            ["freesurfer-hipposf"],
+            os.path.join(SUBJECTS_DIR, "freesurfer-hippocampal-volumes.csv"),
+        ),
+    ],
+)
+def test_main_output_format_columnar(
+    capsysbinary, tmp_path, output_format, source_types, expected_csv_path
+):
+    pytest.importorskip("pyarrow")
+    argv = ["--output-format", output_format, "--source-types", *source_types]
+    assert _run_main(argv + ["--", SUBJECTS_DIR]) == os.EX_OK
+    output_path = tmp_path.joinpath("volumes")
+    output_path.write_bytes(capsysbinary.readouterr().out)
+    volume_frame = _read_columnar(output_path, output_format)
+    for column in ["subfield", "subject", "hemisphere", "source_type"]:
+        assert isinstance(volume_frame[column].dtype, pandas.CategoricalDtype)
+    assert volume_frame["volume_mm^3"].dtype == "float64"
+    if source_types == ["freesurfer-hipposf"]:
+        assert volume_frame["T1_input"].dtype == bool
+    else:
+        assert volume_frame["T1_input"].isnull().sum() == sum(
+            volume_frame["source_type"] == "ashs"
+        )
+    volume_frame = volume_frame.drop(columns=["source_path"])
+    for column in volume_frame:
+        if isinstance(volume_frame[column].dtype, pandas.CategoricalDtype):
+            volume_frame[column] = volume_frame[column].astype("object")
+    expected_frame = pandas.read_csv(expected_csv_path)
+    if "T1_input" in volume_frame and volume_frame["T1_input"].isnull().any():
+        volume_frame["T1_input"] = volume_frame["T1_input"].astype("object")
+        expected_frame["T1_input"] = expected_frame["T1_input"].astype("object")
+    if "correction" in volume_frame:
+        expected_frame["correction"] = expected_frame["correction"].where(
+            expected_frame["correction"].notnull(), None
+        )
+    volume_frame["analysis_id"] = volume_frame["analysis_id"].where(
+        volume_frame["analysis_id"].notnull(), float("nan")
+    )
+    assert_volume_frames_equal(left=expected_frame, right=volume_frame)
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather", "arrow-ipc"])
+def test_main_output_format_columnar_update(tmp_path, output_format):
+    pytest.importorskip("pyarrow")
+    output_path = tmp_path.joinpath("volumes")
+    argv = ["--output-format", output_format, "--update", str(output_path)]
+    argv += ["--source-types", "ashs", "freesurfer-hipposf", "--", SUBJECTS_DIR]
+    assert _run_main(argv) == os.EX_OK
+    expected_frame = _read_columnar(output_path, output_format)
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.freesurfer.HippocampalSubfieldsVolumeFile"
+        ".read_volumes_mm3"
+    ) as read_mock:
+        assert _run_main(argv) == os.EX_OK
+    read_mock.assert_not_called()
+    pandas.testing.assert_frame_equal(
+        expected_frame, _read_columnar(output_path, output_format)
+    )
+
+
+def test_main_output_format_columnar_no_files_found(capsysbinary):
+    pytest.importorskip("pyarrow")
+    argv = ["--output-format", "parquet", "--freesurfer-hipposf-filename-regex"]
+    assert _run_main(argv + [r"^21$", "--", SUBJECTS_DIR]) == os.EX_NOINPUT
+    assert not capsysbinary.readouterr().out
+
+
+def test_main_output_format_pyarrow_missing(capsys):
+    with unittest.mock.patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(SystemExit):
+            _run_main(["--output-format", "feather", "--", SUBJECTS_DIR])
+    _, err = capsys.readouterr()
+    assert "--output-format feather requires the python package pyarrow" in err
+
+
+def _watch_volume_files_interrupted(*args, **kwargs):
+    for volume_files in freesurfer_volume_reader.watch.watch_volume_files(
+        *args, **kwargs
+    ):
+        yield volume_files  # all existing volume files
+        raise KeyboardInterrupt()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_main_watch(capsys, jobs):
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.__main__.watch_volume_files",
+        side_effect=_watch_volume_files_interrupted,
+    ) as watch_mock:
+        argv = ["--watch", "--watch-debounce", "0", "--watch-interval", "0.5"]
+        assert (
+            _run_main(
+                argv
+                + ["--jobs", jobs, "--source-types", "ashs", "freesurfer-hipposf"]
+                + ["--", SUBJECTS_DIR]
+            )
+            == os.EX_OK
+        )
+    assert watch_mock.call_args.kwargs["debounce_seconds"] == 0
+    assert watch_mock.call_args.kwargs["interval_seconds"] == 0.5
+    resulted_frame = pandas.read_csv(io.StringIO(capsys.readouterr().out))
+    expected_frame = pandas.read_csv(
+        os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv")
+    )
+    assert_volume_frames_equal(
+        left=expected_frame,
+        right=resulted_frame.drop(columns=["source_path"]),
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--output-format", "parquet"],
+        ["--update", "volumes.csv"],
+        ["--subjects-dir-layout"],
+        ["--layout", "wide"],
+        ["--shard", "0/2"],
+    ],
+)
+def test_main_watch_invalid(capsys, args):
+    with unittest.mock.patch("importlib.util.find_spec"):
+        with pytest.raises(SystemExit):
+            _run_main(["--watch"] + args + ["--", SUBJECTS_DIR])
+    _, err = capsys.readouterr()
+    assert "--watch can not be combined with" in err
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_main_stats(capfd, output_format):
+    if output_format != "csv":
+        pytest.importorskip("pyarrow")
+    argv = ["--stats", "--output-format", output_format, "--", SUBJECTS_DIR]
+    assert _run_main(argv) == os.EX_OK
+    err_lines = capfd.readouterr().err.split("\n")
+    assert "directories: 7" in err_lines
+    assert "files_matched: 3" in err_lines
+    assert "files_read: 3" in err_lines
+    assert any(l.startswith("write seconds: ") for l in err_lines)
+
+
+def test_main_stats_import_pandas():
+    # not measured by the stage building the first dataframe
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, freesurfer_volume_reader.__main__, freesurfer_volume_reader.stats;"
+            " measure = freesurfer_volume_reader.stats.Stats.measure;"
+            " freesurfer_volume_reader.stats.Stats.measure = lambda self, stage:"
+            " measure(self, stage) if 'pandas' in sys.modules else sys.exit(stage);"
+            " sys.argv[1:] = ['--stats', '--', sys.argv[1]];"
+            " sys.exit(freesurfer_volume_reader.__main__.main())",
+            SUBJECTS_DIR,
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def test_main_stats_no_files_found(capsys):
+    argv = ["--stats", "--freesurfer-hipposf-filename-regex", r"^21$"]
+    assert _run_main(argv + ["--", SUBJECTS_DIR]) == os.EX_NOINPUT
+    _, err = capsys.readouterr()
+    assert "Did not find any volume files" in err
+    assert "files_matched: 0" in err
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_main_layout_wide(capsysbinary, tmp_path, output_format):
+    if output_format != "csv":
+        pytest.importorskip("pyarrow")
+    argv = ["--layout", "wide", "--output-format", output_format, "--source-types"]
+    assert (
+        _run_main(argv + ["ashs", "freesurfer-hipposf", "--", SUBJECTS_DIR]) == os.EX_OK
+    )
+    output_path = tmp_path.joinpath("volumes")
+    output_path.write_bytes(capsysbinary.readouterr().out)
+    wide_frame = _read_volumes(output_path, output_format)
+    long_frame = pandas.read_csv(
+        os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv")
+    )
+    assert len(wide_frame) == 9
+    assert wide_frame["source_path"].is_unique
+    assert set(wide_frame.columns) == {
+        "subject",
+        "hemisphere",
+        "correction",
+        "T1_input",
+        "analysis_id",
+        "source_type",
+        "source_path",
+    } | set(long_frame["subfield"])
+    for _, row in long_frame.iterrows():
+        (volume_mm3,) = wide_frame[
+            (wide_frame["subject"] == row["subject"])
+            & (wide_frame["source_type"] == row["source_type"])
+            & (wide_frame["hemisphere"] == row["hemisphere"])
+            & (
+                wide_frame["correction"].isnull()
+                if pandas.isnull(row["correction"])
+                else (wide_frame["correction"] == row["correction"])
+            )
+            & (
+                wide_frame["analysis_id"].isnull()
+                if pandas.isnull(row["analysis_id"])
+                else (wide_frame["analysis_id"] == row["analysis_id"])
+            )
+        ][row["subfield"]]
+        assert volume_mm3 == row["volume_mm^3"]
+
+
+def test_main_layout_wide_no_files_found(capsys):
+    argv = ["--layout", "wide", "--freesurfer-hipposf-filename-regex", r"^21$"]
+    assert _run_main(argv + ["--", SUBJECTS_DIR]) == os.EX_NOINPUT
+    assert not capsys.readouterr().out
+
+
+def test_main_layout_wide_update(capsys):
+    with pytest.raises(SystemExit):
+        _run_main(["--layout", "wide", "--update", "volumes.csv", "--", SUBJECTS_DIR])
+    _, err = capsys.readouterr()
+    assert "--update can not be combined with --layout wide" in err
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+@pytest.mark.parametrize("layout", ["long", "wide"])
+@pytest.mark.parametrize("shards_number", [1, 2, 3])
+def test_main_shard_merge(capsysbinary, tmp_path, output_format, layout, shards_number):
+    if output_format != "csv":
+        pytest.importorskip("pyarrow")
+    argv = ["--output-format", output_format, "--layout", layout, "--source-types"]
+    argv += ["ashs", "freesurfer-hipposf"]
+    assert _run_main(argv + ["--", SUBJECTS_DIR]) == os.EX_OK
+    expected_path = tmp_path.joinpath("volumes")
+    expected_path.write_bytes(capsysbinary.readouterr().out)
+    shard_paths = []
+    for shard_index in range(shards_number):
+        shard_path = tmp_path.joinpath(f"shard-{shard_index}")
+        # shards without subjects exit with EX_NOINPUT
+        _run_main(argv + ["--shard", f"{shard_index}/{shards_number}", SUBJECTS_DIR])
+        shard_path.write_bytes(capsysbinary.readouterr().out)
+        shard_paths.append(str(shard_path))
+    assert (
+        _run_main(["merge", "--output-format", output_format] + shard_paths) == os.EX_OK
+    )
+    merged_path = tmp_path.joinpath("merged")
+    merged_path.write_bytes(capsysbinary.readouterr().out)
+    expected_frame, merged_frame = (
+        _read_volumes(p, output_format)
+        .sort_values(["source_path", "subfield"] if layout == "long" else "source_path")
+        .reset_index(drop=True)
+        for p in [expected_path, merged_path]
+    )
+    pandas.testing.assert_frame_equal(
+        expected_frame, merged_frame[expected_frame.columns], check_categorical=False
+    )
+
+
+def test_main_merge_csv_columns(capsys, tmp_path):
+    tmp_path.joinpath("shard-0.csv").write_text(
+        "subject,CA1,source_type,source_path\n007,1.5,ashs,/a\n"
+    )
+    tmp_path.joinpath("shard-1.csv").write_text("")
+    tmp_path.joinpath("shard-2.csv").write_text(
+        "subject,CA3,source_type,source_path\nbert,2.5,ashs,/b\n"
+    )
+    shard_paths = [str(tmp_path.joinpath(f"shard-{i}.csv")) for i in range(3)]
+    assert _run_main(["merge"] + shard_paths) == os.EX_OK
+    assert capsys.readouterr().out == (
+        "subject,CA1,CA3,source_type,source_path\n"
+        "007,1.5,,ashs,/a\n"
+        "bert,,2.5,ashs,/b\n"
+    )
+
+
+def test_main_merge_no_rows(capsys, tmp_path):
+    tmp_path.joinpath("shard-0.csv").write_text("")
+    assert _run_main(["merge", str(tmp_path.joinpath("shard-0.csv"))]) == (
+        os.EX_NOINPUT
+    )
+    out, err = capsys.readouterr()
+    assert not out
+    assert "Did not find any rows" in err
+
+
+def test_main_merge_pyarrow_missing(capsys, tmp_path):
+    with unittest.mock.patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(SystemExit):
+            _run_main(["merge", "--output-format", "feather", str(tmp_path)])
+    _, err = capsys.readouterr()
+    assert "--output-format feather requires the python package pyarrow" in err
+
+
+@pytest.mark.parametrize("shard", ["2/2", "3/2", "1", "a/2", "0/0"])
+def test_main_shard_invalid(capsys, shard):
+    with pytest.raises(SystemExit):
+        _run_main(["--shard", shard, "--", SUBJECTS_DIR])
+    _, err = capsys.readouterr()
+    assert "argument --shard: expected K/N with 0 <= K < N, got " in err
+
+
+@pytest.mark.parametrize("jobs", ["1", "3"])
+def test_main_ashs_icv(capsys, jobs):
+    argv = [
+        "--ashs-icv",
+        "--jobs",
+        jobs,
+        "--source-types",
+        "ashs",
+        "freesurfer-hipposf",
+    ]
+    assert _run_main(argv + ["--", SUBJECTS_DIR]) == os.EX_OK
+    volumes_frame = pandas.read_csv(io.StringIO(capsys.readouterr().out))
+    assert list(volumes_frame.columns[-4:]) == [
+        "intercranial_volume_mm^3",
+        "volume_icv_ratio",
+        "source_type",
+        "source_path",
+    ]
+    expected_frame = pandas.read_csv(
+        os.path.join(SUBJECTS_DIR, "all-hippocampal-volumes.csv")
+    )
+    assert len(volumes_frame) == len(expected_frame)
+    ashs_frame = volumes_frame[volumes_frame["source_type"] == "ashs"]
+    assert len(ashs_frame) == (expected_frame["source_type"] == "ashs").sum()
+    assert (
+        ashs_frame["intercranial_volume_mm^3"]
+        == ashs_frame["subject"].map({"alice": 1543200, "bert": 1234560})
+    ).all()
+    pandas.testing.assert_series_equal(
+        ashs_frame["volume_icv_ratio"],
+        ashs_frame["volume_mm^3"] / ashs_frame["intercranial_volume_mm^3"],
+        check_names=False,
+    )
+    assert (
+        volumes_frame.loc[
+            volumes_frame["source_type"] != "ashs",
+            ["intercranial_volume_mm^3", "volume_icv_ratio"],
+        ]
+        .isnull()
+        .all()
+        .all()
+    )
+
+
+def test_main_ashs_icv_missing(capsys, tmp_path):
+    shutil.copytree(os.path.join(SUBJECTS_DIR, "alice"), tmp_path.joinpath("alice"))
+    tmp_path.joinpath("alice", "final", "alice_icv.txt").unlink()
+    argv = ["--ashs-icv", "--source-types", "ashs", "--", str(tmp_path)]
+    assert _run_main(argv) == os.EX_OK
+    volumes_frame = pandas.read_csv(io.StringIO(capsys.readouterr().out))
+    assert len(volumes_frame) > 0
+    assert volumes_frame["intercranial_volume_mm^3"].isnull().all()
+    assert volumes_frame["volume_icv_ratio"].isnull().all()
+
+
+def test_main_ashs_icv_roots(capsys, tmp_path):
+    root_dir_paths = [tmp_path.joinpath(r) for r in ["a", "b"]]
+    for root_dir_path in root_dir_paths:
+        shutil.copytree(
+            os.path.join(SUBJECTS_DIR, "alice"), root_dir_path.joinpath("alice")
+        )
+    root_dir_paths[1].joinpath("alice", "final", "alice_icv.txt").write_text(
+        "alice 2000000\n"
+    )
+    argv = ["--ashs-icv", "--source-types", "ashs", "--"]
+    assert _run_main(argv + [str(p) for p in root_dir_paths]) == os.EX_OK
+    volumes_frame = pandas.read_csv(io.StringIO(capsys.readouterr().out))
+    assert len(volumes_frame) > 0
+    for root_dir_path, expected_icv in zip(root_dir_paths, [1543200, 2000000]):
+        root_frame = volumes_frame[
+            volumes_frame["source_path"].str.startswith(str(root_dir_path) + os.sep)
+        ]
+        assert len(root_frame) == len(volumes_frame) / 2
+        assert (root_frame["intercranial_volume_mm^3"] == expected_icv).all()
+        pandas.testing.assert_series_equal(
+            root_frame["volume_icv_ratio"],
+            root_frame["volume_mm^3"] / expected_icv,
+            check_names=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["--source-types", "ashs", "--update", "volumes.csv"],
+        ["--source-types", "ashs", "--watch"],
+        ["--source-types", "ashs", "--layout", "wide"],
+    ],
+)
+def test_main_ashs_icv_invalid(capsys, args):
+    with pytest.raises(SystemExit):
+        _run_main(["--ashs-icv"] + args + ["--", SUBJECTS_DIR])
+    _, err = capsys.readouterr()
+    assert "--ashs-icv requires --source-types ashs" in err
+
+
+def test_main_jobs_output_order(capsys):
+    outputs = []
+    for jobs in ["1", "4"]:
+        with unittest.mock.patch(
+            "sys.argv",
+            ["", "--jobs", jobs, "--source-types", "ashs", "freesurfer-hipposf"]
+            + ["--", SUBJECTS_DIR],
+        ):
+            assert freesurfer_volume_reader.__main__.main() == 0
+        outputs.append(capsys.readouterr().out)
+    assert outputs[0] == outputs[1]
+
+
+def test_main_jobs_invalid(capsys):
+    with unittest.mock.patch("sys.argv", ["", "--jobs", "0", "--", SUBJECTS_DIR]):
+        with pytest.raises(SystemExit):
+            freesurfer_volume_reader.__main__.main()
+    _, err = capsys.readouterr()
+    assert "--jobs: expected positive number" in err
+
+
 def test_main_no_files_found(capsys):
     with unittest.mock.patch(
         "sys.argv",
@@ -0,0 +1,116 @@
+# pylint: disable=missing-module-docstring
+
+import os
+import unittest.mock
+
+import pytest
+
+from freesurfer_volume_reader import (
+    ashs,
+    find_volume_files,
+    freesurfer,
+    read_volumes_dataframes,
+    stats,
+)
+
+# pylint: disable=wrong-import-order; false positive
+from conftest import SUBJECTS_DIR
+
+
+def test_measure_exclusive():
+    run_stats = stats.Stats()
+    with unittest.mock.patch("time.perf_counter", side_effect=[1, 3, 7, 15]):
+        with run_stats.measure("parse"):
+            with run_stats.measure("read"):
+                pass
+    assert run_stats.stage_seconds == {"parse": 2 + 8, "read": 4}
+
+
+def test_measure_exception():
+    run_stats = stats.Stats()
+    with pytest.raises(ValueError):
+        with run_stats.measure("parse"):
+            raise ValueError()
+    assert run_stats.stage_seconds["parse"] >= 0
+    with unittest.mock.patch("time.perf_counter", side_effect=[1, 2]):
+        with run_stats.measure("read"):
+            pass
+    assert run_stats.stage_seconds["read"] == 1
+
+
+def test_collect_inactive():
+    assert stats.measure("read") is not stats.measure("read")
+    stats.count("directories")
+    with stats.collect() as run_stats:
+        pass
+    assert not run_stats.counters
+    assert not run_stats.stage_seconds
+    assert run_stats.wall_seconds >= 0
+
+
+def test_collect_nested():
+    with stats.collect() as outer_stats:
+        with stats.collect() as inner_stats:
+            stats.count("directories")
+        stats.count("files_read")
+    assert inner_stats.counters == {"directories": 1}
+    assert outer_stats.counters == {"files_read": 1}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_collect_find_read(jobs):
+    with stats.collect() as run_stats:
+        volume_files = list(
+            find_volume_files(
+                SUBJECTS_DIR,
+                [
+                    ashs.HippocampalSubfieldsVolumeFile,
+                    freesurfer.HippocampalSubfieldsVolumeFile,
+                ],
+                jobs=jobs,
+            )
+        )
+        for _ in read_volumes_dataframes(volume_files, jobs=jobs):
+            pass
+    assert run_stats.counters == {
+        "directories": sum(1 for _ in os.walk(SUBJECTS_DIR)),
+        "files_matched": len(volume_files),
+        "files_read": len(volume_files),
+        "bytes_read": sum(os.path.getsize(f.absolute_path) for f in volume_files),
+    }
+    assert set(run_stats.stage_seconds.keys()) == {
+        "walk",
+        "match",
+        "read",
+        "parse",
+        "dataframe",
+    }
+    assert all(s > 0 for s in run_stats.stage_seconds.values())
+
+
+def test_collect_read_volumes_dataframe_batch():
+    volume_files = list(freesurfer.HippocampalSubfieldsVolumeFile.find(SUBJECTS_DIR))
+    with stats.collect() as run_stats:
+        freesurfer.HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch(
+            volume_files
+        )
+        ashs.HippocampalSubfieldsVolumeFile.read_volumes_dataframe_batch([])
+    assert run_stats.counters["files_read"] == len(volume_files)
+    assert set(run_stats.stage_seconds.keys()) == {"read", "parse", "dataframe"}
+
+
+def test_format():
+    run_stats = stats.Stats()
+    run_stats.count("bytes_read", 42)
+    run_stats.stage_seconds["read"] = 0.5
+    lines = run_stats.format().split("\n")
+    assert "read seconds: 0.500000" in lines
+    assert "walk seconds: 0.000000" in lines
+    assert "bytes_read: 42" in lines
+    assert "directories: 0" in lines
+    assert not any(l.startswith("wall") for l in lines)
+    with stats.collect(run_stats):
+        pass
+    assert (
+        run_stats.format().split("\n")[len(stats.STAGES)].startswith("wall seconds: ")
+    )
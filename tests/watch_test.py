@@ -0,0 +1,184 @@
+# pylint: disable=missing-module-docstring
+
+import errno
+import os
+import re
+import shutil
+import threading
+import unittest.mock
+
+import pytest
+
+from freesurfer_volume_reader import ashs, freesurfer
+from freesurfer_volume_reader.watch import watch_volume_files
+
+# pylint: disable=wrong-import-order; false positive
+from conftest import SUBJECTS_DIR
+
+_VOLUMES_PATH = os.path.join(
+    SUBJECTS_DIR, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt"
+)
+
+
+@pytest.fixture(name="subjects_dir_path")
+def _subjects_dir_path_fixture(tmp_path):
+    subjects_dir_path = tmp_path.joinpath("subjects")
+    shutil.copytree(SUBJECTS_DIR, subjects_dir_path)
+    return str(subjects_dir_path)
+
+
+def _watch(subjects_dir_path, use_inotify, **kwargs):
+    return watch_volume_files(
+        [subjects_dir_path],
+        volume_file_classes=[freesurfer.HippocampalSubfieldsVolumeFile],
+        debounce_seconds=0.2,
+        interval_seconds=0.05,
+        use_inotify=use_inotify,
+        **kwargs,
+    )
+
+
+def _paths(volume_files):
+    return sorted(f.absolute_path for f in volume_files)
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch_volume_files(subjects_dir_path, use_inotify):
+    watch = _watch(subjects_dir_path, use_inotify=use_inotify)
+    assert _paths(next(watch)) == _paths(
+        freesurfer.HippocampalSubfieldsVolumeFile.find(subjects_dir_path)
+    )
+    # new subject directory & decoy
+    carl_mri_dir_path = os.path.join(subjects_dir_path, "carl", "mri")
+    os.makedirs(carl_mri_dir_path)
+    shutil.copy(_VOLUMES_PATH, os.path.join(carl_mri_dir_path, "aseg.mgz"))
+    carl_volumes_path = os.path.join(carl_mri_dir_path, "lh.hippoSfVolumes-T1.v10.txt")
+    shutil.copy(_VOLUMES_PATH, carl_volumes_path)
+    (volume_file,) = next(watch)
+    assert volume_file.absolute_path == carl_volumes_path
+    assert volume_file.subject == "carl"
+    # modified
+    bert_volumes_path = os.path.join(
+        subjects_dir_path, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt"
+    )
+    os.utime(bert_volumes_path, ns=(10**9, 10**9))
+    assert _paths(next(watch)) == [bert_volumes_path]
+    watch.close()
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch_volume_files_partially_written(subjects_dir_path, use_inotify):
+    watch = _watch(subjects_dir_path, use_inotify=use_inotify)
+    next(watch)
+    with open(_VOLUMES_PATH, encoding="ascii") as volumes_file:
+        volumes_text = volumes_file.read()
+    volumes_path = os.path.join(
+        subjects_dir_path, "bert", "lh.hippoSfVolumes-T1.v10.txt"
+    )
+    # pylint: disable=consider-using-with; closed by timer
+    stream = open(volumes_path, "w", encoding="ascii")
+    stream.write(volumes_text[:20])
+    stream.flush()
+
+    def _finish():
+        stream.write(volumes_text[20:])
+        stream.close()
+
+    timer = threading.Timer(0.1, _finish)
+    timer.start()
+    (volume_file,) = next(watch)
+    timer.join()
+    assert volume_file.absolute_path == volumes_path
+    assert (
+        volume_file.read_volumes_mm3()
+        == freesurfer.HippocampalSubfieldsVolumeFile(_VOLUMES_PATH).read_volumes_mm3()
+    )
+    watch.close()
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch_volume_files_filename_regexs(subjects_dir_path, use_inotify):
+    watch = watch_volume_files(
+        [
+            os.path.join(subjects_dir_path, "alice"),
+            os.path.join(subjects_dir_path, "bert"),
+        ],
+        volume_file_classes=[
+            freesurfer.HippocampalSubfieldsVolumeFile,
+            ashs.HippocampalSubfieldsVolumeFile,
+        ],
+        filename_regexs={
+            ashs.HippocampalSubfieldsVolumeFile: ashs.HippocampalSubfieldsVolumeFile.FILENAME_REGEX,
+            freesurfer.HippocampalSubfieldsVolumeFile: re.compile(
+                r"^lh\.hippoSfVolumes-T1\.v10\.txt$"
+            ),
+        },
+        debounce_seconds=0,
+        use_inotify=use_inotify,
+    )
+    assert _paths(next(watch)) == _paths(
+        list(ashs.HippocampalSubfieldsVolumeFile.find(subjects_dir_path))
+        + list(
+            freesurfer.HippocampalSubfieldsVolumeFile.find(
+                subjects_dir_path,
+                filename_regex=re.compile(r"^lh\.hippoSfVolumes-T1\.v10\.txt$"),
+            )
+        )
+    )
+    watch.close()
+
+
+def test_watch_volume_files_inotify_fallback(subjects_dir_path):
+    with unittest.mock.patch(
+        "freesurfer_volume_reader.watch._InotifyWatcher",
+        side_effect=OSError(errno.ENOSPC, os.strerror(errno.ENOSPC)),
+    ):
+        watch = _watch(subjects_dir_path, use_inotify=None)
+        assert _paths(next(watch)) == _paths(
+            freesurfer.HippocampalSubfieldsVolumeFile.find(subjects_dir_path)
+        )
+        watch.close()
+        with pytest.raises(OSError, match=r"space"):
+            next(_watch(subjects_dir_path, use_inotify=True))
+
+
+def test_watch_volume_files_removed(subjects_dir_path):
+    watch = _watch(subjects_dir_path, use_inotify=True)
+    next(watch)
+    volumes_path = os.path.join(
+        subjects_dir_path, "bert", "mri", "lh.hippoSfVolumes-T1.v10.txt"
+    )
+    os.remove(volumes_path)
+    shutil.rmtree(os.path.join(subjects_dir_path, "alice"))
+    new_volumes_path = os.path.join(
+        subjects_dir_path, "bert", "mri", "rh.hippoSfVolumes-T1.v10.txt"
+    )
+    shutil.copy(_VOLUMES_PATH, new_volumes_path)
+    assert _paths(next(watch)) == [new_volumes_path]
+    watch.close()
+
+
+@pytest.mark.parametrize(("init_fd", "add_watch_descriptor"), [(-1, 1), (None, -1)])
+def test_watch_volume_files_inotify_error(
+    subjects_dir_path, init_fd, add_watch_descriptor
+):
+    with unittest.mock.patch(
+        "ctypes.get_errno", return_value=errno.ENOSPC
+    ), unittest.mock.patch("ctypes.CDLL") as cdll_mock:
+        cdll_mock.return_value.inotify_init1.return_value = (
+            os.open(subjects_dir_path, os.O_RDONLY) if init_fd is None else init_fd
+        )
+        cdll_mock.return_value.inotify_add_watch.return_value = add_watch_descriptor
+        with pytest.raises(OSError, match=r"space"):
+            next(_watch(subjects_dir_path, use_inotify=True))
+        watch = _watch(subjects_dir_path, use_inotify=None)
+        assert _paths(next(watch)) == _paths(
+            freesurfer.HippocampalSubfieldsVolumeFile.find(subjects_dir_path)
+        )
+        watch.close()
+
+
+def test_watch_volume_files_inotify_unsupported_platform(subjects_dir_path):
+    with unittest.mock.patch("sys.platform", "darwin"):
+        with pytest.raises(OSError, match=r"^inotify is only available on linux$"):
+            next(_watch(subjects_dir_path, use_inotify=True))